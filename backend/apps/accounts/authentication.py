@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from apps.rbac.utils import get_user_roles_epoch, remember_user_roles
+from .models import User
+from .tokens import ROLES_CLAIM, ROLES_EPOCH_CLAIM, USERNAME_CLAIM
+
+
+def _build_claims_user(user_id, username):
+    # Fields missing from the claims stay deferred: reading them loads them lazily and
+    # saving the instance only writes the loaded fields.
+    loaded = {"id": user_id, "username": username, "is_active": True, "is_superuser": False}
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in loaded]
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, [loaded[name] for name in field_names])
+
+
+class RoleClaimsJWTAuthentication(JWTAuthentication):
+    """Authenticate from embedded role claims while their epoch is current, otherwise load the user row."""
+
+    def get_user(self, validated_token):
+        user = self._get_user_from_claims(validated_token)
+        if user is None:
+            return super().get_user(validated_token)
+        return user
+
+    def _get_user_from_claims(self, validated_token):
+        if not settings.RBAC_JWT_ROLE_CLAIMS:
+            return None
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        role_slugs = validated_token.get(ROLES_CLAIM)
+        epoch = validated_token.get(ROLES_EPOCH_CLAIM)
+        if user_id is None or role_slugs is None or not epoch:
+            return None
+        if epoch != get_user_roles_epoch(user_id):
+            return None
+        user = _build_claims_user(user_id, validated_token.get(USERNAME_CLAIM, ""))
+        remember_user_roles(user.pk, role_slugs)
+        return user
@@ -0,0 +1,69 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from apps.accounts.models import User
+from apps.accounts.serializers import LoginSerializer
+
+
+PASSWORD = "Pass1234!"
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Measure login throughput per identifier kind against synthetic users that are rolled back afterwards."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--logins", type=int, default=200, help="Logins per identifier kind")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options["users"], options["logins"])
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _run(self, user_count, login_count):
+        users = [
+            User(
+                username=f"bench_login_{index}",
+                email=f"bench_login_{index}@example.com",
+                phone=f"bench-phone-{index}",
+                national_id=f"bench-nid-{index}",
+                first_name="Bench",
+                last_name="User",
+            )
+            for index in range(user_count)
+        ]
+        users[0].set_password(PASSWORD)
+        for user in users[1:]:
+            user.password = users[0].password
+        User.objects.bulk_create(users, batch_size=1000)
+
+        kinds = {
+            "username": lambda user: user.username,
+            "email": lambda user: user.email,
+            "phone": lambda user: user.phone,
+            "national_id": lambda user: user.national_id,
+            "unknown": lambda user: f"missing-{user.username}",
+        }
+        for kind, identifier_for in kinds.items():
+            query_count = 0
+            started = time.perf_counter()
+            for index in range(login_count):
+                user = users[index % user_count]
+                serializer = LoginSerializer(data={"identifier": identifier_for(user), "password": PASSWORD})
+                with CaptureQueriesContext(connection) as captured:
+                    serializer.is_valid()
+                query_count += len(captured)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{kind:<12} {login_count / elapsed:8.1f} logins/s  "
+                f"{elapsed * 1000 / login_count:7.2f} ms/login  "
+                f"{query_count / login_count:4.2f} queries/login"
+            )
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+# `__icontains` compiles to UPPER("column"::text) LIKE UPPER(...) on Postgres, so the
+# trigram indexes cover that exact expression. Prefix lookups are already served by the
+# `_like` pattern indexes Postgres gets for the unique username and national_id columns.
+TRIGRAM_INDEXES = {
+    "accounts_user_username_trgm": "username",
+    "accounts_user_national_id_trgm": "national_id",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON accounts_user USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+def backfill_primary_role_rank(apps, schema_editor):
+    from apps.cases.policies import refresh_primary_role_ranks
+
+    refresh_primary_role_ranks(user_model=apps.get_model("accounts", "User"), user_role_model=apps.get_model("rbac", "UserRole"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_user_search_trigram_indexes"),
+        ("rbac", "0002_seed_roles"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="primary_role_rank",
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_primary_role_rank, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,13 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 
+# Login identifier fields in the order they take precedence when several users match.
+IDENTIFIER_FIELDS = ("username", "email", "phone", "national_id")
+
+
 class UserManager(BaseUserManager):
     def create_user(self, username, email, phone, national_id, password=None, **extra_fields):
         if not username:
@@ -25,6 +30,27 @@ class UserManager(BaseUserManager):
         user.save(using=self._db)
         return user
 
+    def get_by_identifier(self, identifier):
+        """Resolve a username, email, phone number, or national ID to a user with a single query."""
+
+        identifier = (identifier or "").strip()
+        if not identifier:
+            return None
+        candidates = {field: identifier for field in IDENTIFIER_FIELDS}
+        if "@" in identifier:
+            candidates["email"] = self.normalize_email(identifier)
+        else:
+            del candidates["email"]
+        query = Q()
+        for field, value in candidates.items():
+            query |= Q(**{field: value})
+        matches = list(self.filter(query)[: len(candidates)])
+        for field, value in candidates.items():
+            for user in matches:
+                if getattr(user, field) == value:
+                    return user
+        return None
+
     def create_superuser(self, username, email, phone, national_id, password=None, **extra_fields):
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
@@ -45,6 +71,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
+    # Denormalized from the user's roles by apps.cases.signals; see apps.cases.policies.ROLE_RANK.
+    primary_role_rank = models.PositiveSmallIntegerField(null=True, blank=True, db_index=True, editable=False)
 
     objects = UserManager()
 
@@ -1,8 +1,12 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.conf import settings
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from apps.rbac.models import Role, UserRole
 from apps.rbac.constants import ROLE_BASE_USER
 from .models import User
+from .tokens import add_role_claims
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -64,13 +68,7 @@ class LoginSerializer(serializers.Serializer):
         password = attrs.get("password")
         user = None
         if identifier and password:
-            user = User.objects.filter(username=identifier).first()
-            if not user:
-                user = User.objects.filter(email=identifier).first()
-            if not user:
-                user = User.objects.filter(phone=identifier).first()
-            if not user:
-                user = User.objects.filter(national_id=identifier).first()
+            user = User.objects.get_by_identifier(identifier)
         if not user or not user.check_password(password):
             raise serializers.ValidationError("Invalid credentials")
         if not user.is_active:
@@ -80,7 +78,19 @@ class LoginSerializer(serializers.Serializer):
 
     def get_tokens(self, user):
         refresh = RefreshToken.for_user(user)
-        return {"refresh": str(refresh), "access": str(refresh.access_token)}
+        access = add_role_claims(refresh.access_token, user)
+        return {"refresh": str(refresh), "access": str(access)}
+
+
+class RoleClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if settings.RBAC_JWT_ROLE_CLAIMS:
+            access = AccessToken(data["access"])
+            user = User.objects.filter(id=access[jwt_settings.USER_ID_CLAIM], is_active=True).first()
+            if user:
+                data["access"] = str(add_role_claims(access, user))
+        return data
 
 
 class TokenPairSerializer(serializers.Serializer):
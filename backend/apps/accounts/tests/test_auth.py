@@ -1,13 +1,18 @@
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from apps.accounts.models import User
+from apps.accounts.serializers import LoginSerializer
+from apps.notifications.utils import get_unread_count
 from apps.rbac.models import Role, UserRole
-from apps.rbac.constants import ROLE_BASE_USER, ROLE_SYSTEM_ADMIN
+from apps.rbac.constants import ROLE_BASE_USER, ROLE_DETECTIVE, ROLE_POLICE_OFFICER, ROLE_SYSTEM_ADMIN
 
 
 class AuthTests(APITestCase):
     def setUp(self):
+        cache.clear()
         Role.objects.get_or_create(slug=ROLE_BASE_USER, defaults={"name": "Base User", "is_system": True})
         Role.objects.get_or_create(slug=ROLE_SYSTEM_ADMIN, defaults={"name": "System Admin", "is_system": True})
 
@@ -54,6 +59,25 @@ class AuthTests(APITestCase):
         response = self._login("nid1")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_login_resolves_identifier_with_one_query(self):
+        self._register()
+        for identifier in ["user1", "u1@example.com", "123", "nid1", "missing"]:
+            serializer = LoginSerializer(data={"identifier": identifier, "password": "Pass1234!"})
+            with self.assertNumQueries(1):
+                serializer.is_valid()
+
+    def test_login_identifier_prefers_username_match(self):
+        self._register(username="shared", email="a@example.com", phone="p1", national_id="n1")
+        self._register(username="other", email="b@example.com", phone="shared", national_id="n2")
+        response = self._login("shared")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user"]["username"], "shared")
+
+    def test_login_with_email_normalizes_domain(self):
+        self._register()
+        response = self._login("u1@EXAMPLE.com")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_rbac_forbidden_for_base_user(self):
         self._register()
         user = User.objects.get(username="user1")
@@ -80,6 +104,49 @@ class AuthTests(APITestCase):
         self.assertEqual(res.data[0]["username"], "user1")
         self.assertIn("roles", res.data[0])
 
+    def test_user_list_pages_with_constant_queries(self):
+        admin = User.objects.create_user(
+            username="sysadmin",
+            email="sysadmin@example.com",
+            phone="999",
+            national_id="nid999",
+            password="Pass1234!",
+            first_name="S",
+            last_name="A",
+        )
+        UserRole.objects.get_or_create(user=admin, role=Role.objects.get(slug=ROLE_SYSTEM_ADMIN))
+        detective = Role.objects.get(slug=ROLE_DETECTIVE)
+        for index in range(12):
+            user = User.objects.create_user(
+                username=f"listed{index}",
+                email=f"listed{index}@example.com",
+                phone=f"70{index}",
+                national_id=f"listed-nid-{index}",
+                password="Pass1234!",
+                first_name="L",
+                last_name="U",
+            )
+            UserRole.objects.create(user=user, role=detective)
+        self.client.force_authenticate(user=admin)
+        self.client.get("/api/v1/users/")
+
+        with self.assertNumQueries(1):
+            res = self.client.get(f"/api/v1/users/?role={ROLE_DETECTIVE}&page_size=5")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["username"] for row in res.data["results"]], [f"listed{i}" for i in range(5)])
+        self.assertEqual(res.data["results"][0]["roles"], [ROLE_DETECTIVE])
+
+        usernames = [row["username"] for row in res.data["results"]]
+        next_url = res.data["next"]
+        while next_url:
+            res = self.client.get(next_url)
+            usernames.extend(row["username"] for row in res.data["results"])
+            next_url = res.data["next"]
+        self.assertEqual(usernames, [f"listed{i}" for i in range(12)])
+
+        res = self.client.get("/api/v1/users/?username=sysadmin&page_size=1000")
+        self.assertEqual(res.data["results"][0]["roles"], [ROLE_SYSTEM_ADMIN])
+
     def test_system_roles_are_immutable(self):
         admin = User.objects.create_user(
             username="admin2",
@@ -97,3 +164,40 @@ class AuthTests(APITestCase):
         self.assertEqual(patch_res.status_code, status.HTTP_403_FORBIDDEN)
         delete_res = self.client.delete(f"/api/v1/rbac/roles/{base_role.id}/")
         self.assertEqual(delete_res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def _login_as_officer(self):
+        self._register()
+        user = User.objects.get(username="user1")
+        role, _ = Role.objects.get_or_create(slug=ROLE_POLICE_OFFICER, defaults={"name": "Officer", "is_system": True})
+        UserRole.objects.get_or_create(user=user, role=role)
+        access = self._login("user1").data["tokens"]["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return user
+
+    @override_settings(RBAC_JWT_ROLE_CLAIMS=True)
+    def test_role_claims_authenticate_without_queries(self):
+        user = self._login_as_officer()
+        get_unread_count(user.pk)
+        # The inbox reads its counter, newest id and page, the most-wanted list its
+        # validator aggregate and page; authentication adds none.
+        with self.assertNumQueries(3):
+            res = self.client.get("/api/v1/notifications/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/v1/suspects/most-wanted/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    @override_settings(RBAC_JWT_ROLE_CLAIMS=True)
+    def test_role_removal_revokes_role_claims(self):
+        user = self._login_as_officer()
+        UserRole.objects.filter(user=user, role__slug=ROLE_POLICE_OFFICER).delete()
+        res = self.client.get("/api/v1/suspects/most-wanted/")
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(RBAC_JWT_ROLE_CLAIMS=True)
+    def test_deactivation_revokes_role_claims(self):
+        user = self._login_as_officer()
+        user.is_active = False
+        user.save()
+        res = self.client.get("/api/v1/notifications/")
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,19 @@
+from django.conf import settings
+from apps.rbac.utils import get_user_roles_epoch, get_user_role_slugs
+
+
+ROLES_CLAIM = "roles"
+ROLES_EPOCH_CLAIM = "roles_epoch"
+USERNAME_CLAIM = "username"
+
+
+def add_role_claims(access_token, user):
+    """Embed the user's role slugs in an access token when RBAC_JWT_ROLE_CLAIMS is enabled."""
+
+    if not settings.RBAC_JWT_ROLE_CLAIMS or not user.is_active or user.is_superuser:
+        return access_token
+    # Read the epoch before the roles so a concurrent change leaves the token stale, never wrong.
+    access_token[ROLES_EPOCH_CLAIM] = get_user_roles_epoch(user.pk)
+    access_token[ROLES_CLAIM] = get_user_role_slugs(user)
+    access_token[USERNAME_CLAIM] = user.username
+    return access_token
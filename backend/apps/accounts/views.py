@@ -1,14 +1,24 @@
+from django.db.models import Exists, OuterRef
 from rest_framework import generics, serializers, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema, inline_serializer
 from rest_framework_simplejwt.views import TokenRefreshView
-from .serializers import RegisterSerializer, LoginSerializer, LoginResponseSerializer, UserSerializer, UserWithRolesSerializer
+from .serializers import (
+    RegisterSerializer,
+    LoginSerializer,
+    LoginResponseSerializer,
+    RoleClaimsTokenRefreshSerializer,
+    UserSerializer,
+    UserWithRolesSerializer,
+)
 from .models import User
 from apps.rbac.permissions import RoleRequiredPermission
 from apps.rbac.constants import ROLE_SYSTEM_ADMIN
-from apps.rbac.utils import get_user_role_slugs
+from apps.rbac.models import UserRole
+from apps.rbac.utils import annotate_role_slugs, annotated_role_slugs, get_user_role_slugs
+from police_portal.pagination import PAGINATION_PARAMETERS, paginated_response
 
 
 class RegisterView(generics.CreateAPIView):
@@ -40,6 +50,7 @@ class LoginView(APIView):
 
 class TokenRefreshDocsView(TokenRefreshView):
     permission_classes = [AllowAny]
+    serializer_class = RoleClaimsTokenRefreshSerializer
 
     @extend_schema(
         request=inline_serializer("TokenRefreshRequest", fields={"refresh": serializers.CharField()}),
@@ -77,10 +88,15 @@ class MeView(APIView):
 
 
 class UserListView(APIView):
-    """List users for system administrators with optional filters by username, national ID, and role."""
+    """List users for system administrators with optional filters by username, national ID, and role.
+
+    Send `page_size` or `cursor` to receive cursor pages of `{next, previous, results}`.
+    """
 
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_SYSTEM_ADMIN]
+    pagination_ordering = "id"
+    query_budget = 3
 
     @extend_schema(
         request=None,
@@ -88,11 +104,12 @@ class UserListView(APIView):
             OpenApiParameter(name="username", type=str, required=False, location=OpenApiParameter.QUERY),
             OpenApiParameter(name="national_id", type=str, required=False, location=OpenApiParameter.QUERY),
             OpenApiParameter(name="role", type=str, required=False, location=OpenApiParameter.QUERY),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: UserWithRolesSerializer(many=True)},
     )
     def get(self, request):
-        queryset = User.objects.all().order_by("id")
+        queryset = User.objects.all()
         username = request.query_params.get("username")
         national_id = request.query_params.get("national_id")
         role_slug = request.query_params.get("role")
@@ -101,11 +118,17 @@ class UserListView(APIView):
         if national_id:
             queryset = queryset.filter(national_id__icontains=national_id)
         if role_slug:
-            queryset = queryset.filter(user_roles__role__slug=role_slug)
-        queryset = queryset.distinct()
+            queryset = queryset.filter(
+                Exists(UserRole.objects.filter(user_id=OuterRef("pk"), role__slug=role_slug))
+            )
+        queryset = annotate_role_slugs(queryset).order_by(self.pagination_ordering)
+        return paginated_response(request, self, queryset, self._serialize_users)
+
+    @staticmethod
+    def _serialize_users(users):
         data = []
-        for user in queryset:
+        for user in users:
             row = UserSerializer(user).data
-            row["roles"] = get_user_role_slugs(user)
+            row["roles"] = annotated_role_slugs(user)
             data.append(row)
-        return Response(data, status=status.HTTP_200_OK)
+        return data
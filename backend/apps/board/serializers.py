@@ -10,6 +10,9 @@ class BoardItemSerializer(serializers.ModelSerializer):
 
 
 class BoardConnectionSerializer(serializers.ModelSerializer):
+    from_item = serializers.PrimaryKeyRelatedField(queryset=BoardItem.objects.select_related("board"))
+    to_item = serializers.PrimaryKeyRelatedField(queryset=BoardItem.objects.select_related("board"))
+
     class Meta:
         model = BoardConnection
         fields = ("id", "from_item", "to_item", "created_at")
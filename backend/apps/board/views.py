@@ -1,3 +1,4 @@
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.response import Response
@@ -8,6 +9,7 @@ from apps.rbac.constants import ROLE_DETECTIVE
 from apps.rbac.utils import user_has_role
 from apps.cases.models import Case
 from apps.cases.policies import can_user_access_case
+from police_portal.conditional import collection_fingerprint, conditional_response, make_etag
 from .models import DetectiveBoard, BoardItem, BoardConnection
 from .serializers import DetectiveBoardSerializer, BoardItemSerializer, BoardConnectionSerializer
 
@@ -39,7 +41,13 @@ class BoardDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
         board, _ = DetectiveBoard.objects.get_or_create(case=case, defaults={"created_by": request.user})
-        return Response(DetectiveBoardSerializer(board).data, status=status.HTTP_200_OK)
+        items = collection_fingerprint(BoardItem.objects.filter(board=board), "updated_at", with_evidence=Count("evidence"))
+        connections = collection_fingerprint(BoardConnection.objects.filter(board=board))
+        return conditional_response(
+            request,
+            lambda: Response(DetectiveBoardSerializer(board).data, status=status.HTTP_200_OK),
+            make_etag("board", board.pk, board.updated_at, items, connections),
+        )
 
 
 class BoardItemCreateView(APIView):
@@ -86,7 +94,7 @@ class BoardItemDetailView(APIView):
 
         if not user_has_role(request.user, [ROLE_DETECTIVE]):
             return _detective_only_response()
-        item = get_object_or_404(BoardItem, id=id)
+        item = get_object_or_404(BoardItem.objects.select_related("board__case"), id=id)
         if not can_user_access_case(request.user, item.board.case):
             return Response(
                 {"error": {"code": "forbidden", "message": "Not authorized for this board item", "details": {}}},
@@ -116,7 +124,7 @@ class BoardItemDetailView(APIView):
 
         if not user_has_role(request.user, [ROLE_DETECTIVE]):
             return _detective_only_response()
-        item = get_object_or_404(BoardItem, id=id)
+        item = get_object_or_404(BoardItem.objects.select_related("board__case"), id=id)
         if not can_user_access_case(request.user, item.board.case):
             return Response(
                 {"error": {"code": "forbidden", "message": "Not authorized for this board item", "details": {}}},
@@ -164,7 +172,7 @@ class BoardConnectionDeleteView(APIView):
 
         if not user_has_role(request.user, [ROLE_DETECTIVE]):
             return _detective_only_response()
-        connection = get_object_or_404(BoardConnection, id=id)
+        connection = get_object_or_404(BoardConnection.objects.select_related("board__case"), id=id)
         if not can_user_access_case(request.user, connection.board.case):
             return Response(
                 {"error": {"code": "forbidden", "message": "Not authorized for this board", "details": {}}},
@@ -0,0 +1,216 @@
+from collections import defaultdict
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from apps.rbac.constants import ROLE_SYSTEM_ADMIN
+from apps.rbac.utils import get_user_role_slugs
+from .constants import CaseAccessReason, CaseSourceType, CaseStatus
+from .policies import (
+    NON_CADET_POLICE_VISIBILITY_ROLES,
+    POLICE_VISIBILITY_ROLES,
+    ROLE_PRIORITY,
+    WORKFLOW_VISIBLE_CASE_STATUSES,
+    get_primary_role_rank,
+    policy_case_queryset,
+)
+
+
+SCOPE_POLICE = "police"
+SCOPE_NON_CADET_POLICE = "police_non_cadet"
+REBUILD_BATCH_SIZE = 1000
+
+
+def _superior_scope(creator_rank):
+    return f"superior_of:{creator_rank}"
+
+
+def _models(apps=None):
+    # Data migrations pass their historical app registry.
+    apps = apps or global_apps
+    return (
+        apps.get_model("cases", "Case"),
+        apps.get_model("cases", "CaseAssignment"),
+        apps.get_model("cases", "CaseAccess"),
+    )
+
+
+def case_access_scopes(user):
+    """Role scopes of CaseAccess rows the user can see, mirroring policy_case_queryset."""
+
+    role_slugs = set(get_user_role_slugs(user))
+    scopes = []
+    if role_slugs & POLICE_VISIBILITY_ROLES:
+        scopes.append(SCOPE_POLICE)
+        if role_slugs & NON_CADET_POLICE_VISIBILITY_ROLES:
+            scopes.append(SCOPE_NON_CADET_POLICE)
+    viewer_rank = get_primary_role_rank(user)
+    if viewer_rank is not None:
+        scopes.extend(_superior_scope(rank) for rank in range(viewer_rank + 1, len(ROLE_PRIORITY)))
+    return scopes
+
+
+def accessible_case_queryset(user):
+    """Cases visible to the user, resolved with one semi-join against the CaseAccess index."""
+
+    Case, _, CaseAccess = _models()
+    if not user or not user.is_authenticated:
+        return Case.objects.none()
+    if ROLE_SYSTEM_ADMIN in get_user_role_slugs(user):
+        return Case.objects.all()
+    grants = Q(user=user)
+    scopes = case_access_scopes(user)
+    if scopes:
+        grants |= Q(user__isnull=True, scope__in=scopes)
+    entries = CaseAccess.objects.filter(grants, case_id=OuterRef("pk"))
+    return Case.objects.filter(Exists(entries))
+
+
+def _case_scope(case):
+    if case["status"] in WORKFLOW_VISIBLE_CASE_STATUSES:
+        if case["source_type"] == CaseSourceType.COMPLAINT:
+            return SCOPE_POLICE
+        if case["source_type"] == CaseSourceType.CRIME_SCENE:
+            return SCOPE_NON_CADET_POLICE
+        return None
+    creator_rank = case["created_by__primary_role_rank"]
+    if (
+        case["source_type"] == CaseSourceType.CRIME_SCENE
+        and case["status"] == CaseStatus.PENDING_SUPERIOR_APPROVAL
+        and creator_rank is not None
+    ):
+        return _superior_scope(creator_rank)
+    return None
+
+
+def _expected_entries(case_ids, apps=None):
+    Case, CaseAssignment, _ = _models(apps)
+    expected = {case_id: set() for case_id in case_ids}
+    cases = Case.objects.filter(pk__in=case_ids).values(
+        "id",
+        "status",
+        "source_type",
+        "created_by_id",
+        "complaint__created_by_id",
+        "created_by__primary_role_rank",
+    )
+    for case in cases:
+        entries = expected[case["id"]]
+        if case["created_by_id"]:
+            entries.add((case["created_by_id"], "", CaseAccessReason.CREATOR.value))
+        if case["complaint__created_by_id"]:
+            entries.add((case["complaint__created_by_id"], "", CaseAccessReason.COMPLAINANT.value))
+        scope = _case_scope(case)
+        if scope:
+            entries.add((None, scope, CaseAccessReason.ROLE_SCOPE.value))
+    assignments = CaseAssignment.objects.filter(case_id__in=case_ids).values_list("case_id", "user_id")
+    for case_id, user_id in assignments:
+        expected[case_id].add((user_id, "", CaseAccessReason.ASSIGNMENT.value))
+    return expected
+
+
+def diff_case_access(case_ids, apps=None):
+    """Compare stored CaseAccess rows with the rules and return ``(missing, extra_ids)``."""
+
+    _, _, CaseAccess = _models(apps)
+    case_ids = list(case_ids)
+    expected = _expected_entries(case_ids, apps)
+    stored = defaultdict(dict)
+    extra_ids = []
+    rows = CaseAccess.objects.filter(case_id__in=case_ids).values_list("id", "case_id", "user_id", "scope", "reason")
+    for entry_id, case_id, user_id, scope, reason in rows:
+        key = (user_id, scope, reason)
+        if key in stored[case_id] or key not in expected.get(case_id, ()):
+            extra_ids.append(entry_id)
+        else:
+            stored[case_id][key] = entry_id
+    missing = [
+        (case_id, user_id, scope, reason)
+        for case_id, entries in expected.items()
+        for user_id, scope, reason in entries
+        if (user_id, scope, reason) not in stored[case_id]
+    ]
+    return missing, extra_ids
+
+
+def sync_case_access(case_ids, apps=None):
+    """Bring the CaseAccess rows of the given cases in line with the rules; returns the rows changed."""
+
+    _, _, CaseAccess = _models(apps)
+    case_ids = list(case_ids)
+    if not case_ids:
+        return 0
+    missing, extra_ids = diff_case_access(case_ids, apps)
+    with transaction.atomic():
+        if extra_ids:
+            CaseAccess.objects.filter(pk__in=extra_ids).delete()
+        if missing:
+            CaseAccess.objects.bulk_create(
+                [
+                    CaseAccess(case_id=case_id, user_id=user_id, scope=scope, reason=reason)
+                    for case_id, user_id, scope, reason in missing
+                ],
+                ignore_conflicts=True,
+            )
+    return len(missing) + len(extra_ids)
+
+
+def _case_id_batches(batch_size, apps=None):
+    Case, _, _ = _models(apps)
+    last_id = 0
+    while True:
+        batch = list(Case.objects.filter(pk__gt=last_id).order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def rebuild_case_access(batch_size=REBUILD_BATCH_SIZE, apps=None):
+    return sum(sync_case_access(batch, apps) for batch in _case_id_batches(batch_size, apps))
+
+
+def find_case_access_drift(batch_size=REBUILD_BATCH_SIZE):
+    """Return ids of cases whose stored CaseAccess rows disagree with the rules."""
+
+    _, _, CaseAccess = _models()
+    drifted = []
+    for batch in _case_id_batches(batch_size):
+        missing, extra_ids = diff_case_access(batch)
+        case_ids = {case_id for case_id, *_ in missing}
+        case_ids.update(CaseAccess.objects.filter(pk__in=extra_ids).values_list("case_id", flat=True))
+        drifted.extend(sorted(case_ids))
+    return drifted
+
+
+def find_policy_mismatches(user):
+    """Return ``(only_in_index, only_in_policy)`` case ids for one user."""
+
+    indexed = set(accessible_case_queryset(user).values_list("pk", flat=True))
+    expected = set(policy_case_queryset(user).values_list("pk", flat=True))
+    return sorted(indexed - expected), sorted(expected - indexed)
+
+
+def grant_assignment_access(case_id, user_id):
+    _, _, CaseAccess = _models()
+    CaseAccess.objects.bulk_create(
+        [CaseAccess(case_id=case_id, user_id=user_id, reason=CaseAccessReason.ASSIGNMENT)],
+        ignore_conflicts=True,
+    )
+
+
+def revoke_assignment_access(case_id, user_id):
+    # A user may hold several assignments on one case; keep access until the last one goes.
+    _, CaseAssignment, CaseAccess = _models()
+    if not CaseAssignment.objects.filter(case_id=case_id, user_id=user_id).exists():
+        CaseAccess.objects.filter(case_id=case_id, user_id=user_id, reason=CaseAccessReason.ASSIGNMENT).delete()
+
+
+def pending_crime_scene_case_ids(creator_ids):
+    Case, _, _ = _models()
+    return list(
+        Case.objects.filter(
+            created_by_id__in=creator_ids,
+            source_type=CaseSourceType.CRIME_SCENE,
+            status=CaseStatus.PENDING_SUPERIOR_APPROVAL,
+        ).values_list("pk", flat=True)
+    )
@@ -48,3 +48,10 @@ class CaseAssignmentRole(models.TextChoices):
     DETECTIVE = "detective", "Detective"
     OFFICER = "officer", "Officer"
     SERGEANT = "sergeant", "Sergeant"
+
+
+class CaseAccessReason(models.TextChoices):
+    CREATOR = "creator", "Creator"
+    COMPLAINANT = "complainant", "Complainant"
+    ASSIGNMENT = "assignment", "Assignment"
+    ROLE_SCOPE = "role_scope", "Role Scope"
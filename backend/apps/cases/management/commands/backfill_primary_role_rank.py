@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.cases.policies import refresh_primary_role_ranks
+
+
+class Command(BaseCommand):
+    help = "Recompute every user's denormalized primary_role_rank from their current roles."
+
+    def handle(self, *args, **options):
+        updated = refresh_primary_role_ranks()
+        self.stdout.write(f"Updated primary_role_rank for {updated} users.")
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.accounts.models import User
+from apps.cases.access import find_case_access_drift, find_policy_mismatches, sync_case_access
+
+
+class Command(BaseCommand):
+    help = (
+        "Check the CaseAccess index against the case visibility rules: stored rows per case, "
+        "and optionally each user's visible cases against policy_case_queryset."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="Compare visible cases for this user id")
+        parser.add_argument("--all-users", action="store_true", help="Compare visible cases for every active user")
+        parser.add_argument("--fix", action="store_true", help="Resync drifted cases")
+
+    def handle(self, *args, **options):
+        drifted = find_case_access_drift()
+        if drifted:
+            self.stdout.write(f"{len(drifted)} cases have stale access rows: {drifted[:20]}")
+            if options["fix"]:
+                sync_case_access(drifted)
+                self.stdout.write("Resynced drifted cases.")
+
+        users = User.objects.none()
+        if options["all_users"]:
+            users = User.objects.filter(is_active=True).order_by("id")
+        elif options["user_ids"]:
+            users = User.objects.filter(pk__in=options["user_ids"]).order_by("id")
+        mismatched_users = 0
+        for user in users.iterator():
+            only_in_index, only_in_policy = find_policy_mismatches(user)
+            if only_in_index or only_in_policy:
+                mismatched_users += 1
+                self.stdout.write(
+                    f"user {user.pk}: index-only cases {only_in_index[:20]}, policy-only cases {only_in_policy[:20]}"
+                )
+
+        if mismatched_users or (drifted and not options["fix"]):
+            raise CommandError(
+                f"Case access index is inconsistent: {len(drifted)} drifted cases, {mismatched_users} mismatched users."
+            )
+        self.stdout.write("Case access index is consistent.")
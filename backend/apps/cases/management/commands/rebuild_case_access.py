@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from apps.cases.access import REBUILD_BATCH_SIZE, rebuild_case_access
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized CaseAccess index for every case."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        changed = rebuild_case_access(batch_size=options["batch_size"])
+        self.stdout.write(f"Rebuilt case access index: {changed} rows changed.")
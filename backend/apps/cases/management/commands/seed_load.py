@@ -0,0 +1,547 @@
+import random
+import time
+from collections import Counter
+from datetime import timedelta
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from apps.accounts.models import User
+from apps.board.models import BoardConnection, BoardItem, DetectiveBoard
+from apps.cases.access import rebuild_case_access
+from apps.cases.constants import (
+    CaseAssignmentRole,
+    CaseSourceType,
+    CaseStatus,
+    ComplaintStatus,
+    CrimeLevel,
+    CrimeSceneStatus,
+)
+from apps.cases.models import (
+    Case,
+    CaseAssignment,
+    CaseComplainant,
+    Complaint,
+    CrimeSceneReport,
+    CrimeSceneWitness,
+)
+from apps.cases.policies import refresh_primary_role_ranks
+from apps.evidence.models import (
+    Evidence,
+    EvidenceMedia,
+    EvidenceType,
+    IdentityDocumentEvidence,
+    MedicalEvidence,
+    MedicalEvidenceImage,
+    VehicleEvidence,
+    WitnessStatementEvidence,
+)
+from apps.interrogations.models import Interrogation
+from apps.notifications.models import Notification
+from apps.notifications.utils import reconcile_unread_counts
+from apps.rbac.constants import (
+    ROLE_BASE_USER,
+    ROLE_CADET,
+    ROLE_CAPTAIN,
+    ROLE_CORONER,
+    ROLE_DETECTIVE,
+    ROLE_JUDGE,
+    ROLE_PATROL_OFFICER,
+    ROLE_POLICE_CHIEF,
+    ROLE_POLICE_OFFICER,
+    ROLE_SERGEANT,
+    ROLE_SYSTEM_ADMIN,
+    SYSTEM_ROLE_SLUGS,
+)
+from apps.rbac.models import Role, UserRole
+from apps.rewards.models import Tip
+from apps.stats.utils import rebuild_stats_counters
+from apps.suspects.models import Person, SuspectCandidate, WantedRecord
+from apps.suspects.utils import rebuild_most_wanted
+
+
+PASSWORD = "Pass1234!"
+DEFAULT_CHUNK_SIZE = 1000
+MAX_PREFIX_LENGTH = 8
+
+# Share of the seeded users holding each police role; everybody else is a base user.
+STAFF_ROLE_SHARES = [
+    (ROLE_CADET, 0.02),
+    (ROLE_PATROL_OFFICER, 0.02),
+    (ROLE_POLICE_OFFICER, 0.03),
+    (ROLE_DETECTIVE, 0.02),
+    (ROLE_SERGEANT, 0.005),
+    (ROLE_CAPTAIN, 0.002),
+    (ROLE_CORONER, 0.002),
+    (ROLE_JUDGE, 0.002),
+]
+SINGLETON_ROLES = [ROLE_POLICE_CHIEF, ROLE_SYSTEM_ADMIN]
+CASE_CREATOR_ROLES = [ROLE_PATROL_OFFICER, ROLE_POLICE_OFFICER, ROLE_DETECTIVE, ROLE_SERGEANT, ROLE_CAPTAIN]
+
+CASE_STATUS_WEIGHTS = {
+    CaseStatus.ACTIVE: 50,
+    CaseStatus.PENDING_SUPERIOR_APPROVAL: 10,
+    CaseStatus.CLOSED_SOLVED: 20,
+    CaseStatus.CLOSED_UNSOLVED: 15,
+    CaseStatus.VOIDED: 5,
+}
+QUEUED_COMPLAINT_STATUSES = [
+    ComplaintStatus.PENDING_CADET_REVIEW,
+    ComplaintStatus.RETURNED_TO_CADET,
+    ComplaintStatus.PENDING_OFFICER_REVIEW,
+    ComplaintStatus.RETURNED_TO_COMPLAINANT,
+    ComplaintStatus.VOIDED,
+]
+EVIDENCE_TYPES = list(EvidenceType.values)
+TIP_STATUSES = ["pending_officer", "pending_detective", "rejected", "accepted"]
+INTERROGATION_STATUSES = ["pending_detective", "pending_sergeant", "pending_captain", "approved", "rejected"]
+# Backdated timestamps are spread over this many buckets so each chunk costs a few UPDATEs.
+BACKDATE_BUCKETS = 12
+
+
+class LoadSeeder:
+    def __init__(self, prefix, chunk_size, seed):
+        self.prefix = prefix
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)
+        self.now = timezone.now()
+        self.counts = Counter()
+        self.user_ids = {}
+        self.person_ids = []
+
+    def _chunks(self, total):
+        for start in range(0, total, self.chunk_size):
+            yield start, min(self.chunk_size, total - start)
+
+    def _create(self, model, objects):
+        created = model.objects.bulk_create(objects, batch_size=self.chunk_size)
+        self.counts[model.__name__] += len(created)
+        return created
+
+    def _pick(self, role):
+        return self.rng.choice(self.user_ids[role])
+
+    def _backdate(self, model, field, ids, max_days):
+        buckets = {}
+        for pk in ids:
+            buckets.setdefault(self.rng.randrange(BACKDATE_BUCKETS), []).append(pk)
+        for bucket, pks in buckets.items():
+            days = max_days * bucket // BACKDATE_BUCKETS + self.rng.randrange(max(max_days // BACKDATE_BUCKETS, 1))
+            model.objects.filter(pk__in=pks).update(**{field: self.now - timedelta(days=days)})
+
+    def _role_plan(self, total_users):
+        plan = [(role, 1) for role in SINGLETON_ROLES]
+        plan.extend((role, max(1, round(total_users * share))) for role, share in STAFF_ROLE_SHARES)
+        staff = sum(count for _, count in plan)
+        plan.append((ROLE_BASE_USER, max(total_users - staff, 1)))
+        return plan
+
+    def seed_users(self, total_users):
+        roles = {}
+        for slug in SYSTEM_ROLE_SLUGS:
+            roles[slug], _ = Role.objects.get_or_create(slug=slug, defaults={"name": slug, "is_system": True})
+        password = make_password(PASSWORD)
+        index = 0
+        for role_slug, count in self._role_plan(total_users):
+            ids = self.user_ids.setdefault(role_slug, [])
+            for start, size in self._chunks(count):
+                users = []
+                for number in range(start, start + size):
+                    users.append(
+                        User(
+                            username=f"{self.prefix}_{role_slug}_{number}",
+                            email=f"{self.prefix}.{index}@load.example.com",
+                            phone=f"{self.prefix}-p{index}",
+                            national_id=f"{self.prefix}-n{index}",
+                            first_name="Load",
+                            last_name=f"User {index}",
+                            password=password,
+                        )
+                    )
+                    index += 1
+                with transaction.atomic():
+                    users = self._create(User, users)
+                    self._create(UserRole, [UserRole(user=user, role=roles[role_slug]) for user in users])
+                ids.extend(user.pk for user in users)
+
+    def seed_cases(self, total_cases):
+        statuses = list(CASE_STATUS_WEIGHTS)
+        weights = list(CASE_STATUS_WEIGHTS.values())
+        for _, size in self._chunks(total_cases):
+            with transaction.atomic():
+                self._seed_case_chunk(size, statuses, weights)
+        for _, size in self._chunks(max(total_cases // 4, 1)):
+            with transaction.atomic():
+                self._seed_queued_complaints(size)
+
+    def _seed_queued_complaints(self, size):
+        complaints = []
+        for _ in range(size):
+            status = self.rng.choice(QUEUED_COMPLAINT_STATUSES)
+            cadet = None if status == ComplaintStatus.PENDING_CADET_REVIEW else self._pick(ROLE_CADET)
+            officer = self._pick(ROLE_POLICE_OFFICER) if status == ComplaintStatus.PENDING_OFFICER_REVIEW else None
+            complaints.append(
+                Complaint(
+                    title="Reported incident",
+                    description="Complaint awaiting review",
+                    crime_level=self.rng.choice(CrimeLevel.values),
+                    location=f"District {self.rng.randint(1, 40)}",
+                    status=status,
+                    strike_count=self.rng.randint(0, 2),
+                    created_by_id=self._pick(ROLE_BASE_USER),
+                    assigned_cadet_id=cadet,
+                    assigned_officer_id=officer,
+                )
+            )
+        complaints = self._create(Complaint, complaints)
+        self._create(
+            CaseComplainant,
+            [
+                CaseComplainant(
+                    complaint=complaint,
+                    full_name=f"Complainant {complaint.pk}",
+                    phone=f"c{complaint.pk}",
+                    national_id=f"cn{complaint.pk}",
+                )
+                for complaint in complaints
+            ],
+        )
+        self._backdate(Complaint, "created_at", [complaint.pk for complaint in complaints], 30)
+
+    def _seed_case_chunk(self, size, statuses, weights):
+        rng = self.rng
+        from_complaint = [rng.random() < 0.6 for _ in range(size)]
+        complaints = self._create(
+            Complaint,
+            [
+                Complaint(
+                    title="Reported incident",
+                    description="Complaint approved into a case",
+                    crime_level=rng.choice(CrimeLevel.values),
+                    location=f"District {rng.randint(1, 40)}",
+                    status=ComplaintStatus.APPROVED,
+                    created_by_id=self._pick(ROLE_BASE_USER),
+                    assigned_cadet_id=self._pick(ROLE_CADET),
+                    assigned_officer_id=self._pick(ROLE_POLICE_OFFICER),
+                )
+                for flag in from_complaint
+                if flag
+            ],
+        )
+        complaint_iter = iter(complaints)
+        cases = []
+        for flag in from_complaint:
+            complaint = next(complaint_iter) if flag else None
+            cases.append(
+                Case(
+                    title=f"Case in district {rng.randint(1, 40)}",
+                    description="Seeded investigation",
+                    crime_level=complaint.crime_level if complaint else rng.choice(CrimeLevel.values),
+                    location=complaint.location if complaint else f"District {rng.randint(1, 40)}",
+                    status=rng.choices(statuses, weights)[0],
+                    source_type=CaseSourceType.COMPLAINT if complaint else CaseSourceType.CRIME_SCENE,
+                    created_by_id=complaint.assigned_officer_id if complaint else self._pick(rng.choice(CASE_CREATOR_ROLES)),
+                    complaint=complaint,
+                )
+            )
+        cases = self._create(Case, cases)
+        self._create(
+            CaseComplainant,
+            [
+                CaseComplainant(
+                    complaint_id=case.complaint_id,
+                    case=case,
+                    full_name=f"Complainant {case.pk}-{number}",
+                    phone=f"c{case.pk}-{number}",
+                    national_id=f"cn{case.pk}-{number}",
+                    is_verified=True,
+                    verification_status=CaseComplainant.VerificationStatus.APPROVED,
+                )
+                for case in cases
+                if case.complaint_id
+                for number in range(rng.randint(1, 3))
+            ],
+        )
+        self._seed_crime_scenes([case for case in cases if case.source_type == CaseSourceType.CRIME_SCENE])
+        detectives = self._seed_assignments(cases)
+        evidence_by_case = self._seed_evidence(cases)
+        self._seed_boards(cases, evidence_by_case, detectives)
+        self._seed_suspects(cases, detectives)
+        self._seed_tips(cases)
+        complainants = {complaint.pk: complaint.created_by_id for complaint in complaints}
+        self._seed_notifications(cases, detectives, complainants)
+        self._backdate(Case, "created_at", [case.pk for case in cases], 365)
+        self._backdate(Complaint, "created_at", [complaint.pk for complaint in complaints], 365)
+
+    def _seed_crime_scenes(self, cases):
+        reports = self._create(
+            CrimeSceneReport,
+            [
+                CrimeSceneReport(
+                    case=case,
+                    reported_by_id=case.created_by_id,
+                    scene_datetime=self.now - timedelta(days=self.rng.randint(1, 365)),
+                    status=(
+                        CrimeSceneStatus.PENDING_APPROVAL
+                        if case.status == CaseStatus.PENDING_SUPERIOR_APPROVAL
+                        else CrimeSceneStatus.APPROVED
+                    ),
+                )
+                for case in cases
+            ],
+        )
+        self._create(
+            CrimeSceneWitness,
+            [
+                CrimeSceneWitness(
+                    report=report,
+                    full_name=f"Witness {report.pk}-{number}",
+                    phone=f"w{report.pk}-{number}",
+                    national_id=f"wn{report.pk}-{number}",
+                )
+                for report in reports
+                for number in range(self.rng.randint(0, 2))
+            ],
+        )
+
+    def _seed_assignments(self, cases):
+        detectives = {}
+        assignments = []
+        for case in cases:
+            if case.status == CaseStatus.PENDING_SUPERIOR_APPROVAL:
+                continue
+            detectives[case.pk] = self._pick(ROLE_DETECTIVE)
+            assignments.append(
+                CaseAssignment(case=case, user_id=detectives[case.pk], role_in_case=CaseAssignmentRole.DETECTIVE)
+            )
+            if self.rng.random() < 0.5:
+                assignments.append(
+                    CaseAssignment(case=case, user_id=self._pick(ROLE_SERGEANT), role_in_case=CaseAssignmentRole.SERGEANT)
+                )
+        self._create(CaseAssignment, assignments)
+        return detectives
+
+    def _seed_evidence(self, cases):
+        evidence = []
+        for case in cases:
+            for _ in range(self.rng.randint(1, 5)):
+                evidence.append(
+                    Evidence(
+                        case=case,
+                        title="Collected evidence",
+                        description="Seeded evidence",
+                        evidence_type=EVIDENCE_TYPES[len(evidence) % len(EVIDENCE_TYPES)],
+                        created_by_id=case.created_by_id,
+                    )
+                )
+        evidence = self._create(Evidence, evidence)
+        by_type = {}
+        by_case = {}
+        for item in evidence:
+            by_type.setdefault(item.evidence_type, []).append(item)
+            by_case.setdefault(item.case_id, []).append(item)
+        statements = self._create(
+            WitnessStatementEvidence,
+            [
+                WitnessStatementEvidence(evidence=item, transcription="Witness account")
+                for item in by_type.get(EvidenceType.WITNESS_STATEMENT, [])
+            ],
+        )
+        self._create(
+            EvidenceMedia,
+            [
+                EvidenceMedia(witness_statement=statement, file=f"evidence_media/{statement.pk}.mp3", media_type="audio")
+                for statement in statements
+            ],
+        )
+        medical = self._create(
+            MedicalEvidence,
+            [
+                MedicalEvidence(evidence=item, status=self.rng.choice(["pending", "completed"]))
+                for item in by_type.get(EvidenceType.MEDICAL, [])
+            ],
+        )
+        self._create(
+            MedicalEvidenceImage,
+            [MedicalEvidenceImage(medical_evidence=record, image=f"medical_evidence/{record.pk}.png") for record in medical],
+        )
+        self._create(
+            VehicleEvidence,
+            [
+                VehicleEvidence(
+                    evidence=item,
+                    model="Sedan",
+                    color=self.rng.choice(["Black", "Red", "White"]),
+                    license_plate=f"LP-{item.pk}" if item.pk % 2 else "",
+                    serial_number="" if item.pk % 2 else f"SN-{item.pk}",
+                )
+                for item in by_type.get(EvidenceType.VEHICLE, [])
+            ],
+        )
+        self._create(
+            IdentityDocumentEvidence,
+            [
+                IdentityDocumentEvidence(evidence=item, owner_full_name=f"Owner {item.pk}", data={"document": "id-card"})
+                for item in by_type.get(EvidenceType.IDENTITY_DOCUMENT, [])
+            ],
+        )
+        return by_case
+
+    def _seed_boards(self, cases, evidence_by_case, detectives):
+        boarded = [case for case in cases if case.pk in detectives and self.rng.random() < 0.3]
+        boards = self._create(DetectiveBoard, [DetectiveBoard(case=case, created_by_id=detectives[case.pk]) for case in boarded])
+        items = []
+        for board in boards:
+            for evidence in evidence_by_case.get(board.case_id, [])[:3]:
+                items.append(BoardItem(board=board, item_type="EVIDENCE_REF", evidence=evidence, created_by_id=board.created_by_id))
+            for number in range(self.rng.randint(1, 3)):
+                items.append(
+                    BoardItem(
+                        board=board,
+                        item_type="NOTE",
+                        title=f"Lead {number}",
+                        text="Follow up",
+                        x=self.rng.uniform(0, 800),
+                        y=self.rng.uniform(0, 600),
+                        created_by_id=board.created_by_id,
+                    )
+                )
+        items = self._create(BoardItem, items)
+        connections = []
+        for previous, item in zip(items, items[1:]):
+            if previous.board_id == item.board_id:
+                connections.append(
+                    BoardConnection(board_id=item.board_id, from_item=previous, to_item=item, created_by_id=item.created_by_id)
+                )
+        self._create(BoardConnection, connections)
+
+    def _seed_suspects(self, cases, detectives):
+        rng = self.rng
+        slots = []
+        new_persons = []
+        for case in cases:
+            if case.pk not in detectives:
+                continue
+            for _ in range(rng.randint(0, 2)):
+                # Some suspects recur across cases so the most-wanted ranking has to merge records.
+                if self.person_ids and rng.random() < 0.2:
+                    slots.append((case, rng.choice(self.person_ids)))
+                else:
+                    new_persons.append(Person(full_name=f"Suspect {len(self.person_ids) + len(new_persons)}"))
+                    slots.append((case, None))
+        persons = iter(self._create(Person, new_persons))
+        slots = [(case, person_id or next(persons).pk) for case, person_id in slots]
+        self.person_ids.extend(person_id for _, person_id in slots)
+
+        candidates = []
+        wanted = []
+        interrogations = []
+        for case, person_id in slots:
+            status = rng.choice(["pending", "approved", "approved", "rejected"])
+            candidates.append(
+                SuspectCandidate(
+                    case=case,
+                    person_id=person_id,
+                    proposed_by_detective_id=detectives[case.pk],
+                    rationale="Seen near the scene",
+                    status=status,
+                    decided_at=None if status == "pending" else self.now,
+                )
+            )
+            if status != "approved":
+                continue
+            wanted.append(
+                WantedRecord(
+                    person_id=person_id,
+                    case=case,
+                    status="wanted" if case.status == CaseStatus.ACTIVE else rng.choice(["arrested", "cleared"]),
+                )
+            )
+            interrogations.append(
+                Interrogation(
+                    case=case,
+                    suspect_id=person_id,
+                    detective_score=rng.randint(1, 10),
+                    sergeant_score=rng.randint(1, 10),
+                    status=rng.choice(INTERROGATION_STATUSES),
+                )
+            )
+        self._create(SuspectCandidate, candidates)
+        wanted = self._create(WantedRecord, wanted)
+        self._create(Interrogation, interrogations)
+        self._backdate(WantedRecord, "started_at", [record.pk for record in wanted], 180)
+
+    def _seed_tips(self, cases):
+        tips = self._create(
+            Tip,
+            [
+                Tip(
+                    submitted_by_id=self._pick(ROLE_BASE_USER),
+                    case=case,
+                    content="I saw something",
+                    status=self.rng.choice(TIP_STATUSES),
+                )
+                for case in cases
+                if self.rng.random() < 0.25
+            ],
+        )
+        self._backdate(Tip, "created_at", [tip.pk for tip in tips], 90)
+
+    def _seed_notifications(self, cases, detectives, complainants):
+        notifications = []
+        for case in cases:
+            if case.pk in detectives:
+                notifications.append(
+                    Notification(user_id=detectives[case.pk], case=case, type="case_assigned", payload={"case_id": case.pk})
+                )
+            if case.source_type == CaseSourceType.CRIME_SCENE:
+                notifications.append(
+                    Notification(user_id=case.created_by_id, case=case, type="crime_scene_reported", payload={"case_id": case.pk})
+                )
+            if case.complaint_id:
+                notifications.append(
+                    Notification(
+                        user_id=complainants[case.complaint_id], case=case, type="case_created", payload={"case_id": case.pk}
+                    )
+                )
+        notifications = self._create(Notification, notifications)
+        self._backdate(Notification, "created_at", [notification.pk for notification in notifications], 60)
+
+    def rebuild_derived_state(self):
+        # bulk_create skips the signals that maintain these.
+        seeded_users = [user_id for ids in self.user_ids.values() for user_id in ids]
+        for start in range(0, len(seeded_users), self.chunk_size):
+            refresh_primary_role_ranks(user_ids=seeded_users[start:start + self.chunk_size])
+            reconcile_unread_counts(seeded_users[start:start + self.chunk_size])
+        rebuild_case_access(batch_size=self.chunk_size)
+        rebuild_most_wanted(batch_size=self.chunk_size)
+        rebuild_stats_counters()
+
+
+class Command(BaseCommand):
+    help = "Bulk-generate linked synthetic data (users, complaints, cases and everything under them) for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--cases", type=int, default=2000)
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument("--prefix", default="load", help="Username prefix; users log in as <prefix>_<role-slug>_<n>")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed, for reproducible datasets")
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if not prefix or len(prefix) > MAX_PREFIX_LENGTH:
+            raise CommandError(f"--prefix must be 1-{MAX_PREFIX_LENGTH} characters")
+        if User.objects.filter(username__startswith=f"{prefix}_").exists():
+            raise CommandError(f"Users with prefix '{prefix}' already exist; pass another --prefix")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+        seeder = LoadSeeder(prefix, options["chunk_size"], options["seed"])
+        started = time.perf_counter()
+        seeder.seed_users(options["users"])
+        seeder.seed_cases(options["cases"])
+        seeder.rebuild_derived_state()
+        elapsed = time.perf_counter() - started
+        for model_name, count in sorted(seeder.counts.items()):
+            self.stdout.write(f"{model_name:<28} {count:>10}")
+        self.stdout.write(f"Seeded in {elapsed:.1f}s; log in as {prefix}_<role-slug>_<n> with password {PASSWORD}.")
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_case_access(apps, schema_editor):
+    from apps.cases.access import rebuild_case_access
+
+    rebuild_case_access(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0003_user_primary_role_rank'),
+        ('cases', '0003_complaint_assigned_cadet_complaint_assigned_officer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(blank=True, max_length=50)),
+                ('reason', models.CharField(choices=[('creator', 'Creator'), ('complainant', 'Complainant'), ('assignment', 'Assignment'), ('role_scope', 'Role Scope')], max_length=20)),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='access_entries', to='cases.case')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='case_access_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'case'], name='cases_access_user_case_idx'), models.Index(fields=['scope', 'case'], name='cases_access_scope_case_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='caseaccess',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('case', 'user', 'reason'), name='cases_access_unique_user_reason'),
+        ),
+        migrations.AddConstraint(
+            model_name='caseaccess',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', True)), fields=('case', 'scope'), name='cases_access_unique_scope'),
+        ),
+        migrations.RunPython(build_case_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0004_caseaccess'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['source_type', 'status'], name='cases_case_source_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'assigned_cadet', 'created_at'], name='cases_cmpl_status_cadet_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'assigned_officer'], name='cases_cmpl_status_officer_idx'),
+        ),
+    ]
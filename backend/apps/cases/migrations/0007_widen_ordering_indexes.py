@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0006_complainant_crime_scene_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='complaint',
+            name='cases_cmpl_status_cadet_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='complaint',
+            name='cases_cmpl_status_officer_idx',
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'assigned_cadet', 'created_at', 'id'], name='cases_cmpl_status_cadet_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'assigned_officer', 'created_at', 'id'], name='cases_cmpl_status_officer_idx'),
+        ),
+    ]
@@ -9,6 +9,7 @@ from .constants import (
     CrimeSceneStatus,
     CaseSourceType,
     CaseAssignmentRole,
+    CaseAccessReason,
 )
 
 
@@ -39,6 +40,13 @@ class Complaint(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Cadet and officer review queues in ComplaintQueueView.
+            models.Index(fields=["status", "assigned_cadet", "created_at", "id"], name="cases_cmpl_status_cadet_idx"),
+            models.Index(fields=["status", "assigned_officer", "created_at", "id"], name="cases_cmpl_status_officer_idx"),
+        ]
+
     def __str__(self):
         return f"Complaint {self.id}"
 
@@ -57,6 +65,11 @@ class Case(models.Model):
 
     complaint = models.OneToOneField("Complaint", on_delete=models.SET_NULL, null=True, blank=True, related_name="case")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["source_type", "status"], name="cases_case_source_status_idx"),
+        ]
+
     def __str__(self):
         return f"Case {self.id}"
 
@@ -79,6 +92,7 @@ class CaseComplainant(models.Model):
         default=VerificationStatus.PENDING,
     )
     review_message = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.full_name
@@ -100,6 +114,7 @@ class CrimeSceneReport(models.Model):
     required_approver_role = models.ForeignKey(Role, on_delete=models.SET_NULL, null=True, related_name="required_approvals")
     approved_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="crime_scene_approvals")
     approved_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
 
 class CrimeSceneWitness(models.Model):
@@ -119,3 +134,38 @@ class CaseAssignment(models.Model):
         unique_together = ("case", "user", "role_in_case")
 
 
+class CaseAccess(models.Model):
+    """Materialized case visibility, maintained by apps.cases.access.
+
+    Rows either grant one user access for a personal reason or grant a role scope
+    (``user`` is null) that viewers match through apps.cases.access.case_access_scopes.
+    """
+
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="access_entries")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="case_access_entries",
+    )
+    scope = models.CharField(max_length=50, blank=True)
+    reason = models.CharField(max_length=20, choices=CaseAccessReason.choices)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "case"], name="cases_access_user_case_idx"),
+            models.Index(fields=["scope", "case"], name="cases_access_scope_case_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["case", "user", "reason"],
+                condition=models.Q(user__isnull=False),
+                name="cases_access_unique_user_reason",
+            ),
+            models.UniqueConstraint(
+                fields=["case", "scope"],
+                condition=models.Q(user__isnull=True),
+                name="cases_access_unique_scope",
+            ),
+        ]
@@ -1,5 +1,8 @@
+from django.db import models
+from django.db.models import Exists, OuterRef, Q, Subquery, Value, When
 from apps.rbac.utils import get_user_role_slugs
 from apps.rbac.constants import (
+    ROLE_CADET,
     ROLE_POLICE_CHIEF,
     ROLE_CAPTAIN,
     ROLE_SERGEANT,
@@ -9,6 +12,7 @@ from apps.rbac.constants import (
     ROLE_CORONER,
     ROLE_SYSTEM_ADMIN,
 )
+from .constants import CaseSourceType, CaseStatus
 
 ROLE_PRIORITY = [
     ROLE_POLICE_CHIEF,
@@ -31,6 +35,29 @@ APPROVAL_MAP = {
 
 POLICE_ROLES = set(ROLE_PRIORITY)
 
+POLICE_VISIBILITY_ROLES = {
+    ROLE_CADET,
+    ROLE_POLICE_OFFICER,
+    ROLE_PATROL_OFFICER,
+    ROLE_DETECTIVE,
+    ROLE_SERGEANT,
+    ROLE_CAPTAIN,
+    ROLE_POLICE_CHIEF,
+    ROLE_CORONER,
+}
+
+NON_CADET_POLICE_VISIBILITY_ROLES = POLICE_VISIBILITY_ROLES - {ROLE_CADET}
+
+WORKFLOW_VISIBLE_CASE_STATUSES = [
+    CaseStatus.ACTIVE,
+    CaseStatus.CLOSED_SOLVED,
+    CaseStatus.CLOSED_UNSOLVED,
+    CaseStatus.VOIDED,
+]
+
+# Position in ROLE_PRIORITY: a lower rank is more senior. Users without a police role have no rank.
+ROLE_RANK = {role: index for index, role in enumerate(ROLE_PRIORITY)}
+
 
 def get_primary_role(user):
     role_slugs = get_user_role_slugs(user)
@@ -40,6 +67,40 @@ def get_primary_role(user):
     return None
 
 
+def get_primary_role_rank(user):
+    return ROLE_RANK.get(get_primary_role(user))
+
+
+def _primary_role_rank_subquery(user_role_model):
+    rank = models.Case(
+        *[When(role__slug=role, then=Value(index)) for role, index in ROLE_RANK.items()],
+        output_field=models.PositiveSmallIntegerField(),
+    )
+    best_role = (
+        user_role_model.objects.filter(user_id=OuterRef("pk"), role__slug__in=ROLE_PRIORITY)
+        .annotate(rank=rank)
+        .order_by("rank")
+        .values("rank")[:1]
+    )
+    return Subquery(best_role)
+
+
+def refresh_primary_role_ranks(user_ids=None, user_model=None, user_role_model=None):
+    """Recompute ``User.primary_role_rank`` in a single UPDATE, for the given users or for everyone.
+
+    The model arguments let data migrations pass their historical models.
+    """
+
+    if user_model is None:
+        from apps.accounts.models import User as user_model
+    if user_role_model is None:
+        from apps.rbac.models import UserRole as user_role_model
+    users = user_model.objects.all()
+    if user_ids is not None:
+        users = users.filter(pk__in=user_ids)
+    return users.update(primary_role_rank=_primary_role_rank_subquery(user_role_model))
+
+
 def get_required_approver_role_slug(user):
     primary = get_primary_role(user)
     if not primary:
@@ -58,16 +119,84 @@ def is_user_assigned_to_case(user, case, role_in_case=None):
     return queryset.exists()
 
 
+def _case_access_q(user):
+    # Cases the user created, filed the complaint of or is assigned to; an empty Q for administrators.
+    from .models import CaseAssignment
+
+    if user.is_superuser or ROLE_SYSTEM_ADMIN in get_user_role_slugs(user):
+        return Q()
+    assigned = CaseAssignment.objects.filter(case_id=OuterRef("pk"), user=user)
+    return Q(created_by=user) | Q(complaint__created_by=user) | Q(Exists(assigned))
+
+
+def accessible_case_ids(user, cases):
+    """Return the ids among ``cases`` (Case instances or ids) that the user may access.
+
+    Cases the user created are resolved from loaded instances; the rest take one query
+    whatever their number, plus the usual cached role lookup.
+    """
+
+    from .models import Case
+
+    if not user or not user.is_authenticated:
+        return set()
+    case_ids = set()
+    accessible = set()
+    for case in cases:
+        case_id = getattr(case, "pk", case)
+        if case_id is None:
+            continue
+        if getattr(case, "created_by_id", None) == user.pk:
+            accessible.add(case_id)
+        else:
+            case_ids.add(case_id)
+    if not case_ids:
+        return accessible
+    access = _case_access_q(user)
+    if not access:
+        return accessible | case_ids
+    return accessible | set(Case.objects.filter(access, pk__in=case_ids).values_list("pk", flat=True))
+
+
 def can_user_access_case(user, case):
-    if not user or not user.is_authenticated or not case:
+    if not case:
         return False
-    if user.is_superuser:
-        return True
+    return case.pk in accessible_case_ids(user, [case])
+
+
+def policy_case_queryset(user):
+    """Cases visible to the user, evaluated directly from the visibility rules.
+
+    Listing goes through the materialized index in apps.cases.access; this query is the
+    reference that index is checked against.
+    """
+
+    from .models import Case
+
+    if not user or not user.is_authenticated:
+        return Case.objects.none()
     role_slugs = set(get_user_role_slugs(user))
     if ROLE_SYSTEM_ADMIN in role_slugs:
-        return True
-    if case.created_by_id == user.id:
-        return True
-    if case.complaint_id and case.complaint and case.complaint.created_by_id == user.id:
-        return True
-    return is_user_assigned_to_case(user, case)
+        return Case.objects.all()
+    queryset = Case.objects.filter(
+        Q(assignments__user=user) | Q(complaint__created_by=user) | Q(created_by=user)
+    )
+    if role_slugs & POLICE_VISIBILITY_ROLES:
+        queryset = queryset | Case.objects.filter(
+            source_type=CaseSourceType.COMPLAINT,
+            status__in=WORKFLOW_VISIBLE_CASE_STATUSES,
+        )
+        if role_slugs & NON_CADET_POLICE_VISIBILITY_ROLES:
+            queryset = queryset | Case.objects.filter(
+                source_type=CaseSourceType.CRIME_SCENE,
+                status__in=WORKFLOW_VISIBLE_CASE_STATUSES,
+            )
+    viewer_rank = get_primary_role_rank(user)
+    if viewer_rank is not None:
+        # Superiors see pending crime-scene cases filed by lower-ranked police.
+        queryset = queryset | Case.objects.filter(
+            source_type=CaseSourceType.CRIME_SCENE,
+            status=CaseStatus.PENDING_SUPERIOR_APPROVAL,
+            created_by__primary_role_rank__gt=viewer_rank,
+        )
+    return queryset.distinct()
@@ -0,0 +1,99 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+from apps.rbac.models import Role, UserRole
+from .access import (
+    grant_assignment_access,
+    pending_crime_scene_case_ids,
+    revoke_assignment_access,
+    sync_case_access,
+)
+from .constants import CaseAccessReason
+from .models import Case, CaseAccess, CaseAssignment, Complaint
+from .policies import refresh_primary_role_ranks
+
+
+# Snapshots of the fields case visibility depends on, read from __dict__ so deferred
+# fields are never fetched just to fill them.
+CASE_ACCESS_FIELDS = ("status", "source_type", "created_by_id", "complaint_id")
+
+
+def _case_access_snapshot(instance):
+    return tuple(instance.__dict__.get(field) for field in CASE_ACCESS_FIELDS)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def update_primary_role_rank(sender, instance, **kwargs):
+    refresh_primary_role_ranks([instance.user_id])
+    sync_case_access(pending_crime_scene_case_ids([instance.user_id]))
+
+
+@receiver(post_save, sender=Role)
+def update_primary_role_ranks_for_role(sender, instance, created, **kwargs):
+    # A renamed slug can move every holder of the role in or out of ROLE_PRIORITY.
+    if not created:
+        holder_ids = instance.role_users.values("user_id")
+        refresh_primary_role_ranks(holder_ids)
+        sync_case_access(pending_crime_scene_case_ids(holder_ids))
+
+
+@receiver(post_init, sender=Case)
+def remember_case_access_fields(sender, instance, **kwargs):
+    instance._case_access_snapshot = _case_access_snapshot(instance)
+
+
+@receiver(post_save, sender=Case)
+def update_case_access(sender, instance, created, **kwargs):
+    snapshot = _case_access_snapshot(instance)
+    if created or snapshot != instance._case_access_snapshot:
+        sync_case_access([instance.pk])
+    instance._case_access_snapshot = snapshot
+
+
+@receiver(post_init, sender=CaseAssignment)
+def remember_assignment_user(sender, instance, **kwargs):
+    instance._case_access_user_id = instance.__dict__.get("user_id")
+
+
+@receiver(post_save, sender=CaseAssignment)
+def grant_case_assignment_access(sender, instance, created, **kwargs):
+    previous_user_id = instance._case_access_user_id
+    if not created and previous_user_id != instance.user_id:
+        revoke_assignment_access(instance.case_id, previous_user_id)
+    grant_assignment_access(instance.case_id, instance.user_id)
+    instance._case_access_user_id = instance.user_id
+
+
+@receiver(post_delete, sender=CaseAssignment)
+def revoke_case_assignment_access(sender, instance, **kwargs):
+    revoke_assignment_access(instance.case_id, instance.user_id)
+
+
+@receiver(post_init, sender=Complaint)
+def remember_complaint_owner(sender, instance, **kwargs):
+    instance._case_access_owner_id = instance.__dict__.get("created_by_id")
+
+
+@receiver(post_save, sender=Complaint)
+def update_complaint_case_access(sender, instance, created, **kwargs):
+    if not created and instance.created_by_id != instance._case_access_owner_id:
+        sync_case_access(Case.objects.filter(complaint_id=instance.pk).values_list("pk", flat=True))
+    instance._case_access_owner_id = instance.created_by_id
+
+
+@receiver(pre_delete, sender=Complaint)
+def revoke_complaint_case_access(sender, instance, **kwargs):
+    # The case outlives its complaint (SET_NULL), which Django applies without signals.
+    CaseAccess.objects.filter(case__complaint_id=instance.pk, reason=CaseAccessReason.COMPLAINANT).delete()
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def remember_created_pending_cases(sender, instance, **kwargs):
+    instance._case_access_pending_case_ids = pending_crime_scene_case_ids([instance.pk])
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def update_created_pending_cases(sender, instance, **kwargs):
+    # Cases keep a null creator, which no superior scope matches.
+    sync_case_access(getattr(instance, "_case_access_pending_case_ids", []))
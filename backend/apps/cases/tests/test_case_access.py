@@ -0,0 +1,147 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.cases.access import find_case_access_drift, find_policy_mismatches
+from apps.cases.policies import accessible_case_ids, can_user_access_case
+from apps.cases.constants import CaseAssignmentRole, CaseSourceType, CaseStatus, ComplaintStatus, CrimeLevel
+from apps.cases.models import Case, CaseAccess, CaseAssignment, Complaint
+from apps.rbac.constants import (
+    ROLE_BASE_USER,
+    ROLE_CADET,
+    ROLE_CAPTAIN,
+    ROLE_DETECTIVE,
+    ROLE_PATROL_OFFICER,
+    ROLE_POLICE_OFFICER,
+    ROLE_SERGEANT,
+)
+from apps.rbac.models import Role, UserRole
+
+
+class CaseAccessIndexTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.citizen = self.create_user("access_citizen", ROLE_BASE_USER)
+        self.cadet = self.create_user("access_cadet", ROLE_CADET)
+        self.patrol = self.create_user("access_patrol", ROLE_PATROL_OFFICER)
+        self.officer = self.create_user("access_officer", ROLE_POLICE_OFFICER)
+        self.detective = self.create_user("access_detective", ROLE_DETECTIVE)
+        self.sergeant = self.create_user("access_sergeant", ROLE_SERGEANT)
+        self.captain = self.create_user("access_captain", ROLE_CAPTAIN)
+        self.users = [self.citizen, self.cadet, self.patrol, self.officer, self.detective, self.sergeant, self.captain]
+
+    def create_user(self, username, role_slug):
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"{username}123",
+            national_id=f"{username}nid",
+            password="Pass1234!",
+            first_name="Access",
+            last_name="User",
+        )
+        UserRole.objects.create(user=user, role=Role.objects.get(slug=role_slug))
+        return user
+
+    def create_case(self, creator, source_type, case_status, complaint=None):
+        return Case.objects.create(
+            title="Access case",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_2,
+            location="Loc",
+            status=case_status,
+            source_type=source_type,
+            created_by=creator,
+            complaint=complaint,
+        )
+
+    def assert_index_matches_policy(self):
+        self.assertEqual(find_case_access_drift(), [])
+        for user in self.users:
+            cache.clear()
+            self.assertEqual(find_policy_mismatches(user), ([], []), user.username)
+
+    def test_index_follows_case_assignment_complaint_and_role_changes(self):
+        complaint = Complaint.objects.create(
+            title="Complaint",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_2,
+            location="Loc",
+            status=ComplaintStatus.APPROVED,
+            created_by=self.citizen,
+        )
+        complaint_case = self.create_case(self.officer, CaseSourceType.COMPLAINT, CaseStatus.ACTIVE, complaint)
+        pending = self.create_case(self.patrol, CaseSourceType.CRIME_SCENE, CaseStatus.PENDING_SUPERIOR_APPROVAL)
+        self.create_case(self.sergeant, CaseSourceType.CRIME_SCENE, CaseStatus.PENDING_SUPERIOR_APPROVAL)
+        self.create_case(self.officer, CaseSourceType.CRIME_SCENE, CaseStatus.VOIDED)
+        self.assert_index_matches_policy()
+
+        assignment = CaseAssignment.objects.create(case=pending, user=self.detective, role_in_case=CaseAssignmentRole.DETECTIVE)
+        CaseAssignment.objects.create(case=pending, user=self.detective, role_in_case=CaseAssignmentRole.OFFICER)
+        self.assert_index_matches_policy()
+        assignment.delete()
+        self.assert_index_matches_policy()
+        CaseAssignment.objects.filter(case=pending).delete()
+        self.assert_index_matches_policy()
+
+        pending.status = CaseStatus.ACTIVE
+        pending.save()
+        complaint_case.status = CaseStatus.PENDING_SUPERIOR_APPROVAL
+        complaint_case.save()
+        self.assert_index_matches_policy()
+
+        UserRole.objects.filter(user=self.sergeant).delete()
+        UserRole.objects.create(user=self.sergeant, role=Role.objects.get(slug=ROLE_PATROL_OFFICER))
+        self.assert_index_matches_policy()
+
+        complaint.delete()
+        self.patrol.delete()
+        self.users.remove(self.patrol)
+        self.assert_index_matches_policy()
+
+    def test_case_list_is_one_semi_join_without_distinct(self):
+        for _ in range(3):
+            self.create_case(self.officer, CaseSourceType.CRIME_SCENE, CaseStatus.ACTIVE)
+            self.create_case(self.patrol, CaseSourceType.CRIME_SCENE, CaseStatus.PENDING_SUPERIOR_APPROVAL)
+        self.client.force_authenticate(user=self.sergeant)
+        self.client.get("/api/v1/cases/")
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get("/api/v1/cases/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 6)
+        case_query = captured[0]["sql"]
+        self.assertIn("EXISTS", case_query)
+        self.assertNotIn("DISTINCT", case_query)
+
+    def test_check_command_detects_and_repairs_drift(self):
+        case = self.create_case(self.officer, CaseSourceType.CRIME_SCENE, CaseStatus.ACTIVE)
+        call_command("check_case_access", "--all-users", stdout=StringIO())
+
+        CaseAccess.objects.filter(case=case, user__isnull=True).delete()
+        with self.assertRaises(CommandError):
+            call_command("check_case_access", stdout=StringIO())
+        call_command("check_case_access", "--fix", stdout=StringIO())
+        self.assert_index_matches_policy()
+
+        CaseAccess.objects.all().delete()
+        call_command("rebuild_case_access", stdout=StringIO())
+        self.assert_index_matches_policy()
+
+    def test_batch_access_check_uses_one_query(self):
+        own = self.create_case(self.detective, CaseSourceType.CRIME_SCENE, CaseStatus.ACTIVE)
+        assigned = [self.create_case(self.officer, CaseSourceType.CRIME_SCENE, CaseStatus.ACTIVE) for _ in range(4)]
+        hidden = [self.create_case(self.officer, CaseSourceType.CRIME_SCENE, CaseStatus.ACTIVE) for _ in range(4)]
+        for case in assigned:
+            CaseAssignment.objects.create(case=case, user=self.detective, role_in_case=CaseAssignmentRole.DETECTIVE)
+        self.assertFalse(can_user_access_case(self.detective, hidden[0]))
+
+        with self.assertNumQueries(1):
+            ids = accessible_case_ids(self.detective, [own, *assigned, *[case.pk for case in hidden]])
+        self.assertEqual(ids, {own.pk, *[case.pk for case in assigned]})
+        with self.assertNumQueries(0):
+            self.assertTrue(can_user_access_case(self.detective, own))
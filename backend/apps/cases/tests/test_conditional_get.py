@@ -0,0 +1,162 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.board.models import BoardItem
+from apps.cases.constants import CaseSourceType, CaseStatus, CrimeLevel
+from apps.cases.models import Case, CaseAssignment
+from apps.evidence.models import Evidence
+from apps.notifications.models import Notification
+from apps.rbac.constants import ROLE_CAPTAIN, ROLE_DETECTIVE, ROLE_POLICE_CHIEF, ROLE_SYSTEM_ADMIN
+from apps.rbac.models import Role, UserRole
+from apps.suspects.models import Person, WantedRecord
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = self.create_user("cond_admin", ROLE_SYSTEM_ADMIN)
+        self.detective = self.create_user("cond_detective", ROLE_DETECTIVE)
+        self.case = Case.objects.create(
+            title="Conditional case",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_2,
+            location="Loc",
+            status=CaseStatus.ACTIVE,
+            source_type=CaseSourceType.COMPLAINT,
+        )
+        CaseAssignment.objects.create(case=self.case, user=self.detective, role_in_case="detective")
+
+    def create_user(self, username, role_slug):
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"{username}123",
+            national_id=f"{username}nid",
+            password="Pass1234!",
+            first_name="Cond",
+            last_name="User",
+        )
+        role, _ = Role.objects.get_or_create(slug=role_slug, defaults={"name": role_slug, "is_system": True})
+        UserRole.objects.create(user=user, role=role)
+        return user
+
+    def revalidate(self, url, response, **headers):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"], **headers)
+
+    def test_evidence_list_answers_304_until_evidence_changes(self):
+        self.client.force_authenticate(self.detective)
+        url = reverse("case-evidence", kwargs={"case_id": self.case.id})
+        Evidence.objects.create(case=self.case, title="Knife", description="D", evidence_type="other")
+
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn("Authorization", first["Vary"])
+        self.assertIn("private", first["Cache-Control"])
+
+        cached = self.revalidate(url, first)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(cached["ETag"], first["ETag"])
+
+        evidence = Evidence.objects.get(case=self.case)
+        evidence.title = "Bloody knife"
+        evidence.save()
+        edited = self.revalidate(url, first)
+        self.assertEqual(edited.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(edited["ETag"], first["ETag"])
+
+        evidence.delete()
+        deleted = self.revalidate(url, edited)
+        self.assertEqual(deleted.status_code, status.HTTP_200_OK)
+        self.assertEqual(deleted.data, [])
+
+    def test_forbidden_requests_never_get_a_304(self):
+        self.client.force_authenticate(self.admin)
+        url = reverse("case-evidence", kwargs={"case_id": self.case.id})
+        first = self.client.get(url)
+
+        outsider = self.create_user("cond_outsider", ROLE_DETECTIVE)
+        self.client.force_authenticate(outsider)
+        response = self.revalidate(url, first)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertNotIn("ETag", response)
+
+    def test_case_detail_honours_if_modified_since(self):
+        self.client.force_authenticate(self.admin)
+        url = reverse("case-detail", kwargs={"pk": self.case.id})
+        first = self.client.get(url)
+        self.assertEqual(first["Last-Modified"], http_date(int(self.case.updated_at.timestamp())))
+
+        later = http_date((timezone.now() + timedelta(minutes=1)).timestamp())
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=later).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.case.title = "Renamed"
+        self.case.save()
+        changed = self.revalidate(url, first)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data["title"], "Renamed")
+
+    def test_board_and_notifications_change_etag_on_writes(self):
+        self.client.force_authenticate(self.detective)
+        board_url = reverse("board-detail", kwargs={"case_id": self.case.id})
+        board = self.client.get(board_url)
+        self.assertEqual(self.revalidate(board_url, board).status_code, status.HTTP_304_NOT_MODIFIED)
+        BoardItem.objects.create(board_id=board.data["id"], item_type="NOTE", text="Lead")
+        self.assertEqual(self.revalidate(board_url, board).status_code, status.HTTP_200_OK)
+
+        notifications_url = reverse("notifications")
+        notification = Notification.objects.create(user=self.detective, case=self.case, type="new_evidence", payload={})
+        listing = self.client.get(notifications_url)
+        # The counter row and the newest id validate the list; the inbox is not aggregated.
+        with self.assertNumQueries(2):
+            self.assertEqual(self.revalidate(notifications_url, listing).status_code, status.HTTP_304_NOT_MODIFIED)
+        self.client.post(reverse("notification-read", kwargs={"id": notification.id}))
+        listing = self.revalidate(notifications_url, listing)
+        self.assertEqual(listing.status_code, status.HTTP_200_OK)
+        Notification.objects.create(role_slug=ROLE_DETECTIVE, type="broadcast")
+        listing = self.revalidate(notifications_url, listing)
+        self.assertEqual(listing.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.revalidate(notifications_url, listing).status_code, status.HTTP_304_NOT_MODIFIED)
+        self.client.post(reverse("notification-bulk-read"), {"before": timezone.now().isoformat()}, format="json")
+        self.assertEqual(self.revalidate(notifications_url, listing).status_code, status.HTTP_200_OK)
+
+    def test_case_report_etag_follows_role_changes(self):
+        chief = self.create_user("cond_chief", ROLE_POLICE_CHIEF)
+        self.case.created_by = chief
+        self.case.save()
+        self.client.force_authenticate(chief)
+        url = reverse("case-report", kwargs={"case_id": self.case.id})
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.revalidate(url, first).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        captain, _ = Role.objects.get_or_create(slug=ROLE_CAPTAIN, defaults={"name": ROLE_CAPTAIN, "is_system": True})
+        UserRole.objects.create(user=self.detective, role=captain)
+        changed = self.revalidate(url, first)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        roles = changed.data["assignments"][0]["user"]["roles"]
+        self.assertIn(ROLE_CAPTAIN, roles)
+
+    def test_public_endpoints_are_shared_cacheable(self):
+        person = Person.objects.create(full_name="Roy Earle")
+        record = WantedRecord.objects.create(person=person, case=self.case, status="wanted")
+        record.started_at = timezone.now() - timedelta(days=40)
+        record.save()
+
+        most_wanted_url = reverse("most-wanted-public")
+        listing = self.client.get(most_wanted_url)
+        self.assertEqual(len(listing.data), 1)
+        self.assertNotIn("private", listing["Cache-Control"])
+        self.assertEqual(self.revalidate(most_wanted_url, listing).status_code, status.HTTP_304_NOT_MODIFIED)
+        self.case.crime_level = CrimeLevel.CRITICAL
+        self.case.save()
+        self.assertEqual(self.revalidate(most_wanted_url, listing).status_code, status.HTTP_200_OK)
+
+        stats_url = reverse("stats-overview")
+        stats = self.client.get(stats_url)
+        self.assertEqual(self.revalidate(stats_url, stats).status_code, status.HTTP_304_NOT_MODIFIED)
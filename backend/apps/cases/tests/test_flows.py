@@ -72,11 +72,12 @@ class CaseFlowTests(APITestCase):
         )
         self.client.force_authenticate(user=cadet)
         for index in range(3):
-            res = self.client.post(
-                f"/api/v1/cases/complaints/{complaint.id}/cadet-review/",
-                {"action": "return", "message": f"Issue {index + 1}"},
-                format="json",
-            )
+            with self.captureOnCommitCallbacks(execute=True):
+                res = self.client.post(
+                    f"/api/v1/cases/complaints/{complaint.id}/cadet-review/",
+                    {"action": "return", "message": f"Issue {index + 1}"},
+                    format="json",
+                )
             self.assertEqual(res.status_code, status.HTTP_200_OK)
             complaint.refresh_from_db()
             if index < 2:
@@ -342,6 +343,41 @@ class CaseFlowTests(APITestCase):
         self.assertEqual(entry["crime_degree"], 3)
         self.assertEqual(entry["ranking_score"], entry["days_wanted"] * entry["crime_degree"])
 
+    def test_most_wanted_aggregates_per_person_in_sql(self):
+        def wanted(person, crime_level, days, case_status=CaseStatus.ACTIVE, record_status="wanted"):
+            case = Case.objects.create(
+                title="Case",
+                description="Desc",
+                crime_level=crime_level,
+                location="Loc",
+                status=case_status,
+                source_type=CaseSourceType.COMPLAINT,
+            )
+            record = WantedRecord.objects.create(person=person, case=case, status=record_status)
+            record.started_at = timezone.now() - timedelta(days=days)
+            record.save()
+
+        long_wanted = Person.objects.create(full_name="Long wanted")
+        wanted(long_wanted, CrimeLevel.LEVEL_3, 50)
+        # An arrest still raises the degree, but a closed case does not extend the days wanted.
+        wanted(long_wanted, CrimeLevel.CRITICAL, 5, record_status="arrested")
+        wanted(long_wanted, CrimeLevel.LEVEL_2, 400, case_status=CaseStatus.CLOSED_SOLVED)
+        dangerous = Person.objects.create(full_name="Dangerous")
+        wanted(dangerous, CrimeLevel.LEVEL_1, 35, case_status=CaseStatus.PENDING_SUPERIOR_APPROVAL)
+        recent = Person.objects.create(full_name="Recent")
+        wanted(recent, CrimeLevel.CRITICAL, 29)
+
+        with self.assertNumQueries(1):
+            results = compute_most_wanted()
+
+        self.assertEqual(
+            [(entry["person"].id, entry["days_wanted"], entry["crime_degree"]) for entry in results],
+            [(long_wanted.id, 50, 4), (dangerous.id, 35, 3)],
+        )
+        self.assertEqual(results[0]["ranking_score"], 200)
+        self.assertEqual(results[0]["reward_amount"], 200 * 20000000)
+        self.assertEqual([entry["person"].id for entry in compute_most_wanted(limit=1)], [long_wanted.id])
+
     def test_tip_flow_issues_reward_code(self):
         base_user = self.create_user("baseuser", ROLE_BASE_USER)
         officer = self.create_user("officer", ROLE_POLICE_OFFICER)
@@ -602,6 +638,44 @@ class CaseFlowTests(APITestCase):
         self.assertIn(crime_scene_active.id, sergeant_ids)
         self.assertIn(crime_scene_pending.id, sergeant_ids)
 
+    def test_superior_visibility_uses_denormalized_role_rank(self):
+        officer = self.create_user("officer_rank", ROLE_POLICE_OFFICER)
+        captain = self.create_user("captain_rank", ROLE_CAPTAIN)
+        sergeant = self.create_user("sergeant_rank", ROLE_SERGEANT)
+        officer.refresh_from_db()
+        self.assertEqual(officer.primary_role_rank, 4)
+
+        def pending_case(creator):
+            return Case.objects.create(
+                title="Pending",
+                description="Desc",
+                crime_level=CrimeLevel.LEVEL_2,
+                location="Loc",
+                status=CaseStatus.PENDING_SUPERIOR_APPROVAL,
+                source_type=CaseSourceType.CRIME_SCENE,
+                created_by=creator,
+            )
+
+        by_officer = pending_case(officer)
+        by_captain = pending_case(captain)
+        self.client.force_authenticate(user=sergeant)
+        self.client.get("/api/v1/cases/")
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/v1/cases/")
+        ids = {row["id"] for row in res.data}
+        self.assertIn(by_officer.id, ids)
+        self.assertNotIn(by_captain.id, ids)
+
+        for _ in range(5):
+            pending_case(officer)
+        with self.assertNumQueries(2):
+            self.client.get("/api/v1/cases/")
+
+        UserRole.objects.filter(user=captain).delete()
+        UserRole.objects.create(user=captain, role=Role.objects.get(slug=ROLE_PATROL_OFFICER))
+        res = self.client.get("/api/v1/cases/")
+        self.assertIn(by_captain.id, {row["id"] for row in res.data})
+
     def test_tip_review_queue_filters_by_role(self):
         base_user = self.create_user("tip_base", ROLE_BASE_USER)
         officer = self.create_user("tip_officer", ROLE_POLICE_OFFICER)
@@ -626,6 +700,51 @@ class CaseFlowTests(APITestCase):
         self.assertEqual(admin_queue.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(admin_queue.data), 2)
 
+    def test_list_endpoints_page_with_keyset_cursors(self):
+        officer = self.create_user("page_officer", ROLE_POLICE_OFFICER)
+        created_at = timezone.now()
+        notifications = Notification.objects.bulk_create(
+            [Notification(user=officer, type="info", payload={"index": index}) for index in range(7)]
+        )
+        # Identical timestamps force the id tie-breaker to keep pages disjoint.
+        Notification.objects.filter(user=officer).update(created_at=created_at)
+        self.client.force_authenticate(user=officer)
+
+        legacy = self.client.get("/api/v1/notifications/")
+        self.assertEqual(len(legacy.data), 7)
+
+        with self.settings(API_LEGACY_LIST_RESPONSES=False, API_MAX_PAGE_SIZE=3):
+            res = self.client.get("/api/v1/notifications/?page_size=50")
+            self.assertEqual(len(res.data["results"]), 3)
+            seen = [row["id"] for row in res.data["results"]]
+            next_url = res.data["next"]
+            while next_url:
+                res = self.client.get(next_url)
+                seen.extend(row["id"] for row in res.data["results"])
+                next_url = res.data["next"]
+        self.assertEqual(seen, sorted((n.id for n in notifications), reverse=True))
+
+        for index in range(3):
+            person = Person.objects.create(full_name=f"Wanted {index}")
+            case = Case.objects.create(
+                title="Case",
+                description="Desc",
+                crime_level=CrimeLevel.LEVEL_1,
+                location="Loc",
+                status=CaseStatus.ACTIVE,
+                source_type=CaseSourceType.COMPLAINT,
+            )
+            record = WantedRecord.objects.create(person=person, case=case)
+            record.started_at = timezone.now() - timedelta(days=40 + index)
+            record.save()
+        first = self.client.get("/api/v1/public/most-wanted/?page_size=2")
+        self.assertEqual(len(first.data["results"]), 2)
+        self.assertIsNone(first.data["previous"])
+        second = self.client.get(first.data["next"])
+        self.assertEqual(len(second.data["results"]), 1)
+        self.assertIsNone(second.data["next"])
+        self.assertEqual(second.data["results"][0]["person"]["full_name"], "Wanted 0")
+
     def test_sergeant_cannot_decide_suspect_for_unrelated_case(self):
         detective = self.create_user("det_unrel", ROLE_DETECTIVE)
         sergeant = self.create_user("sgt_unrel", ROLE_SERGEANT)
@@ -756,11 +875,12 @@ class CaseFlowTests(APITestCase):
             captain_reviewed_by=captain,
         )
         self.client.force_authenticate(user=chief)
-        res = self.client.post(
-            f"/api/v1/interrogations/{interrogation.id}/chief-decision/",
-            {"decision": "reject", "notes": "Insufficient evidence"},
-            format="json",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                f"/api/v1/interrogations/{interrogation.id}/chief-decision/",
+                {"decision": "reject", "notes": "Insufficient evidence"},
+                format="json",
+            )
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         interrogation.refresh_from_db()
         self.assertEqual(interrogation.status, "pending_captain")
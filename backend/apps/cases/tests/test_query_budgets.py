@@ -0,0 +1,130 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.cases.constants import CaseSourceType, CaseStatus, ComplaintStatus, CrimeLevel
+from apps.cases.models import Case, Complaint
+from apps.cases.views import ComplaintQueueView
+from apps.evidence.models import (
+    Evidence,
+    EvidenceMedia,
+    EvidenceType,
+    IdentityDocumentEvidence,
+    MedicalEvidence,
+    MedicalEvidenceImage,
+    VehicleEvidence,
+    WitnessStatementEvidence,
+)
+from apps.evidence.views import EvidenceListCreateView
+from apps.notifications.views import NotificationListView
+from apps.rbac.constants import ROLE_CADET, ROLE_SYSTEM_ADMIN
+from apps.rbac.models import Role, UserRole
+from police_portal.instrumentation import QueryBudgetExceeded, view_metrics
+from police_portal.testing import assert_max_queries
+
+
+class QueryBudgetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        view_metrics.reset()
+        self.admin = self.create_user("budget_admin", ROLE_SYSTEM_ADMIN)
+        self.case = Case.objects.create(
+            title="Budget case",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_2,
+            location="Loc",
+            status=CaseStatus.ACTIVE,
+            source_type=CaseSourceType.COMPLAINT,
+        )
+
+    def create_user(self, username, role_slug):
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"{username}123",
+            national_id=f"{username}nid",
+            password="Pass1234!",
+            first_name="Budget",
+            last_name="User",
+        )
+        role, _ = Role.objects.get_or_create(slug=role_slug, defaults={"name": role_slug, "is_system": True})
+        UserRole.objects.create(user=user, role=role)
+        return user
+
+    def add_evidence(self, count):
+        for index in range(count):
+            kind = [
+                EvidenceType.WITNESS_STATEMENT,
+                EvidenceType.MEDICAL,
+                EvidenceType.VEHICLE,
+                EvidenceType.IDENTITY_DOCUMENT,
+            ][index % 4]
+            evidence = Evidence.objects.create(case=self.case, title="E", description="D", evidence_type=kind)
+            if kind == EvidenceType.WITNESS_STATEMENT:
+                statement = WitnessStatementEvidence.objects.create(evidence=evidence, transcription="T")
+                EvidenceMedia.objects.create(witness_statement=statement, file="evidence_media/a.mp3")
+            elif kind == EvidenceType.MEDICAL:
+                medical = MedicalEvidence.objects.create(evidence=evidence)
+                MedicalEvidenceImage.objects.create(medical_evidence=medical, image="medical_evidence/a.png")
+            elif kind == EvidenceType.VEHICLE:
+                VehicleEvidence.objects.create(evidence=evidence, model="M", color="Red", license_plate="P")
+            else:
+                IdentityDocumentEvidence.objects.create(evidence=evidence, owner_full_name="Owner")
+
+    def test_evidence_list_stays_within_budget_as_evidence_grows(self):
+        self.client.force_authenticate(user=self.admin)
+        self.add_evidence(4)
+        self.client.get(f"/api/v1/cases/{self.case.id}/evidence/")
+        with assert_max_queries(EvidenceListCreateView) as small:
+            self.client.get(f"/api/v1/cases/{self.case.id}/evidence/")
+        self.add_evidence(16)
+        with assert_max_queries(EvidenceListCreateView) as large:
+            res = self.client.get(f"/api/v1/cases/{self.case.id}/evidence/")
+        self.assertEqual(len(res.data), 20)
+        self.assertEqual(small[0].query_count, large[0].query_count)
+
+    def test_assert_max_queries_reports_the_queries(self):
+        self.client.force_authenticate(user=self.admin)
+        # The first listing also stores the unread counter.
+        self.client.get("/api/v1/notifications/")
+        with self.assertRaisesMessage(AssertionError, "NotificationListView ran 3 queries for GET, expected at most 0"):
+            with assert_max_queries(NotificationListView, 0):
+                self.client.get("/api/v1/notifications/")
+        with self.assertRaisesMessage(AssertionError, "No request reached NotificationListView"):
+            with assert_max_queries(NotificationListView):
+                self.client.get("/api/v1/users/")
+
+    @override_settings(QUERY_METRICS_HEADERS=True)
+    def test_metrics_are_exposed_as_headers_and_aggregated_per_view(self):
+        cadet = self.create_user("budget_cadet", ROLE_CADET)
+        Complaint.objects.create(
+            title="Queued",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_3,
+            location="Loc",
+            status=ComplaintStatus.PENDING_CADET_REVIEW,
+            created_by=self.admin,
+        )
+        self.client.force_authenticate(user=cadet)
+        with assert_max_queries(ComplaintQueueView) as seen:
+            res = self.client.get("/api/v1/cases/complaints/queue/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["X-Query-Count"], str(seen[0].query_count))
+        self.assertEqual(res["X-Response-Size"], str(len(res.content)))
+        self.assertIn("X-DB-Time-Ms", res)
+        self.assertIn("X-Serializer-Time-Ms", res)
+        self.assertGreater(seen[0].serializer_time, 0)
+        entry = view_metrics.snapshot()["ComplaintQueueView"]
+        self.assertEqual(entry["requests"], 1)
+        self.assertEqual(entry["queries"], seen[0].query_count)
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_strict_budget_fails_requests_over_budget(self):
+        self.client.force_authenticate(user=self.admin)
+        with mock.patch.object(NotificationListView, "query_budget", 0):
+            with self.assertLogs("police_portal.queries", level="WARNING"):
+                with self.assertRaises(QueryBudgetExceeded):
+                    self.client.get("/api/v1/notifications/")
+        self.assertEqual(view_metrics.snapshot()["NotificationListView"]["over_budget"], 1)
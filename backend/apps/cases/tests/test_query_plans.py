@@ -0,0 +1,211 @@
+import re
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from apps.accounts.models import User
+from apps.cases.constants import CaseSourceType, CaseStatus, ComplaintStatus, CrimeLevel
+from apps.cases.models import Case, Complaint
+from apps.cases.views import ComplaintQueueView
+from apps.interrogations.models import Interrogation
+from apps.notifications.inbox import inbox_notifications
+from apps.notifications.models import Notification
+from apps.rbac.constants import ROLE_CADET, ROLE_CAPTAIN, ROLE_POLICE_OFFICER
+from apps.rbac.models import Role, UserRole
+from apps.rbac.utils import get_user_role_slugs
+from apps.rewards.models import Tip
+from apps.rewards.views import TipReviewQueueView
+from apps.suspects.models import Person, SuspectCandidate, WantedRecord
+
+
+SEED_ROWS = 300
+COMPLAINT_STATUSES = [
+    ComplaintStatus.PENDING_CADET_REVIEW,
+    ComplaintStatus.RETURNED_TO_CADET,
+    ComplaintStatus.PENDING_OFFICER_REVIEW,
+    ComplaintStatus.RETURNED_TO_COMPLAINANT,
+    ComplaintStatus.VOIDED,
+]
+CASE_STATUSES = [CaseStatus.ACTIVE, CaseStatus.PENDING_SUPERIOR_APPROVAL, CaseStatus.CLOSED_SOLVED]
+SOURCE_TYPES = [CaseSourceType.COMPLAINT, CaseSourceType.CRIME_SCENE]
+TIP_STATUSES = ["pending_officer", "pending_detective", "rejected", "accepted"]
+INTERROGATION_STATUSES = ["pending_detective", "pending_captain", "approved", "rejected"]
+# Cursor pagination reads one row past the page.
+PAGE_LIMIT = settings.API_PAGE_SIZE + 1
+
+
+class HotQueryPlanTests(TestCase):
+    """EXPLAIN the hot-path queries on seeded data and fail unless each reads through the index added for it.
+
+    Checking for the index by name, rather than for the absence of a full scan, keeps the
+    tests from passing on the foreign-key indexes alone. Listings are built by the views
+    and helpers that serve them and limited to one page the way cursor pagination does,
+    and must come out in index order, without a sort step; for listings read as a
+    UnionQuery every branch is checked. Postgres prefers sequential scans on small
+    tables, so its plans are taken with ``enable_seqscan`` off.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        users = [
+            User.objects.create_user(
+                username=f"plan{index}",
+                email=f"plan{index}@example.com",
+                phone=f"plan{index}",
+                national_id=f"plan-nid-{index}",
+                password="Pass1234!",
+            )
+            for index in range(5)
+        ]
+        cls.cadet, cls.officer = users[0], users[1]
+        for user, role_slugs in ((cls.cadet, [ROLE_CADET]), (cls.officer, [ROLE_POLICE_OFFICER, ROLE_CAPTAIN])):
+            for role_slug in role_slugs:
+                role, _ = Role.objects.get_or_create(slug=role_slug, defaults={"name": role_slug, "is_system": True})
+                UserRole.objects.create(user=user, role=role)
+        Complaint.objects.bulk_create(
+            [
+                Complaint(
+                    title="Plan",
+                    description="Desc",
+                    crime_level=CrimeLevel.LEVEL_3,
+                    location="Loc",
+                    status=COMPLAINT_STATUSES[index % len(COMPLAINT_STATUSES)],
+                    created_by=users[index % len(users)],
+                    assigned_cadet=users[index % len(users)] if index % 3 else None,
+                    assigned_officer=users[index % len(users)],
+                )
+                for index in range(SEED_ROWS)
+            ]
+        )
+        cases = Case.objects.bulk_create(
+            [
+                Case(
+                    title="Plan",
+                    description="Desc",
+                    crime_level=CrimeLevel.LEVEL_2,
+                    location="Loc",
+                    status=CASE_STATUSES[index % len(CASE_STATUSES)],
+                    source_type=SOURCE_TYPES[index % len(SOURCE_TYPES)],
+                    created_by=users[index % len(users)],
+                )
+                for index in range(SEED_ROWS)
+            ]
+        )
+        cls.case = cases[0]
+        persons = Person.objects.bulk_create([Person(full_name=f"Person {index}") for index in range(SEED_ROWS)])
+        cls.person = persons[0]
+        Notification.objects.bulk_create(
+            [Notification(user=users[index % len(users)], type="info") for index in range(SEED_ROWS)]
+            + [
+                Notification(role_slug=[ROLE_CAPTAIN, ROLE_POLICE_OFFICER, ROLE_CADET][index % 3], type="broadcast")
+                for index in range(SEED_ROWS)
+            ]
+        )
+        Tip.objects.bulk_create(
+            [
+                Tip(submitted_by=users[index % len(users)], content="tip", status=TIP_STATUSES[index % len(TIP_STATUSES)])
+                for index in range(SEED_ROWS)
+            ]
+        )
+        WantedRecord.objects.bulk_create(
+            [
+                WantedRecord(
+                    person=persons[index],
+                    case=cases[index],
+                    status="wanted" if index % 4 == 0 else "cleared",
+                )
+                for index in range(SEED_ROWS)
+            ]
+        )
+        SuspectCandidate.objects.bulk_create(
+            [
+                SuspectCandidate(case=cases[index], person=persons[index], rationale="r", status="pending")
+                for index in range(SEED_ROWS)
+            ]
+        )
+        Interrogation.objects.bulk_create(
+            [
+                Interrogation(
+                    case=cases[index],
+                    suspect=persons[index],
+                    status=INTERROGATION_STATUSES[index % len(INTERROGATION_STATUSES)],
+                )
+                for index in range(SEED_ROWS)
+            ]
+        )
+
+    def setUp(self):
+        cache.clear()
+        if connection.vendor not in ("postgresql", "sqlite"):
+            self.skipTest("Query plan checks cover Postgres and SQLite only")
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+                # Scoped to the test transaction, which TestCase rolls back.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, index, ordered=True):
+        """Fail unless the plan reads through ``index`` and, for ``ordered``, returns rows in index order without a sort."""
+
+        plan = queryset.explain()
+        self.assertIn(index, plan, f"{index} is not used:\n{plan}")
+        if ordered:
+            pattern = r"\bSort\b" if connection.vendor == "postgresql" else r"USE TEMP B-TREE"
+            self.assertIsNone(re.search(pattern, plan), f"Rows are sorted outside {index}:\n{plan}")
+
+    def view(self, view_class, user):
+        view = view_class()
+        view.request = Request(APIRequestFactory().get("/"))
+        view.request.user = user
+        view.format_kwarg = None
+        view.kwargs = {}
+        return view
+
+    def assertBranchesUseIndexes(self, union, indexes):
+        """Fail unless each branch of a UnionQuery page reads its index in order."""
+
+        branches = union.branch_ids(PAGE_LIMIT)
+        self.assertEqual(len(branches), len(indexes))
+        for queryset, index in zip(branches, indexes):
+            self.assertUsesIndex(queryset, index)
+
+    def test_complaint_queues_use_status_indexes(self):
+        view = self.view(ComplaintQueueView, self.cadet)
+        cadet_queue = view.get_queryset().order_by(*view.get_pagination_ordering())
+        # Unassigned complaints, then the cadet's own in each of the two statuses.
+        self.assertBranchesUseIndexes(cadet_queue, ["cases_cmpl_status_cadet_idx"] * 3)
+
+        view = self.view(ComplaintQueueView, self.officer)
+        officer_queue = view.get_queryset().order_by(*view.get_pagination_ordering())[:PAGE_LIMIT]
+        self.assertUsesIndex(officer_queue, "cases_cmpl_status_officer_idx")
+
+    def test_inbox_reads_direct_and_broadcast_indexes(self):
+        role_slugs = get_user_role_slugs(self.officer)
+        inbox = inbox_notifications(self.officer.pk, role_slugs).order_by("-created_at", "-id")
+        self.assertBranchesUseIndexes(inbox, ["notif_user_created_idx"] + ["notif_role_created_idx"] * len(role_slugs))
+
+    def test_tip_review_queue_uses_status_index(self):
+        queryset = self.view(TipReviewQueueView, self.officer).get_queryset()[:PAGE_LIMIT]
+        self.assertUsesIndex(queryset, "rewards_tip_status_created_idx")
+
+    def test_wanted_record_lookups_use_indexes(self):
+        self.assertUsesIndex(WantedRecord.objects.filter(status="wanted"), "suspects_wanted_status_idx")
+        self.assertUsesIndex(
+            WantedRecord.objects.filter(person=self.person, case=self.case), "suspects_wanted_person_idx"
+        )
+
+    def test_interrogation_offender_check_uses_case_status_index(self):
+        queryset = Interrogation.objects.filter(case=self.case, status="approved")
+        self.assertUsesIndex(queryset, "interrog_case_status_idx")
+
+    def test_case_workflow_filters_use_source_status_index(self):
+        queryset = Case.objects.filter(
+            source_type=CaseSourceType.CRIME_SCENE, status=CaseStatus.PENDING_SUPERIOR_APPROVAL
+        )
+        self.assertUsesIndex(queryset, "cases_case_source_status_idx")
+
+    def test_suspect_candidates_use_case_status_index(self):
+        queryset = SuspectCandidate.objects.filter(case=self.case, status="pending")
+        self.assertUsesIndex(queryset, "suspects_cand_case_status_idx")
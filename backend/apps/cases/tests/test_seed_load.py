@@ -0,0 +1,26 @@
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from apps.accounts.models import User
+from apps.cases.access import find_case_access_drift
+from apps.cases.models import Case, CaseAssignment, Complaint
+from apps.evidence.models import Evidence
+from apps.notifications.models import Notification
+from apps.suspects.models import SuspectCandidate
+
+
+class SeedLoadCommandTests(TestCase):
+    def test_seeds_every_model_and_rebuilds_derived_state(self):
+        call_command("seed_load", users=60, cases=40, chunk_size=15, prefix="t", stdout=StringIO())
+        self.assertEqual(User.objects.filter(username__startswith="t_").count(), 60)
+        self.assertEqual(Case.objects.count(), 40)
+        for model in (Complaint, CaseAssignment, Evidence, SuspectCandidate, Notification):
+            self.assertTrue(model.objects.exists(), model.__name__)
+        self.assertEqual(find_case_access_drift(), [])
+        self.assertTrue(User.objects.get(username="t_detective_0").check_password("Pass1234!"))
+
+    def test_rejects_existing_prefix(self):
+        call_command("seed_load", users=20, cases=5, prefix="t", stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command("seed_load", users=20, cases=5, prefix="t", stdout=StringIO())
@@ -1,4 +1,5 @@
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 from rest_framework import generics, status
@@ -15,14 +16,13 @@ from apps.rbac.constants import (
     ROLE_SERGEANT,
     ROLE_CAPTAIN,
     ROLE_POLICE_CHIEF,
-    ROLE_CORONER,
     ROLE_SYSTEM_ADMIN,
     ROLE_COMPLAINANT,
     ROLE_BASE_USER,
 )
 from apps.rbac.utils import user_has_role, get_role_by_slug
 from apps.accounts.models import User
-from apps.notifications.models import Notification
+from apps.notifications.dispatch import notify, notify_role
 from .models import Complaint, Case, CaseComplainant, CaseReview, CrimeSceneReport, CaseAssignment
 from .serializers import (
     ComplaintSerializer,
@@ -40,74 +40,15 @@ from .serializers import (
     CaseAssignmentUpsertSerializer,
 )
 from .constants import ComplaintStatus, CaseStatus, CrimeSceneStatus, CaseSourceType, CaseAssignmentRole
-from .policies import get_required_approver_role_slug, POLICE_ROLES, can_user_access_case, get_primary_role, ROLE_PRIORITY
-
-
-POLICE_VISIBILITY_ROLES = {
-    ROLE_CADET,
-    ROLE_POLICE_OFFICER,
-    ROLE_PATROL_OFFICER,
-    ROLE_DETECTIVE,
-    ROLE_SERGEANT,
-    ROLE_CAPTAIN,
-    ROLE_POLICE_CHIEF,
-    ROLE_CORONER,
-}
-
-NON_CADET_POLICE_VISIBILITY_ROLES = POLICE_VISIBILITY_ROLES - {ROLE_CADET}
-
-WORKFLOW_VISIBLE_CASE_STATUSES = [
-    CaseStatus.ACTIVE,
-    CaseStatus.CLOSED_SOLVED,
-    CaseStatus.CLOSED_UNSOLVED,
-    CaseStatus.VOIDED,
-]
-
-
-def _is_superior_role(viewer_role, creator_role):
-    if not viewer_role or not creator_role:
-        return False
-    role_rank = {role: index for index, role in enumerate(ROLE_PRIORITY)}
-    viewer_rank = role_rank.get(viewer_role)
-    creator_rank = role_rank.get(creator_role)
-    if viewer_rank is None or creator_rank is None:
-        return False
-    return viewer_rank < creator_rank
+from .policies import get_required_approver_role_slug, POLICE_ROLES, can_user_access_case
+from .access import accessible_case_queryset
+from police_portal.conditional import collection_fingerprint, conditional_response, make_etag
+from police_portal.pagination import PAGINATION_PARAMETERS, paginated_response
+from police_portal.unions import UnionQuery
 
 
 def _case_queryset_for_user(user):
-    if not user or not user.is_authenticated:
-        return Case.objects.none()
-    if user_has_role(user, [ROLE_SYSTEM_ADMIN]):
-        return Case.objects.all()
-    queryset = Case.objects.filter(
-        Q(assignments__user=user) | Q(complaint__created_by=user) | Q(created_by=user)
-    )
-    user_role_slugs = set(user.user_roles.select_related("role").values_list("role__slug", flat=True))
-    if user_role_slugs & POLICE_VISIBILITY_ROLES:
-        queryset = queryset | Case.objects.filter(
-            source_type=CaseSourceType.COMPLAINT,
-            status__in=WORKFLOW_VISIBLE_CASE_STATUSES,
-        )
-        if user_role_slugs & NON_CADET_POLICE_VISIBILITY_ROLES:
-            queryset = queryset | Case.objects.filter(
-                source_type=CaseSourceType.CRIME_SCENE,
-                status__in=WORKFLOW_VISIBLE_CASE_STATUSES,
-            )
-    viewer_primary_role = get_primary_role(user)
-    if viewer_primary_role in ROLE_PRIORITY:
-        pending_crime_scene_cases = Case.objects.filter(
-            source_type=CaseSourceType.CRIME_SCENE,
-            status=CaseStatus.PENDING_SUPERIOR_APPROVAL,
-        ).exclude(created_by=user).select_related("created_by")
-        superior_visible_case_ids = []
-        for case in pending_crime_scene_cases:
-            creator_primary_role = get_primary_role(case.created_by)
-            if _is_superior_role(viewer_primary_role, creator_primary_role):
-                superior_visible_case_ids.append(case.id)
-        if superior_visible_case_ids:
-            queryset = queryset | Case.objects.filter(id__in=superior_visible_case_ids)
-    return queryset.distinct()
+    return accessible_case_queryset(user)
 
 
 class ComplaintCreateView(generics.CreateAPIView):
@@ -155,6 +96,7 @@ class ComplaintQueueView(generics.ListAPIView):
     serializer_class = ComplaintSerializer
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_CADET, ROLE_POLICE_OFFICER, ROLE_PATROL_OFFICER, ROLE_SYSTEM_ADMIN]
+    query_budget = 5
 
     @extend_schema(
         request=None,
@@ -175,11 +117,23 @@ class ComplaintQueueView(generics.ListAPIView):
 
         return super().get(request, *args, **kwargs)
 
-    def get_queryset(self):
-        user = self.request.user
+    def get_pagination_ordering(self):
+        if self._get_ordering() == "created_at":
+            return ("created_at", "id")
+        return ("-created_at", "-id")
+
+    def _get_ordering(self):
         ordering = self.request.query_params.get("ordering", "-created_at")
         if ordering not in ("created_at", "-created_at"):
             ordering = "-created_at"
+        return ordering
+
+    def get_queryset(self):
+        return self._get_queue_queryset().prefetch_related("complainants")
+
+    def _get_queue_queryset(self):
+        user = self.request.user
+        ordering = self._get_ordering()
         status_filter = self.request.query_params.get("status")
         if user_has_role(user, [ROLE_SYSTEM_ADMIN]):
             queryset = Complaint.objects.all()
@@ -188,10 +142,13 @@ class ComplaintQueueView(generics.ListAPIView):
             return queryset.order_by(ordering)
         if user_has_role(user, [ROLE_CADET]):
             cadet_statuses = [ComplaintStatus.PENDING_CADET_REVIEW, ComplaintStatus.RETURNED_TO_CADET]
-            queryset = Complaint.objects.filter(status__in=cadet_statuses).filter(
-                Q(assigned_cadet__isnull=True, status=ComplaintStatus.PENDING_CADET_REVIEW)
-                | Q(assigned_cadet=user)
-            )
+            # Unassigned complaints and the cadet's own in each status are separate ranges of
+            # cases_cmpl_status_cadet_idx.
+            branches = [
+                Complaint.objects.filter(assigned_cadet__isnull=True, status=ComplaintStatus.PENDING_CADET_REVIEW)
+            ]
+            branches += [Complaint.objects.filter(assigned_cadet=user, status=cadet_status) for cadet_status in cadet_statuses]
+            queryset = UnionQuery(Complaint, [(branch, {}) for branch in branches])
             if status_filter:
                 queryset = queryset.filter(status=status_filter)
             return queryset.order_by(ordering)
@@ -230,6 +187,7 @@ class CadetReviewView(APIView):
     required_roles = [ROLE_CADET]
 
     @extend_schema(request=CadetReviewSerializer, responses={200: ComplaintSerializer})
+    @transaction.atomic
     def post(self, request, id):
         """Approve a complaint for officer review or return it to the complainant with a correction message."""
 
@@ -257,10 +215,9 @@ class CadetReviewView(APIView):
             complaint.assigned_officer = None
             changed_fields.extend(["strike_count", "status", "last_message", "assigned_officer"])
             notification_type = "complaint_voided" if complaint.status == ComplaintStatus.VOIDED else "complaint_returned"
-            Notification.objects.create(
-                user=complaint.created_by,
-                case=None,
-                type=notification_type,
+            notify(
+                complaint.created_by_id,
+                notification_type,
                 payload={
                     "complaint_id": complaint.id,
                     "message": message,
@@ -279,10 +236,9 @@ class CadetReviewView(APIView):
             complaint.last_message = ""
             complaint.assigned_officer = officer
             changed_fields.extend(["status", "last_message", "assigned_officer"])
-            Notification.objects.create(
-                user=officer,
-                case=None,
-                type="complaint_forwarded_to_officer",
+            notify(
+                officer,
+                "complaint_forwarded_to_officer",
                 payload={"complaint_id": complaint.id, "cadet_id": request.user.id},
             )
         complaint.save(update_fields=changed_fields + ["updated_at"])
@@ -295,6 +251,7 @@ class OfficerReviewView(APIView):
     required_roles = [ROLE_POLICE_OFFICER, ROLE_PATROL_OFFICER]
 
     @extend_schema(request=OfficerReviewSerializer, responses={200: ComplaintSerializer})
+    @transaction.atomic
     def post(self, request, id):
         """Approve a complaint into a case or return it to the cadet for re-evaluation."""
 
@@ -322,10 +279,9 @@ class OfficerReviewView(APIView):
             complaint.status = ComplaintStatus.RETURNED_TO_CADET
             complaint.last_message = message
             complaint.save(update_fields=["status", "last_message", "updated_at"])
-            Notification.objects.create(
-                user=complaint.assigned_cadet,
-                case=None,
-                type="complaint_returned_to_cadet",
+            notify(
+                complaint.assigned_cadet_id,
+                "complaint_returned_to_cadet",
                 payload={"complaint_id": complaint.id, "message": message, "officer_id": request.user.id},
             )
             CaseReview.objects.create(complaint=complaint, reviewer=request.user, decision=action, message=message)
@@ -371,7 +327,7 @@ class OfficerReviewView(APIView):
             created_by=request.user,
             complaint=complaint,
         )
-        approved_complainants.update(case=case, is_verified=True)
+        approved_complainants.update(case=case, is_verified=True, updated_at=timezone.now())
         CaseAssignment.objects.get_or_create(case=case, user=request.user, role_in_case=CaseAssignmentRole.OFFICER)
         CaseReview.objects.create(complaint=complaint, reviewer=request.user, decision=action, message=message)
         return Response(ComplaintSerializer(complaint).data, status=status.HTTP_200_OK)
@@ -382,6 +338,7 @@ class CrimeSceneCreateView(APIView):
     required_roles = [ROLE_POLICE_OFFICER, ROLE_PATROL_OFFICER, ROLE_DETECTIVE, ROLE_SERGEANT, ROLE_CAPTAIN, ROLE_POLICE_CHIEF]
 
     @extend_schema(request=CrimeSceneReportSerializer, responses={201: CrimeSceneActionResponseSerializer})
+    @transaction.atomic
     def post(self, request):
         """Create a new case directly from a field crime-scene report and its witness records."""
 
@@ -409,6 +366,13 @@ class CrimeSceneCreateView(APIView):
         )
         for witness in serializer.validated_data["witnesses"]:
             report.witnesses.create(**witness)
+        if required_role_slug:
+            notify_role(
+                required_role_slug,
+                "crime_scene_pending_approval",
+                case=case,
+                payload={"case_id": case.id, "crime_scene_report_id": report.id, "reported_by": request.user.id},
+            )
         return Response(
             {"case": CaseSerializer(case).data, "crime_scene_report_id": report.id},
             status=status.HTTP_201_CREATED,
@@ -468,9 +432,11 @@ class CaseListView(generics.ListAPIView):
     """List cases accessible to the current user through assignments, ownership, or administrator access."""
 
     serializer_class = CaseSerializer
+    pagination_ordering = ("-created_at", "-id")
+    query_budget = 4
 
     def get_queryset(self):
-        return _case_queryset_for_user(self.request.user)
+        return _case_queryset_for_user(self.request.user).prefetch_related("complainants")
 
 
 class CaseDetailView(generics.RetrieveUpdateAPIView):
@@ -481,6 +447,17 @@ class CaseDetailView(generics.RetrieveUpdateAPIView):
     def get_queryset(self):
         return _case_queryset_for_user(self.request.user)
 
+    def retrieve(self, request, *args, **kwargs):
+        case = self.get_object()
+        complainants = collection_fingerprint(CaseComplainant.objects.filter(case=case), "updated_at")
+        last_modified = max(filter(None, [case.updated_at, dict(complainants)["modified"]]))
+        return conditional_response(
+            request,
+            lambda: Response(self.get_serializer(case).data),
+            make_etag("case", case.pk, case.updated_at, complainants),
+            last_modified=last_modified,
+        )
+
     def update(self, request, *args, **kwargs):
         case = self.get_object()
         if not user_has_role(request.user, list(POLICE_ROLES)):
@@ -561,7 +538,7 @@ class ComplainantReviewView(APIView):
             complainant.verification_status = CaseComplainant.VerificationStatus.REJECTED
             complainant.is_verified = False
             complainant.review_message = message
-        complainant.save(update_fields=["verification_status", "is_verified", "review_message"])
+        complainant.save(update_fields=["verification_status", "is_verified", "review_message", "updated_at"])
         return Response(CaseComplainantSerializer(complainant).data, status=status.HTTP_200_OK)
 
 
@@ -569,13 +546,17 @@ class CaseAssignmentListCreateView(APIView):
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_SERGEANT, ROLE_CAPTAIN, ROLE_POLICE_CHIEF, ROLE_SYSTEM_ADMIN]
 
-    @extend_schema(request=None, responses={200: CaseAssignmentSerializer(many=True)})
+    pagination_ordering = ("assigned_at", "id")
+
+    @extend_schema(request=None, parameters=PAGINATION_PARAMETERS, responses={200: CaseAssignmentSerializer(many=True)})
     def get(self, request, case_id):
         """List current case assignments so managers can review the active investigation team."""
 
         case = get_object_or_404(Case, id=case_id)
-        assignments = CaseAssignment.objects.filter(case=case).select_related("user")
-        return Response(CaseAssignmentSerializer(assignments, many=True).data, status=status.HTTP_200_OK)
+        assignments = CaseAssignment.objects.filter(case=case).select_related("user").order_by(*self.pagination_ordering)
+        return paginated_response(
+            request, self, assignments, lambda rows: CaseAssignmentSerializer(rows, many=True).data
+        )
 
     @extend_schema(request=CaseAssignmentUpsertSerializer, responses={200: CaseAssignmentSerializer, 201: CaseAssignmentSerializer})
     def post(self, request, case_id):
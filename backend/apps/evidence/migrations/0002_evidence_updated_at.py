@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evidence', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='evidence',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -16,6 +16,7 @@ class Evidence(models.Model):
     description = models.TextField(blank=True)
     evidence_type = models.CharField(max_length=50, choices=EvidenceType.choices)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name="evidence_created")
 
     def __str__(self):
@@ -86,6 +86,14 @@ class EvidenceSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "created_by")
 
 
+def with_evidence_details(queryset):
+    """Load the subtype rows and media EvidenceSerializer reads, so listing stays at a fixed query count."""
+
+    return queryset.select_related("witness_statement", "medical", "vehicle", "identity_document").prefetch_related(
+        "witness_statement__media", "medical__images"
+    )
+
+
 class EvidenceCreateSerializer(serializers.Serializer):
     evidence_type = serializers.ChoiceField(choices=EvidenceType.choices)
     title = serializers.CharField()
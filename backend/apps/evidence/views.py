@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.response import Response
@@ -17,7 +18,7 @@ from apps.rbac.constants import (
 from apps.rbac.utils import user_has_role
 from apps.cases.models import Case, CaseAssignment
 from apps.cases.policies import can_user_access_case
-from apps.notifications.models import Notification
+from apps.notifications.dispatch import notify
 from .models import (
     Evidence,
     EvidenceType,
@@ -28,7 +29,9 @@ from .models import (
     VehicleEvidence,
     IdentityDocumentEvidence,
 )
-from .serializers import EvidenceSerializer, EvidenceCreateSerializer
+from .serializers import EvidenceSerializer, EvidenceCreateSerializer, with_evidence_details
+from police_portal.conditional import collection_fingerprint, conditional_response, make_etag
+from police_portal.pagination import PAGINATION_PARAMETERS, paginated_response
 
 
 ALLOWED_EVIDENCE_ROLES = [
@@ -46,8 +49,11 @@ ALLOWED_EVIDENCE_ROLES = [
 class EvidenceListCreateView(APIView):
     permission_classes = [RoleRequiredPermission]
     required_roles = ALLOWED_EVIDENCE_ROLES
+    pagination_ordering = ("created_at", "id")
+    query_budget = {"GET": 8}
 
     @extend_schema(request=EvidenceCreateSerializer, responses={201: EvidenceSerializer})
+    @transaction.atomic
     def post(self, request, case_id):
         """Register new evidence for an accessible case, including witness, medical, vehicle, and document variants."""
 
@@ -106,7 +112,7 @@ class EvidenceListCreateView(APIView):
         self._notify_detectives(case, evidence)
         return Response(EvidenceSerializer(evidence).data, status=status.HTTP_201_CREATED)
 
-    @extend_schema(request=None, responses={200: EvidenceSerializer(many=True)})
+    @extend_schema(request=None, parameters=PAGINATION_PARAMETERS, responses={200: EvidenceSerializer(many=True)})
     def get(self, request, case_id):
         """List evidence for a case and optionally filter by evidence type."""
 
@@ -127,18 +133,20 @@ class EvidenceListCreateView(APIView):
         evidence_type = request.query_params.get("type")
         if evidence_type:
             queryset = queryset.filter(evidence_type=evidence_type)
-        data = EvidenceSerializer(queryset, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        # Evidence writes are atomic and bump updated_at, which covers subtype and media edits.
+        etag = make_etag("evidence", case.pk, collection_fingerprint(queryset, "updated_at"))
+        queryset = with_evidence_details(queryset).order_by(*self.pagination_ordering)
+        return conditional_response(
+            request,
+            lambda: paginated_response(request, self, queryset, lambda rows: EvidenceSerializer(rows, many=True).data),
+            etag,
+        )
 
     def _notify_detectives(self, case, evidence):
-        detective_assignments = CaseAssignment.objects.filter(case=case, role_in_case="detective")
-        for assignment in detective_assignments:
-            Notification.objects.create(
-                user=assignment.user,
-                case=case,
-                type="new_evidence",
-                payload={"evidence_id": evidence.id, "evidence_type": evidence.evidence_type},
-            )
+        detective_ids = CaseAssignment.objects.filter(case=case, role_in_case="detective").values_list("user_id", flat=True)
+        payload = {"evidence_id": evidence.id, "evidence_type": evidence.evidence_type}
+        for detective_id in detective_ids:
+            notify(detective_id, "new_evidence", case=case, payload=payload)
 
 
 class EvidenceDetailView(APIView):
@@ -165,6 +173,7 @@ class EvidenceDetailView(APIView):
         return Response(EvidenceSerializer(evidence).data, status=status.HTTP_200_OK)
 
     @extend_schema(request=EvidenceSerializer, responses={200: EvidenceSerializer})
+    @transaction.atomic
     def patch(self, request, id):
         """Update an evidence record while enforcing subtype-specific validation and role restrictions."""
 
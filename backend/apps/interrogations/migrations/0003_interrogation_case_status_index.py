@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interrogations', '0002_interrogation_captain_reviewed_by'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interrogation',
+            index=models.Index(fields=['case', 'status'], name='interrog_case_status_idx'),
+        ),
+    ]
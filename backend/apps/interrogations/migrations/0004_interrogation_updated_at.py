@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interrogations', '0003_interrogation_case_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interrogation',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -27,4 +27,10 @@ class Interrogation(models.Model):
     chief_decision = models.CharField(max_length=50, blank=True)
     chief_notes = models.TextField(blank=True)
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="pending_detective")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["case", "status"], name="interrog_case_status_idx"),
+        ]
 
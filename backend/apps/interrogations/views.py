@@ -1,4 +1,5 @@
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -9,7 +10,7 @@ from apps.cases.models import Case
 from apps.cases.constants import CrimeLevel, CaseStatus
 from apps.cases.policies import is_user_assigned_to_case
 from apps.suspects.models import Person
-from apps.notifications.models import Notification
+from apps.notifications.dispatch import notify
 from .models import Interrogation
 from .serializers import (
     InterrogationSerializer,
@@ -148,6 +149,7 @@ class ChiefDecisionView(APIView):
     required_roles = [ROLE_POLICE_CHIEF]
 
     @extend_schema(request=ChiefDecisionSerializer, responses={200: InterrogationSerializer})
+    @transaction.atomic
     def post(self, request, id):
         """Record the chief of police decision for a critical-crime interrogation."""
 
@@ -180,10 +182,10 @@ class ChiefDecisionView(APIView):
         else:
             interrogation.status = "pending_captain"
             if interrogation.captain_reviewed_by_id:
-                Notification.objects.create(
-                    user=interrogation.captain_reviewed_by,
-                    case=interrogation.case,
-                    type="chief_rejected_interrogation_decision",
+                notify(
+                    interrogation.captain_reviewed_by_id,
+                    "chief_rejected_interrogation_decision",
+                    case=interrogation.case_id,
                     payload={
                         "interrogation_id": interrogation.id,
                         "chief_notes": interrogation.chief_notes,
@@ -0,0 +1,139 @@
+import atexit
+import logging
+import queue
+import threading
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from .models import Notification
+from .stream import broker
+from .utils import count_new_notifications
+
+
+logger = logging.getLogger("apps.notifications")
+
+BULK_BATCH_SIZE = 500
+
+# Notifications committed during the current request. The scope is opened by
+# NotificationDispatchMiddleware; outside of it committed notifications are written at once.
+_request_batch = ContextVar("notifications_request_batch", default=None)
+
+
+def begin_request_batch():
+    return _request_batch.set([])
+
+
+def end_request_batch(token):
+    """Close the request scope and dispatch everything it collected with one bulk insert."""
+
+    batch = _request_batch.get()
+    _request_batch.reset(token)
+    dispatch(batch)
+
+
+def notify(user, type, case=None, payload=None):
+    """Queue a notification for ``user`` (a user or user id); it is written only if the current transaction commits."""
+
+    notification = Notification(
+        user_id=getattr(user, "pk", user),
+        case_id=getattr(case, "pk", case),
+        type=type,
+        payload=payload or {},
+    )
+    transaction.on_commit(lambda: _committed(notification))
+    return notification
+
+
+def notify_role(role_slug, type, case=None, payload=None):
+    """Queue one broadcast for every holder of ``role_slug``; the write does not grow with the role's size."""
+
+    notification = Notification(
+        role_slug=role_slug,
+        case_id=getattr(case, "pk", case),
+        type=type,
+        payload=payload or {},
+    )
+    transaction.on_commit(lambda: _committed(notification))
+    return notification
+
+
+def _committed(notification):
+    batch = _request_batch.get()
+    if batch is None:
+        dispatch([notification])
+    else:
+        batch.append(notification)
+
+
+def dispatch(notifications):
+    if not notifications:
+        return
+    if settings.NOTIFICATIONS_BACKGROUND_FLUSH:
+        flusher.submit(notifications)
+        return
+    try:
+        write_notifications(notifications)
+    except Exception:
+        # The work that produced them is already committed; failing the response here
+        # would invite a retry that repeats it, or hide the view's own exception.
+        logger.exception("Failed to write %d notifications", len(notifications))
+
+
+def write_notifications(notifications):
+    with transaction.atomic():
+        created = Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE)
+        count_new_notifications(created)
+        user_ids = {notification.user_id for notification in created if notification.user_id is not None}
+        role_slugs = {notification.role_slug for notification in created if notification.role_slug}
+        transaction.on_commit(lambda: broker.publish(user_ids, role_slugs))
+    return created
+
+
+class BackgroundFlusher:
+    """Write dispatched notifications from a daemon thread, coalescing whatever queued up meanwhile."""
+
+    def __init__(self, write=write_notifications):
+        self._write = write
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, notifications):
+        self._start()
+        self._queue.put(list(notifications))
+
+    def drain(self):
+        """Block until every submitted notification has been written."""
+
+        self._queue.join()
+
+    def _start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Started lazily so pre-forking servers start one flusher per worker.
+            self._thread = threading.Thread(target=self._run, name="notifications-flusher", daemon=True)
+            self._thread.start()
+        atexit.register(self.drain)
+
+    def _run(self):
+        while True:
+            batches = [self._queue.get()]
+            while True:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write([notification for batch in batches for notification in batch])
+            except Exception:
+                logger.exception("Failed to write %d notification batches", len(batches))
+            finally:
+                close_old_connections()
+                for _ in batches:
+                    self._queue.task_done()
+
+
+flusher = BackgroundFlusher()
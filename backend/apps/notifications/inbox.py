@@ -0,0 +1,117 @@
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from apps.rbac.models import UserRole
+from police_portal.unions import UnionQuery
+from .models import Notification, NotificationReceipt
+from .utils import get_unread_count
+
+
+RECEIPT_BATCH_SIZE = 500
+
+
+def _granted_at(user_id, role_slug):
+    return Subquery(UserRole.objects.filter(user_id=user_id, role__slug=role_slug).values("assigned_at")[:1])
+
+
+def _role_broadcasts_q(user_id, role_slug):
+    # Only broadcasts sent since the user was granted the role; a new holder does not
+    # inherit the role's backlog. The grant time is one value per role, so the bound is a
+    # range on notif_role_created_idx rather than a check per row.
+    return Q(user__isnull=True, role_slug=role_slug, created_at__gte=_granted_at(user_id, role_slug))
+
+
+def _broadcasts_q(user_id, role_slugs):
+    q = Q(pk__in=[])
+    for role_slug in sorted(role_slugs):
+        q |= _role_broadcasts_q(user_id, role_slug)
+    return q
+
+
+def _receipt_read_at(user_id):
+    receipts = NotificationReceipt.objects.filter(notification=OuterRef("pk"), user_id=user_id)
+    return Subquery(receipts.values("read_at")[:1])
+
+
+def inbox_q(user_id, role_slugs):
+    """Match the user's direct notifications and the broadcasts to any of their roles sent since they got it."""
+
+    q = Q(user_id=user_id)
+    if role_slugs:
+        q |= _broadcasts_q(user_id, role_slugs)
+    return q
+
+
+def inbox_queryset(user_id, role_slugs):
+    """Direct and broadcast notifications of one user as one filtered queryset, for lookups by id.
+
+    ``user_read_at`` holds the user's read time for both kinds: the row's own ``read_at``
+    for direct notifications and their receipt for broadcasts. Listings go through
+    inbox_notifications() instead, which reads each kind through its own index.
+    """
+
+    return Notification.objects.filter(inbox_q(user_id, role_slugs)).annotate(
+        user_read_at=Coalesce("read_at", _receipt_read_at(user_id))
+    )
+
+
+def inbox_notifications(user_id, role_slugs):
+    """Direct and broadcast notifications of one user, rows annotated with ``user_read_at``.
+
+    Direct notifications and the broadcasts of each role are separate branches of a
+    UnionQuery, read along notif_user_created_idx and notif_role_created_idx.
+    """
+
+    branches = [(Notification.objects.filter(user_id=user_id), {"user_read_at": F("read_at")})]
+    branches.extend(
+        (
+            Notification.objects.filter(_role_broadcasts_q(user_id, role_slug)),
+            {"user_read_at": _receipt_read_at(user_id)},
+        )
+        for role_slug in sorted(role_slugs)
+    )
+    return UnionQuery(Notification, branches)
+
+
+def latest_inbox_notification_id(user_id, role_slugs):
+    """Id of the newest notification in the user's inbox, or 0; ids follow creation order."""
+
+    latest = inbox_notifications(user_id, role_slugs).order_by("-created_at", "-id")[:1]
+    return latest[0].id if latest else 0
+
+
+def _unread_broadcasts(user_id, role_slugs):
+    return Notification.objects.filter(_broadcasts_q(user_id, role_slugs)).exclude(
+        receipts__user_id=user_id
+    )
+
+
+def unread_broadcast_count(user_id, role_slugs):
+    if not role_slugs:
+        return 0
+    return _unread_broadcasts(user_id, role_slugs).count()
+
+
+def inbox_unread_count(user_id, role_slugs):
+    """Unread direct notifications from the user's counter plus the broadcasts they have no receipt for."""
+
+    return get_unread_count(user_id) + unread_broadcast_count(user_id, role_slugs)
+
+
+def mark_broadcasts_read(user_id, role_slugs, read_at, ids=None, before=None):
+    """Write receipts for the user's unread broadcasts selected by ``ids`` or ``created_at <= before``."""
+
+    if not role_slugs:
+        return 0
+    broadcasts = _unread_broadcasts(user_id, role_slugs)
+    if ids is not None:
+        broadcasts = broadcasts.filter(pk__in=ids)
+    if before is not None:
+        broadcasts = broadcasts.filter(created_at__lte=before)
+    broadcast_ids = list(broadcasts.values_list("pk", flat=True))
+    # A concurrent read of the same broadcast already wrote its receipt; keep that one.
+    NotificationReceipt.objects.bulk_create(
+        [NotificationReceipt(notification_id=pk, user_id=user_id, read_at=read_at) for pk in broadcast_ids],
+        batch_size=RECEIPT_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return len(broadcast_ids)
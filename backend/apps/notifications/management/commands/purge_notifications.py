@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apps.notifications.retention import (
+    ARCHIVE_BATCH_SIZE,
+    archive_read_notifications,
+    purge_broadcasts,
+    retention_cutoff,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move read notifications older than the retention period into the archive and delete older role "
+        "broadcasts, in short batches; safe to run periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.NOTIFICATION_RETENTION_DAYS)
+        parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        before = retention_cutoff(options["days"])
+        archived = archive_read_notifications(before, batch_size=options["batch_size"])
+        self.stdout.write(f"Archived {archived} read notifications older than {options['days']} days.")
+        purged = purge_broadcasts(before, batch_size=options["batch_size"])
+        self.stdout.write(f"Deleted {purged} role broadcasts older than {options['days']} days.")
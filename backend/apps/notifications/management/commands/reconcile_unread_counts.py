@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from apps.notifications.utils import RECONCILE_BATCH_SIZE, reconcile_all_unread_counts
+
+
+class Command(BaseCommand):
+    help = "Recount every user's unread notifications and repair counters that drifted; safe to run periodically."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=RECONCILE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        changed = reconcile_all_unread_counts(batch_size=options["batch_size"])
+        self.stdout.write(f"Reconciled unread notification counters: {changed} rows changed.")
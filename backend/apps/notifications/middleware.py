@@ -0,0 +1,15 @@
+from .dispatch import begin_request_batch, end_request_batch
+
+
+class NotificationDispatchMiddleware:
+    """Write the notifications a request commits with one bulk insert once it has been handled."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = begin_request_batch()
+        try:
+            return self.get_response(request)
+        finally:
+            end_request_batch(token)
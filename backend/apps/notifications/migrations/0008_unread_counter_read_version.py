@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_widen_role_broadcast_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unreadnotificationcounter',
+            name='read_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
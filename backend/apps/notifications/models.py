@@ -1,14 +1,95 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 
 
 class Notification(models.Model):
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications")
+    """A notification for one user, or a broadcast to every holder of ``role_slug`` when ``user`` is empty.
+
+    Broadcasts are stored once; each user's read state for them lives in a NotificationReceipt.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, related_name="notifications"
+    )
+    role_slug = models.SlugField(max_length=150, blank=True, default="", db_index=False)
     case = models.ForeignKey("cases.Case", on_delete=models.SET_NULL, null=True, blank=True, related_name="notifications")
     type = models.CharField(max_length=50)
     payload = models.JSONField(default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
     read_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"], name="notif_user_created_idx"),
+            models.Index(
+                fields=["role_slug", "-created_at", "-id"], name="notif_role_created_idx", condition=Q(user__isnull=True)
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(user__isnull=False, role_slug="") | (Q(user__isnull=True) & ~Q(role_slug="")),
+                name="notif_user_or_role",
+            ),
+        ]
+
     def __str__(self):
         return f"Notification {self.id}"
+
+
+class NotificationReceipt(models.Model):
+    """One user's read state for a broadcast notification, created when they read it."""
+
+    notification = models.ForeignKey(Notification, on_delete=models.CASCADE, related_name="receipts")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notification_receipts")
+    read_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["notification", "user"], name="notif_receipt_unique"),
+        ]
+
+    def __str__(self):
+        return f"Receipt {self.notification_id}:{self.user_id}"
+
+
+class UnreadNotificationCounter(models.Model):
+    """Number of unread notifications per user, maintained by apps.notifications.utils.
+
+    ``read_version`` grows whenever the user reads notifications or some leave their
+    inbox, so together with the count and the newest id it validates the inbox listing.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="unread_notification_counter",
+    )
+    count = models.PositiveIntegerField(default=0)
+    read_version = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.count} unread"
+
+
+class NotificationArchive(models.Model):
+    """Read notifications moved out of the hot table by apps.notifications.retention; ids are kept."""
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_notifications")
+    case = models.ForeignKey(
+        "cases.Case", on_delete=models.SET_NULL, null=True, blank=True, related_name="archived_notifications"
+    )
+    type = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField()
+    read_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="notif_archive_user_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"Archived notification {self.id}"
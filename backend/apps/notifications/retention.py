@@ -0,0 +1,76 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .models import Notification, NotificationArchive, NotificationReceipt
+from .utils import bump_read_versions
+
+
+ARCHIVE_BATCH_SIZE = 1000
+
+ARCHIVED_FIELDS = ("id", "user_id", "case_id", "type", "payload", "created_at", "read_at")
+
+
+def retention_cutoff(days=None, now=None):
+    days = settings.NOTIFICATION_RETENTION_DAYS if days is None else days
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+def archive_read_notifications(before, batch_size=ARCHIVE_BATCH_SIZE):
+    """Move read notifications created before ``before`` into the archive; returns how many moved.
+
+    Rows are walked in primary-key order and each batch is copied and deleted in its own
+    short transaction, so only the rows being moved are ever locked. Unread notifications
+    stay in the hot table whatever their age, so unread counters are unaffected. Role
+    broadcasts keep ``read_at`` empty, their read state living in receipts; purge_broadcasts()
+    removes them instead.
+    """
+
+    archived = 0
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Notification.objects.select_for_update()
+                .filter(pk__gt=last_id, read_at__isnull=False, created_at__lt=before)
+                .order_by("pk")
+                .values(*ARCHIVED_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return archived
+            # Ignoring conflicts keeps a rerun after an interrupted purge harmless.
+            NotificationArchive.objects.bulk_create([NotificationArchive(**row) for row in rows], ignore_conflicts=True)
+            Notification.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+            bump_read_versions({row["user_id"] for row in rows})
+        archived += len(rows)
+        last_id = rows[-1]["id"]
+
+
+def purge_broadcasts(before, batch_size=ARCHIVE_BATCH_SIZE):
+    """Delete role broadcasts created before ``before``, with their receipts; returns how many went.
+
+    A broadcast has no single owner whose history could keep it, and unread broadcasts
+    are counted from the table rather than a counter, so they are dropped read or not.
+    Batches are deleted in pk order in their own transactions, like the archive.
+    """
+
+    purged = 0
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                Notification.objects.select_for_update()
+                .filter(pk__gt=last_id, user__isnull=True, created_at__lt=before)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            NotificationReceipt.objects.filter(notification_id__in=ids).delete()
+            Notification.objects.filter(pk__in=ids).delete()
+        purged += len(ids)
+        last_id = ids[-1]
+    # Any role holder may have listed the deleted broadcasts.
+    if purged:
+        bump_read_versions()
+    return purged
@@ -1,9 +1,32 @@
 from rest_framework import serializers
-from .models import Notification
+from .models import Notification, NotificationArchive
 
 
 class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Notification
+        fields = ("id", "case", "role_slug", "type", "payload", "created_at", "read_at")
+        read_only_fields = fields
+
+
+class InboxNotificationSerializer(NotificationSerializer):
+    """Serialize rows from inbox_notifications(), reporting the reader's own read time for broadcasts too."""
+
+    read_at = serializers.DateTimeField(source="user_read_at", read_only=True, allow_null=True)
+
+
+class NotificationArchiveSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = NotificationArchive
         fields = ("id", "case", "type", "payload", "created_at", "read_at")
         read_only_fields = fields
+
+
+class NotificationBulkReadSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False, max_length=1000)
+    before = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("before" in attrs):
+            raise serializers.ValidationError("Provide either ids or before")
+        return attrs
@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from .models import Notification
+from .stream import broker
+from .utils import adjust_unread_counts
+
+
+# Bulk inserts and queryset updates bypass these receivers; apps.notifications.dispatch
+# and mark_notifications_read maintain counters and streams for those paths themselves.
+
+
+def _unread_owner(instance):
+    # Read from __dict__ so deferred fields are never fetched just to fill the snapshot.
+    if instance.__dict__.get("read_at") is None:
+        return instance.__dict__.get("user_id")
+    return None
+
+
+@receiver(post_init, sender=Notification)
+def remember_unread_owner(sender, instance, **kwargs):
+    instance._unread_owner = _unread_owner(instance)
+
+
+@receiver(post_save, sender=Notification)
+def count_saved_notification(sender, instance, created, **kwargs):
+    owner = _unread_owner(instance)
+    previous = None if created else instance._unread_owner
+    if owner != previous:
+        deltas = {}
+        if previous is not None:
+            deltas[previous] = -1
+        if owner is not None:
+            deltas[owner] = deltas.get(owner, 0) + 1
+        adjust_unread_counts(deltas)
+    instance._unread_owner = owner
+    if created:
+        user_ids = [] if instance.user_id is None else [instance.user_id]
+        role_slugs = [instance.role_slug] if instance.role_slug else []
+        transaction.on_commit(lambda: broker.publish(user_ids, role_slugs))
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_deleted_notification(sender, instance, **kwargs):
+    if instance._unread_owner is not None:
+        adjust_unread_counts({instance._unread_owner: -1})
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import threading
+import time
+from collections import defaultdict
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from rest_framework.utils.encoders import JSONEncoder
+from .inbox import inbox_notifications, latest_inbox_notification_id
+from .serializers import InboxNotificationSerializer
+
+
+STREAM_BATCH_SIZE = 100
+# Delay EventSource clients wait before reconnecting, in milliseconds.
+RECONNECT_DELAY_MS = 5000
+
+
+class Subscription:
+    """One connected stream. ``wake`` may be called from any thread."""
+
+    def __init__(self, user_id, loop, role_slugs=()):
+        self.user_id = user_id
+        self.role_slugs = frozenset(role_slugs)
+        self._loop = loop
+        self._event = asyncio.Event()
+
+    def wake(self):
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # The stream's event loop is already closed.
+            pass
+
+    async def wait(self, timeout):
+        """Return True when woken within ``timeout`` seconds; wake-ups that arrive meanwhile coalesce."""
+
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+
+class NotificationBroker:
+    """In-process pub/sub waking the streams of users who just received notifications.
+
+    It carries no payload: woken streams read the new rows from the database, which
+    also delivers notifications committed by other processes on the next poll.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, user_id, role_slugs=()):
+        subscription = Subscription(user_id, asyncio.get_running_loop(), role_slugs)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_ids, role_slugs=()):
+        """Wake the streams of ``user_ids`` and, for broadcasts, of every holder of ``role_slugs``."""
+
+        role_slugs = frozenset(role_slugs)
+        with self._lock:
+            subscriptions = {
+                subscription
+                for user_id in set(user_ids)
+                for subscription in self._subscriptions.get(user_id, ())
+            }
+            if role_slugs:
+                subscriptions.update(
+                    subscription
+                    for user_subscriptions in self._subscriptions.values()
+                    for subscription in user_subscriptions
+                    if subscription.role_slugs & role_slugs
+                )
+        for subscription in subscriptions:
+            subscription.wake()
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+broker = NotificationBroker()
+
+
+def _latest_notification_id(user_id, role_slugs):
+    close_old_connections()
+    return latest_inbox_notification_id(user_id, role_slugs)
+
+
+def _notifications_after(user_id, role_slugs, last_id):
+    close_old_connections()
+    rows = inbox_notifications(user_id, role_slugs).filter(id__gt=last_id).order_by("id")[:STREAM_BATCH_SIZE]
+    return InboxNotificationSerializer(rows, many=True).data
+
+
+def format_event(notification):
+    data = json.dumps(notification, cls=JSONEncoder)
+    return f"id: {notification['id']}\nevent: notification\ndata: {data}\n\n"
+
+
+async def notification_events(user_id, last_event_id=None, max_duration=None, role_slugs=()):
+    """Yield server-sent events for the user's notifications, including broadcasts to ``role_slugs``, with ids above a high-water mark.
+
+    The mark starts at ``last_event_id`` when resuming, otherwise at the newest existing
+    notification. Streams read the database when the broker wakes them and at least every
+    NOTIFICATION_STREAM_POLL_INTERVAL seconds, and send a comment line as keepalive after
+    NOTIFICATION_STREAM_HEARTBEAT idle seconds. With ``max_duration`` the stream ends after
+    that many seconds and the client reconnects.
+    """
+
+    deadline = None if max_duration is None else time.monotonic() + max_duration
+    subscription = broker.subscribe(user_id, role_slugs)
+    try:
+        if last_event_id is None:
+            high_water = await sync_to_async(_latest_notification_id)(user_id, role_slugs)
+        else:
+            high_water = last_event_id
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        pending = last_event_id is not None
+        polled_at = time.monotonic()
+        while True:
+            if pending:
+                notifications = await sync_to_async(_notifications_after)(user_id, role_slugs, high_water)
+                polled_at = time.monotonic()
+                for notification in notifications:
+                    high_water = notification["id"]
+                    yield format_event(notification)
+                if len(notifications) == STREAM_BATCH_SIZE:
+                    continue
+            timeout = settings.NOTIFICATION_STREAM_HEARTBEAT
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    return
+            woken = await subscription.wait(timeout)
+            if not woken:
+                yield ": keepalive\n\n"
+            pending = woken or time.monotonic() - polled_at >= settings.NOTIFICATION_STREAM_POLL_INTERVAL
+    finally:
+        broker.unsubscribe(subscription)
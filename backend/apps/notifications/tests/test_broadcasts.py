@@ -0,0 +1,170 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.cases.constants import CrimeLevel
+from apps.notifications.dispatch import notify, notify_role
+from apps.notifications.models import Notification, NotificationReceipt
+from apps.rbac.constants import ROLE_CAPTAIN, ROLE_DETECTIVE, ROLE_SERGEANT
+from apps.rbac.models import Role, UserRole
+
+
+def create_user(username, role_slug):
+    user = User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        phone=f"{username}123",
+        national_id=f"{username}nid",
+        password="Pass1234!",
+        first_name="Broadcast",
+        last_name="User",
+    )
+    role, _ = Role.objects.get_or_create(slug=role_slug, defaults={"name": role_slug, "is_system": True})
+    UserRole.objects.create(user=user, role=role)
+    return user
+
+
+class BroadcastNotificationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.captains = [create_user(f"broadcast_captain_{index}", ROLE_CAPTAIN) for index in range(3)]
+        self.captain = self.captains[0]
+        self.detective = create_user("broadcast_detective", ROLE_DETECTIVE)
+        # Tests backdate broadcasts; keep them inside every holder's tenure.
+        UserRole.objects.update(assigned_at=timezone.now() - timedelta(days=30))
+
+    def inbox(self, user, **params):
+        self.client.force_authenticate(user)
+        res = self.client.get("/api/v1/notifications/", params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.data
+
+    def unread(self, user):
+        self.client.force_authenticate(user)
+        return self.client.get("/api/v1/notifications/unread-count/").data["unread"]
+
+    def test_pending_crime_scene_is_one_row_for_every_captain(self):
+        sergeant = create_user("broadcast_sergeant", ROLE_SERGEANT)
+        self.client.force_authenticate(sergeant)
+        with CaptureQueriesContext(connection) as captured:
+            with self.captureOnCommitCallbacks(execute=True):
+                res = self.client.post(
+                    "/api/v1/cases/crime-scene/",
+                    {
+                        "title": "Warehouse fire",
+                        "description": "Desc",
+                        "crime_level": CrimeLevel.LEVEL_2,
+                        "location": "Loc",
+                        "scene_datetime": timezone.now().isoformat(),
+                        "witnesses": [],
+                    },
+                    format="json",
+                )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        inserts = [query for query in captured.captured_queries if query["sql"].startswith('INSERT INTO "notifications_notification"')]
+        self.assertEqual(len(inserts), 1)
+        broadcast = Notification.objects.get()
+        self.assertEqual((broadcast.user_id, broadcast.role_slug), (None, ROLE_CAPTAIN))
+        self.assertEqual(broadcast.payload["crime_scene_report_id"], res.data["crime_scene_report_id"])
+
+        for captain in self.captains:
+            items = self.inbox(captain)
+            self.assertEqual([(item["type"], item["role_slug"], item["read_at"]) for item in items], [("crime_scene_pending_approval", ROLE_CAPTAIN, None)])
+        self.assertEqual(self.inbox(self.detective), [])
+        self.assertEqual(self.inbox(sergeant), [])
+
+    def test_inbox_merges_direct_and_broadcast_items_in_one_ordering(self):
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            notify(self.captain, "direct_old")
+            notify_role(ROLE_CAPTAIN, "broadcast_middle")
+            notify_role(ROLE_DETECTIVE, "other_role")
+            notify(self.captain, "direct_new")
+        for age, type in enumerate(["direct_new", "broadcast_middle", "direct_old"]):
+            Notification.objects.filter(type=type).update(created_at=now - timedelta(minutes=age))
+
+        page = self.inbox(self.captain, page_size=2)
+        self.assertEqual([item["type"] for item in page["results"]], ["direct_new", "broadcast_middle"])
+        res = self.client.get(page["next"])
+        self.assertEqual([item["type"] for item in res.data["results"]], ["direct_old"])
+        self.assertEqual([item["type"] for item in self.inbox(self.captains[1])], ["broadcast_middle"])
+
+    def test_receipts_track_each_reader_of_a_broadcast(self):
+        broadcast = Notification.objects.create(role_slug=ROLE_CAPTAIN, type="broadcast")
+        earlier = Notification.objects.create(role_slug=ROLE_CAPTAIN, type="earlier")
+        Notification.objects.filter(pk=earlier.pk).update(created_at=timezone.now() - timedelta(days=1))
+        Notification.objects.create(user=self.captain, type="direct")
+        self.assertEqual(self.unread(self.captain), 3)
+
+        self.client.force_authenticate(self.captain)
+        res = self.client.post(f"/api/v1/notifications/{broadcast.id}/read/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(res.data["read_at"])
+        first_read_at = res.data["read_at"]
+        res = self.client.post(f"/api/v1/notifications/{broadcast.id}/read/")
+        self.assertEqual(res.data["read_at"], first_read_at)
+        self.assertEqual(NotificationReceipt.objects.filter(notification=broadcast).count(), 1)
+        broadcast.refresh_from_db()
+        self.assertIsNone(broadcast.read_at)
+        self.assertEqual(self.unread(self.captain), 2)
+        self.assertEqual(self.unread(self.captains[1]), 2)
+
+        self.client.force_authenticate(self.detective)
+        res = self.client.post(f"/api/v1/notifications/{broadcast.id}/read/")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(self.captains[1])
+        res = self.client.post("/api/v1/notifications/read/", {"before": (timezone.now() - timedelta(hours=1)).isoformat()}, format="json")
+        self.assertEqual(res.data, {"updated": 1, "unread": 1})
+        items = {item["type"]: item["read_at"] for item in self.inbox(self.captains[1])}
+        self.assertIsNotNone(items["earlier"])
+        self.assertIsNone(items["broadcast"])
+
+    def test_new_role_holder_only_sees_broadcasts_sent_since_the_grant(self):
+        backlog = Notification.objects.create(role_slug=ROLE_CAPTAIN, type="backlog")
+        Notification.objects.filter(pk=backlog.pk).update(created_at=timezone.now() - timedelta(days=1))
+        newcomer = create_user("broadcast_new_captain", ROLE_CAPTAIN)
+        Notification.objects.create(role_slug=ROLE_CAPTAIN, type="since_grant")
+
+        self.assertEqual([item["type"] for item in self.inbox(newcomer)], ["since_grant"])
+        self.assertEqual(self.unread(newcomer), 1)
+        self.assertEqual(self.unread(self.captain), 2)
+
+        self.client.force_authenticate(newcomer)
+        res = self.client.post(f"/api/v1/notifications/{backlog.id}/read/")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        res = self.client.post("/api/v1/notifications/read/", {"before": timezone.now().isoformat()}, format="json")
+        self.assertEqual(res.data, {"updated": 1, "unread": 0})
+        self.assertFalse(NotificationReceipt.objects.filter(notification=backlog).exists())
+
+    def test_inbox_pages_merge_direct_items_and_every_role_in_order(self):
+        role, _ = Role.objects.get_or_create(slug=ROLE_DETECTIVE, defaults={"name": ROLE_DETECTIVE, "is_system": True})
+        UserRole.objects.create(user=self.captain, role=role)
+        UserRole.objects.filter(user=self.captain).update(assigned_at=timezone.now() - timedelta(days=30))
+        now = timezone.now()
+        expected = []
+        for index in range(7):
+            if index % 3 == 0:
+                notification = Notification.objects.create(user=self.captain, type=f"item_{index}")
+            else:
+                role_slug = ROLE_CAPTAIN if index % 3 == 1 else ROLE_DETECTIVE
+                notification = Notification.objects.create(role_slug=role_slug, type=f"item_{index}")
+            Notification.objects.filter(pk=notification.pk).update(created_at=now - timedelta(minutes=index))
+            expected.append(f"item_{index}")
+        Notification.objects.create(role_slug=ROLE_SERGEANT, type="other_role")
+
+        types = []
+        page = self.inbox(self.captain, page_size=3)
+        while True:
+            types += [item["type"] for item in page["results"]]
+            if not page["next"]:
+                break
+            page = self.client.get(page["next"]).data
+        self.assertEqual(types, expected)
+        self.assertEqual([item["type"] for item in self.inbox(self.captain)], expected)
+        previous = self.client.get(self.inbox(self.captain, page_size=3)["next"]).data["previous"]
+        self.assertEqual([item["type"] for item in self.client.get(previous).data["results"]], expected[:3])
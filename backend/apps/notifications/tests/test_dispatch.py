@@ -0,0 +1,143 @@
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.accounts.models import User
+from apps.cases.constants import CaseSourceType, CaseStatus, CrimeLevel
+from apps.cases.models import Case, CaseAssignment
+from apps.notifications import dispatch
+from apps.notifications.dispatch import BackgroundFlusher, notify
+from apps.notifications.models import Notification
+from apps.rbac.constants import ROLE_DETECTIVE, ROLE_SYSTEM_ADMIN
+from apps.rbac.models import Role, UserRole
+
+
+def create_user(username, role_slug):
+    user = User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        phone=f"{username}123",
+        national_id=f"{username}nid",
+        password="Pass1234!",
+        first_name="Notify",
+        last_name="User",
+    )
+    role, _ = Role.objects.get_or_create(slug=role_slug, defaults={"name": role_slug, "is_system": True})
+    UserRole.objects.create(user=user, role=role)
+    return user
+
+
+def create_case():
+    return Case.objects.create(
+        title="Fan-out case",
+        description="Desc",
+        crime_level=CrimeLevel.LEVEL_2,
+        location="Loc",
+        status=CaseStatus.ACTIVE,
+        source_type=CaseSourceType.COMPLAINT,
+    )
+
+
+class RequestFanOutTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_evidence_fan_out_is_one_insert_after_commit(self):
+        admin = create_user("fanout_admin", ROLE_SYSTEM_ADMIN)
+        case = create_case()
+        detectives = [create_user(f"fanout_detective_{index}", ROLE_DETECTIVE) for index in range(3)]
+        for detective in detectives:
+            CaseAssignment.objects.create(case=case, user=detective, role_in_case="detective")
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        with CaptureQueriesContext(connection) as captured:
+            res = client.post(
+                f"/api/v1/cases/{case.id}/evidence/",
+                {"evidence_type": "other", "title": "Knife", "description": "Found in the alley"},
+                format="json",
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        inserts = [query for query in captured.captured_queries if query["sql"].startswith('INSERT INTO "notifications_notification"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            sorted(Notification.objects.filter(type="new_evidence").values_list("user_id", flat=True)),
+            sorted(detective.pk for detective in detectives),
+        )
+
+
+    def test_failed_notification_write_keeps_the_committed_response(self):
+        admin = create_user("fanout_failure_admin", ROLE_SYSTEM_ADMIN)
+        case = create_case()
+        detective = create_user("fanout_failure_detective", ROLE_DETECTIVE)
+        CaseAssignment.objects.create(case=case, user=detective, role_in_case="detective")
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        with mock.patch.object(dispatch, "write_notifications", side_effect=RuntimeError("database down")):
+            with self.assertLogs("apps.notifications", "ERROR"):
+                res = client.post(
+                    f"/api/v1/cases/{case.id}/evidence/",
+                    {"evidence_type": "other", "title": "Knife", "description": "Found in the alley"},
+                    format="json",
+                )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(case.evidence.filter(title="Knife").exists())
+
+
+class DispatcherTests(TestCase):
+    def setUp(self):
+        self.user = create_user("dispatch_user", ROLE_DETECTIVE)
+
+    def test_notifications_follow_the_transaction_outcome(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    notify(self.user, "discarded")
+                    raise RuntimeError("rolled back")
+            except RuntimeError:
+                pass
+            notify(self.user.pk, "kept", payload={"index": 1})
+        self.assertEqual(list(Notification.objects.values_list("type", "payload")), [("kept", {"index": 1})])
+
+    @override_settings(NOTIFICATIONS_BACKGROUND_FLUSH=True)
+    def test_background_mode_hands_batches_to_the_flusher(self):
+        written = []
+        with mock.patch.object(dispatch, "flusher", BackgroundFlusher(write=written.extend)):
+            token = dispatch.begin_request_batch()
+            with self.captureOnCommitCallbacks(execute=True):
+                notify(self.user, "first")
+                notify(self.user, "second")
+            dispatch.end_request_batch(token)
+            dispatch.flusher.drain()
+        self.assertEqual([notification.type for notification in written], ["first", "second"])
+        self.assertFalse(Notification.objects.exists())
+
+    def test_failed_request_batch_is_logged_not_raised(self):
+        token = dispatch.begin_request_batch()
+        with self.captureOnCommitCallbacks(execute=True):
+            notify(self.user, "lost")
+        with mock.patch.object(dispatch, "write_notifications", side_effect=RuntimeError("database down")):
+            with self.assertLogs("apps.notifications", "ERROR") as logs:
+                dispatch.end_request_batch(token)
+        self.assertIn("Failed to write 1 notifications", logs.output[0])
+        self.assertFalse(Notification.objects.exists())
+
+    def test_flusher_survives_write_errors(self):
+        written = []
+
+        def write(notifications):
+            if notifications[0].type == "broken":
+                raise ValueError("broken batch")
+            written.extend(notifications)
+
+        flusher = BackgroundFlusher(write=write)
+        with self.assertLogs("apps.notifications", "ERROR"):
+            flusher.submit([Notification(type="broken")])
+            flusher.drain()
+        flusher.submit([Notification(type="ok")])
+        flusher.drain()
+        self.assertEqual([notification.type for notification in written], ["ok"])
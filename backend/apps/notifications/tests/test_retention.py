@@ -0,0 +1,101 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.notifications.models import Notification, NotificationArchive, NotificationReceipt
+from apps.notifications.utils import get_unread_count
+
+
+class NotificationRetentionTests(APITestCase):
+    def setUp(self):
+        self.user = self.create_user("retention_user")
+        self.other = self.create_user("retention_other")
+        self.client.force_authenticate(self.user)
+
+    def create_user(self, username):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"{username}123",
+            national_id=f"{username}nid",
+            password="Pass1234!",
+            first_name="Retention",
+            last_name="User",
+        )
+
+    def create_notification(self, user, type, age_days, read):
+        notification = Notification.objects.create(user=user, type=type, payload={"type": type})
+        created_at = timezone.now() - timedelta(days=age_days)
+        Notification.objects.filter(pk=notification.pk).update(
+            created_at=created_at, read_at=created_at if read else None
+        )
+        return notification
+
+    def purge(self, *args):
+        out = StringIO()
+        call_command("purge_notifications", *args, stdout=out)
+        return out.getvalue()
+
+    @override_settings(NOTIFICATION_RETENTION_DAYS=30)
+    def test_purge_archives_only_old_read_notifications_in_batches(self):
+        old_read = [self.create_notification(self.user, f"old_read_{index}", 40 + index, read=True) for index in range(3)]
+        old_unread = self.create_notification(self.user, "old_unread", 50, read=False)
+        recent_read = self.create_notification(self.user, "recent_read", 5, read=True)
+        theirs = self.create_notification(self.other, "their_old_read", 60, read=True)
+        self.assertEqual(get_unread_count(self.user.pk), 1)
+
+        self.assertIn("Archived 4 read notifications older than 30 days.", self.purge("--batch-size", "2"))
+        self.assertEqual(
+            set(Notification.objects.values_list("pk", flat=True)), {old_unread.pk, recent_read.pk}
+        )
+        archived = NotificationArchive.objects.get(pk=old_read[0].pk)
+        self.assertEqual((archived.user_id, archived.type, archived.payload), (self.user.pk, "old_read_0", {"type": "old_read_0"}))
+        self.assertTrue(NotificationArchive.objects.filter(pk=theirs.pk, user=self.other).exists())
+        self.assertEqual(get_unread_count(self.user.pk), 1)
+
+        self.assertIn("Archived 0 read notifications", self.purge())
+        self.assertIn("Archived 1 read notifications older than 1 days.", self.purge("--days", "1"))
+
+    @override_settings(NOTIFICATION_RETENTION_DAYS=30)
+    def test_purge_deletes_old_broadcasts_with_their_receipts(self):
+        old = []
+        for index in range(3):
+            broadcast = Notification.objects.create(role_slug="captain", type=f"old_broadcast_{index}")
+            Notification.objects.filter(pk=broadcast.pk).update(created_at=timezone.now() - timedelta(days=40 + index))
+            old.append(broadcast)
+        recent = Notification.objects.create(role_slug="captain", type="recent_broadcast")
+        NotificationReceipt.objects.create(notification=old[0], user=self.user, read_at=timezone.now())
+        NotificationReceipt.objects.create(notification=recent, user=self.user, read_at=timezone.now())
+
+        out = self.purge("--batch-size", "2")
+        self.assertIn("Archived 0 read notifications older than 30 days.", out)
+        self.assertIn("Deleted 3 role broadcasts older than 30 days.", out)
+        self.assertEqual(list(Notification.objects.values_list("pk", flat=True)), [recent.pk])
+        self.assertEqual(list(NotificationReceipt.objects.values_list("notification_id", flat=True)), [recent.pk])
+        self.assertFalse(NotificationArchive.objects.exists())
+        self.assertIn("Deleted 0 role broadcasts", self.purge())
+
+    def test_history_endpoint_pages_the_users_archive(self):
+        for index in range(3):
+            self.create_notification(self.user, f"history_{index}", 100 + index, read=True)
+        self.create_notification(self.other, "their_history", 100, read=True)
+        self.create_notification(self.user, "inbox", 1, read=True)
+        self.purge("--days", "30")
+
+        res = self.client.get("/api/v1/notifications/history/", {"page_size": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["type"] for item in res.data["results"]], ["history_0", "history_1"])
+        res = self.client.get(res.data["next"])
+        self.assertEqual([item["type"] for item in res.data["results"]], ["history_2"])
+        self.assertIsNone(res.data["next"])
+
+        res = self.client.get("/api/v1/notifications/history/")
+        self.assertEqual([item["type"] for item in res.data["results"]], ["history_0", "history_1", "history_2"])
+        self.assertIsNone(res.data["next"])
+
+        res = self.client.get("/api/v1/notifications/")
+        self.assertEqual([item["type"] for item in res.data], ["inbox"])
@@ -0,0 +1,115 @@
+import asyncio
+import gc
+import json
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.accounts.models import User
+from apps.notifications import dispatch
+from apps.notifications.dispatch import notify
+from apps.notifications.models import Notification
+from apps.notifications.stream import broker
+
+
+STREAM_URL = "/api/v1/notifications/stream/"
+
+
+def parse_event(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    return int(fields["id"]), json.loads(fields["data"])
+
+
+@override_settings(NOTIFICATION_STREAM_HEARTBEAT=0.05, NOTIFICATION_STREAM_POLL_INTERVAL=60)
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="stream_user",
+            email="stream_user@example.com",
+            phone="stream123",
+            national_id="streamnid",
+            password="Pass1234!",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+    async def open_stream(self, **extra):
+        response = await self.async_client.get(STREAM_URL, {"access_token": self.token}, **extra)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        return response.streaming_content.__aiter__()
+
+    async def next_chunk(self, events):
+        chunk = await asyncio.wait_for(anext(events), 5)
+        return chunk.decode() if isinstance(chunk, bytes) else chunk
+
+    async def test_stream_requires_a_valid_token(self):
+        response = await self.async_client.get(STREAM_URL)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(json.loads(response.content)["error"]["code"], "error")
+        response = await self.async_client.get(STREAM_URL, {"access_token": "garbage"})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_resume_catches_up_then_pushes_published_notifications(self):
+        create = sync_to_async(Notification.objects.create)
+        seen = await create(user=self.user, type="seen")
+        missed = [await create(user=self.user, type="missed", payload={"index": index}) for index in range(2)]
+
+        subscribers = broker.subscriber_count()
+        events = await self.open_stream(headers={"Last-Event-ID": str(seen.id)})
+        try:
+            self.assertTrue((await self.next_chunk(events)).startswith("retry:"))
+            caught_up = [parse_event(await self.next_chunk(events)) for _ in missed]
+            self.assertEqual([event_id for event_id, _ in caught_up], [notification.id for notification in missed])
+            self.assertEqual(caught_up[0][1]["payload"], {"index": 0})
+
+            self.assertEqual(await self.next_chunk(events), ": keepalive\n\n")
+            self.assertEqual(broker.subscriber_count(), subscribers + 1)
+            pushed = await create(user=self.user, type="pushed")
+            broker.publish([self.user.pk])
+            chunk = await self.next_chunk(events)
+            while chunk.startswith(":"):
+                chunk = await self.next_chunk(events)
+            self.assertEqual(parse_event(chunk)[0], pushed.id)
+        finally:
+            await events.aclose()
+        # A dropped stream is finalized by the event loop, which runs its cleanup.
+        del events
+        gc.collect()
+        await asyncio.sleep(0.01)
+        self.assertEqual(broker.subscriber_count(), subscribers)
+
+    async def test_new_stream_starts_after_existing_notifications(self):
+        await sync_to_async(Notification.objects.create)(user=self.user, type="old")
+        events = await self.open_stream()
+        try:
+            await self.next_chunk(events)
+            self.assertEqual(await self.next_chunk(events), ": keepalive\n\n")
+        finally:
+            await events.aclose()
+
+    async def test_broadcasts_wake_streams_of_role_holders(self):
+        captain = broker.subscribe(self.user.pk, ["captain"])
+        detective = broker.subscribe(self.user.pk + 1, ["detective"])
+        try:
+            broker.publish([], ["captain"])
+            self.assertTrue(await captain.wait(1))
+            self.assertFalse(await detective.wait(0.01))
+        finally:
+            broker.unsubscribe(captain)
+            broker.unsubscribe(detective)
+
+    def test_wsgi_requests_get_a_bounded_long_poll(self):
+        seen = Notification.objects.create(user=self.user, type="seen")
+        missed = Notification.objects.create(user=self.user, type="missed")
+        response = self.client.get(STREAM_URL, {"access_token": self.token}, HTTP_LAST_EVENT_ID=str(seen.id))
+        with self.assertWarnsMessage(Warning, "must consume asynchronous iterators"):
+            body = b"".join(response).decode()
+        chunks = body.split("\n\n")
+        self.assertEqual(parse_event(chunks[1])[0], missed.id)
+        self.assertIn(": keepalive", chunks)
+
+    def test_committed_notifications_wake_their_recipients(self):
+        with mock.patch.object(dispatch.broker, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                notify(self.user, "dispatched")
+        publish.assert_called_once_with({self.user.pk}, set())
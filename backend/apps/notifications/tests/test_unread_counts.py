@@ -0,0 +1,103 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.notifications.dispatch import notify
+from apps.notifications.models import Notification, UnreadNotificationCounter
+from apps.notifications.views import UnreadCountView
+from police_portal.testing import assert_max_queries
+
+
+class UnreadCountTests(APITestCase):
+    def setUp(self):
+        self.user = self.create_user("unread_user")
+        self.other = self.create_user("unread_other")
+        self.client.force_authenticate(self.user)
+
+    def create_user(self, username):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"{username}123",
+            national_id=f"{username}nid",
+            password="Pass1234!",
+            first_name="Unread",
+            last_name="User",
+        )
+
+    def unread(self):
+        res = self.client.get("/api/v1/notifications/unread-count/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.data["unread"]
+
+    def test_counter_is_built_lazily_then_read_by_primary_key(self):
+        Notification.objects.bulk_create([Notification(user=self.user, type="info") for _ in range(3)])
+        self.assertEqual(self.unread(), 3)
+        with assert_max_queries(UnreadCountView, 1):
+            self.assertEqual(self.unread(), 3)
+
+    def test_counter_follows_inserts_reads_and_deletes(self):
+        self.assertEqual(self.unread(), 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            notify(self.user, "dispatched")
+            notify(self.user, "dispatched")
+        single = Notification.objects.create(user=self.user, type="single")
+        self.assertEqual(self.unread(), 3)
+
+        res = self.client.post(f"/api/v1/notifications/{single.id}/read/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        first_read_at = res.data["read_at"]
+        res = self.client.post(f"/api/v1/notifications/{single.id}/read/")
+        self.assertEqual(res.data["read_at"], first_read_at)
+        self.assertEqual(self.unread(), 2)
+
+        Notification.objects.filter(user=self.user, read_at__isnull=True).first().delete()
+        Notification.objects.filter(pk=single.pk).delete()
+        self.assertEqual(self.unread(), 1)
+
+    def test_bulk_read_by_ids_only_touches_own_unread_notifications(self):
+        mine = [Notification.objects.create(user=self.user, type="info") for _ in range(3)]
+        theirs = Notification.objects.create(user=self.other, type="info")
+        self.assertEqual(self.unread(), 3)
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.post(
+                "/api/v1/notifications/read/",
+                {"ids": [mine[0].id, mine[1].id, theirs.id]},
+                format="json",
+            )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, {"updated": 2, "unread": 1})
+        updates = [query for query in captured.captured_queries if query["sql"].startswith('UPDATE "notifications_notification"')]
+        self.assertEqual(len(updates), 1)
+        theirs.refresh_from_db()
+        self.assertIsNone(theirs.read_at)
+
+    def test_bulk_read_before_timestamp(self):
+        old = Notification.objects.create(user=self.user, type="old")
+        Notification.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=2))
+        Notification.objects.create(user=self.user, type="new")
+        res = self.client.post(
+            "/api/v1/notifications/read/",
+            {"before": (timezone.now() - timedelta(days=1)).isoformat()},
+            format="json",
+        )
+        self.assertEqual(res.data, {"updated": 1, "unread": 1})
+
+        res = self.client.post("/api/v1/notifications/read/", {}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["error"]["code"], "validation_error")
+
+    def test_reconcile_command_repairs_drift(self):
+        Notification.objects.create(user=self.user, type="info")
+        self.assertEqual(self.unread(), 1)
+        UnreadNotificationCounter.objects.filter(user=self.user).update(count=7)
+        out = StringIO()
+        call_command("reconcile_unread_counts", stdout=out)
+        self.assertIn("2 rows changed", out.getvalue())
+        self.assertEqual(self.unread(), 1)
+        self.assertEqual(UnreadNotificationCounter.objects.get(user=self.other).count, 0)
@@ -1,7 +1,18 @@
 from django.urls import path
-from .views import NotificationListView, NotificationReadView
+from .views import (
+    NotificationBulkReadView,
+    NotificationHistoryView,
+    NotificationListView,
+    NotificationReadView,
+    NotificationStreamView,
+    UnreadCountView,
+)
 
 urlpatterns = [
     path("notifications/", NotificationListView.as_view(), name="notifications"),
+    path("notifications/history/", NotificationHistoryView.as_view(), name="notification-history"),
+    path("notifications/unread-count/", UnreadCountView.as_view(), name="notification-unread-count"),
+    path("notifications/stream/", NotificationStreamView.as_view(), name="notification-stream"),
+    path("notifications/read/", NotificationBulkReadView.as_view(), name="notification-bulk-read"),
     path("notifications/<int:id>/read/", NotificationReadView.as_view(), name="notification-read"),
 ]
@@ -0,0 +1,136 @@
+from collections import Counter, defaultdict
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+def _models(apps=None):
+    # Data migrations pass their historical app registry.
+    apps = apps or global_apps
+    return (
+        apps.get_model("accounts", "User"),
+        apps.get_model("notifications", "Notification"),
+        apps.get_model("notifications", "UnreadNotificationCounter"),
+    )
+
+
+def adjust_unread_counts(deltas):
+    """Apply ``{user_id: delta}`` to the stored counters with one UPDATE per distinct delta.
+
+    Missing counters are left alone: the next read counts them from the notifications.
+    """
+
+    user_ids_by_delta = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            user_ids_by_delta[delta].append(user_id)
+    _, _, UnreadNotificationCounter = _models()
+    for delta, user_ids in user_ids_by_delta.items():
+        UnreadNotificationCounter.objects.filter(user_id__in=user_ids).update(
+            count=Greatest(F("count") + delta, Value(0))
+        )
+
+
+def count_new_notifications(notifications):
+    adjust_unread_counts(
+        Counter(
+            notification.user_id
+            for notification in notifications
+            if notification.user_id is not None and notification.read_at is None
+        )
+    )
+
+
+def get_inbox_state(user_id):
+    """``(unread, read_version)`` of one user, read from their counter by primary key."""
+
+    _, Notification, UnreadNotificationCounter = _models()
+    state = UnreadNotificationCounter.objects.filter(pk=user_id).values_list("count", "read_version").first()
+    if state is None:
+        count = Notification.objects.filter(user_id=user_id, read_at__isnull=True).count()
+        UnreadNotificationCounter.objects.bulk_create(
+            [UnreadNotificationCounter(user_id=user_id, count=count)], ignore_conflicts=True
+        )
+        state = (count, 0)
+    return state
+
+
+def get_unread_count(user_id):
+    """Unread notifications of one user, read from their counter by primary key."""
+
+    return get_inbox_state(user_id)[0]
+
+
+def bump_read_versions(user_ids=None):
+    """Change the inbox validator of the given users, or of everyone, after reads or removals."""
+
+    _, _, UnreadNotificationCounter = _models()
+    counters = UnreadNotificationCounter.objects.all()
+    if user_ids is not None:
+        counters = counters.filter(user_id__in=user_ids)
+    counters.update(read_version=F("read_version") + 1)
+
+
+def mark_notifications_read(user_id, read_at, ids=None, before=None):
+    """Mark the user's unread notifications selected by ``ids`` or ``created_at <= before`` with one UPDATE."""
+
+    _, Notification, _ = _models()
+    notifications = Notification.objects.filter(user_id=user_id, read_at__isnull=True)
+    if ids is not None:
+        notifications = notifications.filter(pk__in=ids)
+    if before is not None:
+        notifications = notifications.filter(created_at__lte=before)
+    with transaction.atomic():
+        updated = notifications.update(read_at=read_at)
+        adjust_unread_counts({user_id: -updated})
+    return updated
+
+
+def diff_unread_counts(user_ids, apps=None):
+    """Return ``{user_id: count}`` for the given users whose stored counter is missing or wrong."""
+
+    _, Notification, UnreadNotificationCounter = _models(apps)
+    expected = dict.fromkeys(user_ids, 0)
+    expected.update(
+        Notification.objects.filter(user_id__in=user_ids, read_at__isnull=True)
+        .values("user_id")
+        .annotate(unread=Count("pk"))
+        .order_by()
+        .values_list("user_id", "unread")
+    )
+    stored = dict(UnreadNotificationCounter.objects.filter(user_id__in=user_ids).values_list("user_id", "count"))
+    return {user_id: count for user_id, count in expected.items() if stored.get(user_id) != count}
+
+
+def reconcile_unread_counts(user_ids, apps=None):
+    """Recount the unread notifications of the given users; returns the counters changed."""
+
+    _, _, UnreadNotificationCounter = _models(apps)
+    changed = diff_unread_counts(list(user_ids), apps)
+    if changed:
+        UnreadNotificationCounter.objects.bulk_create(
+            [UnreadNotificationCounter(user_id=user_id, count=count) for user_id, count in changed.items()],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["count"],
+        )
+    return len(changed)
+
+
+def _user_id_batches(batch_size, apps=None):
+    User, _, _ = _models(apps)
+    last_id = 0
+    while True:
+        batch = list(User.objects.filter(pk__gt=last_id).order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def reconcile_all_unread_counts(batch_size=RECONCILE_BATCH_SIZE, apps=None):
+    return sum(reconcile_unread_counts(batch, apps) for batch in _user_id_batches(batch_size, apps))
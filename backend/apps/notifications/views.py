@@ -1,31 +1,185 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
-from rest_framework import generics, status
+from django.views import View
+from rest_framework import generics, serializers, status
 from rest_framework.response import Response
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.views import APIView
+from apps.accounts.authentication import RoleClaimsJWTAuthentication
+from apps.rbac.utils import get_user_role_slugs
 from drf_spectacular.utils import extend_schema
-from .models import Notification
-from .serializers import NotificationSerializer
+from police_portal.conditional import conditional_response, make_etag
+from police_portal.pagination import StrictKeysetPagination
+from .inbox import (
+    inbox_notifications,
+    inbox_queryset,
+    inbox_unread_count,
+    latest_inbox_notification_id,
+    mark_broadcasts_read,
+)
+from .models import Notification, NotificationArchive
+from .serializers import (
+    InboxNotificationSerializer,
+    NotificationArchiveSerializer,
+    NotificationBulkReadSerializer,
+)
+from .stream import notification_events
+from .utils import adjust_unread_counts, bump_read_versions, get_inbox_state, mark_notifications_read
+
+
+class UnreadCountSerializer(serializers.Serializer):
+    unread = serializers.IntegerField()
+
+
+class NotificationBulkReadResponseSerializer(serializers.Serializer):
+    updated = serializers.IntegerField()
+    unread = serializers.IntegerField()
 
 
 class NotificationListView(generics.ListAPIView):
-    """List notifications for the authenticated user in reverse chronological order."""
+    """List the authenticated user's notifications and the broadcasts to their roles in reverse chronological order."""
 
-    serializer_class = NotificationSerializer
+    serializer_class = InboxNotificationSerializer
+    pagination_ordering = ("-created_at", "-id")
+    # The counter, the newest id and the page; a revalidation answered with 304 skips the
+    # page. The first listing also counts and stores the counter, and resolves roles
+    # missing from the role cache.
+    query_budget = 7
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Notification.objects.none()
-        return Notification.objects.filter(user=self.request.user).order_by("-created_at")
+        user = self.request.user
+        return inbox_notifications(user.pk, get_user_role_slugs(user)).order_by("-created_at", "-id")
+
+    def list(self, request, *args, **kwargs):
+        # Validated from maintained state rather than by aggregating the inbox: new rows
+        # raise the newest id, and reads and removals bump the read version.
+        user = request.user
+        role_slugs = get_user_role_slugs(user)
+        unread, read_version = get_inbox_state(user.pk)
+        latest_id = latest_inbox_notification_id(user.pk, role_slugs)
+        return conditional_response(
+            request,
+            lambda: super(NotificationListView, self).list(request, *args, **kwargs),
+            make_etag("notifications", user.pk, sorted(role_slugs), unread, read_version, latest_id),
+        )
+
+
+class NotificationHistoryView(generics.ListAPIView):
+    """List the authenticated user's archived notifications, newest first; read notifications move here after the retention period."""
+
+    serializer_class = NotificationArchiveSerializer
+    pagination_class = StrictKeysetPagination
+    pagination_ordering = ("-created_at", "-id")
+    query_budget = 2
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return NotificationArchive.objects.none()
+        return NotificationArchive.objects.filter(user=self.request.user).order_by(*self.pagination_ordering)
 
 
 class NotificationReadView(APIView):
-    @extend_schema(request=None, responses={200: NotificationSerializer, 404: None})
+    @extend_schema(request=None, responses={200: InboxNotificationSerializer, 404: None})
     def post(self, request, id):
-        """Mark a user-owned notification as read and return the updated notification."""
+        """Mark one of the user's notifications, or a broadcast to one of their roles, as read and return it."""
 
-        notification = Notification.objects.filter(id=id, user=request.user).first()
+        role_slugs = get_user_role_slugs(request.user)
+        notification = inbox_queryset(request.user.pk, role_slugs).filter(id=id).first()
         if not notification:
             return Response(status=status.HTTP_404_NOT_FOUND)
-        notification.read_at = timezone.now()
-        notification.save()
-        return Response(NotificationSerializer(notification).data, status=status.HTTP_200_OK)
+        if notification.user_read_at is None:
+            read_at = timezone.now()
+            if notification.user_id is None:
+                mark_broadcasts_read(request.user.pk, role_slugs, read_at, ids=[notification.pk])
+            elif Notification.objects.filter(pk=notification.pk, read_at__isnull=True).update(read_at=read_at):
+                adjust_unread_counts({request.user.pk: -1})
+            bump_read_versions([request.user.pk])
+            notification.user_read_at = read_at
+        return Response(InboxNotificationSerializer(notification).data, status=status.HTTP_200_OK)
+
+
+class NotificationBulkReadView(APIView):
+    @extend_schema(request=NotificationBulkReadSerializer, responses={200: NotificationBulkReadResponseSerializer})
+    def post(self, request):
+        """Mark the user's unread notifications and role broadcasts as read, either by id or all those created up to a timestamp."""
+
+        serializer = NotificationBulkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        role_slugs = get_user_role_slugs(request.user)
+        read_at = timezone.now()
+        selection = {"ids": serializer.validated_data.get("ids"), "before": serializer.validated_data.get("before")}
+        updated = mark_notifications_read(request.user.pk, read_at, **selection)
+        updated += mark_broadcasts_read(request.user.pk, role_slugs, read_at, **selection)
+        if updated:
+            bump_read_versions([request.user.pk])
+        return Response(
+            {"updated": updated, "unread": inbox_unread_count(request.user.pk, role_slugs)},
+            status=status.HTTP_200_OK,
+        )
+
+
+class UnreadCountView(APIView):
+    # One primary-key read once the counter exists, plus one count of unread broadcasts for
+    # users holding roles; the first read also counts and stores the counter, and resolves
+    # roles missing from the role cache.
+    query_budget = 5
+
+    @extend_schema(request=None, responses={200: UnreadCountSerializer})
+    def get(self, request):
+        """Return how many of the user's notifications are unread, read from a maintained per-user counter plus unreceipted role broadcasts."""
+
+        unread = inbox_unread_count(request.user.pk, get_user_role_slugs(request.user))
+        return Response({"unread": unread}, status=status.HTTP_200_OK)
+
+
+def _stream_user(request):
+    # EventSource cannot send headers, so browsers pass the access token as a query parameter.
+    authentication = RoleClaimsJWTAuthentication()
+    raw_token = request.GET.get("access_token")
+    try:
+        if raw_token:
+            user = authentication.get_user(authentication.get_validated_token(raw_token))
+        else:
+            user, _ = authentication.authenticate(request) or (None, None)
+    except AuthenticationFailed:
+        return None
+    return user if user is not None and user.is_active else None
+
+
+def _error(code, message, status_code):
+    return JsonResponse({"error": {"code": code, "message": message, "details": {}}}, status=status_code)
+
+
+class NotificationStreamView(View):
+    """Push the authenticated user's new notifications as server-sent events.
+
+    An async view: idle connections wait on the event loop instead of holding a worker
+    thread when served over ASGI. Clients resume with the ``Last-Event-ID`` header (or the
+    ``last_event_id`` query parameter) and receive every notification after that id.
+    """
+
+    async def get(self, request):
+        user = await sync_to_async(_stream_user)(request)
+        if user is None:
+            return _error("error", "Authentication credentials were not provided.", 401)
+        last_event_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+        if last_event_id is not None:
+            try:
+                last_event_id = int(last_event_id)
+            except ValueError:
+                return _error("validation_error", "Last-Event-ID must be a notification id", 400)
+        # WSGI servers buffer async streams until they end, so there each connection becomes
+        # a long poll lasting one heartbeat interval.
+        max_duration = None if isinstance(request, ASGIRequest) else settings.NOTIFICATION_STREAM_HEARTBEAT
+        role_slugs = await sync_to_async(get_user_role_slugs)(user)
+        events = notification_events(user.pk, last_event_id, max_duration=max_duration, role_slugs=role_slugs)
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
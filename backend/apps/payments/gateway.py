@@ -1,7 +1,10 @@
+import time
+from functools import wraps
 from urllib.parse import urlencode
 
 import requests
 from django.conf import settings
+from police_portal.metrics import observe_gateway_call
 
 
 class PaymentGatewayError(Exception):
@@ -35,12 +38,33 @@ def _zarinpal_startpay_url(authority):
     return f"https://{_zarinpal_host()}/pg/StartPay/{authority}"
 
 
+def _timed(operation):
+    """Record the latency of a gateway call, labelled ok, rejected or error."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok" if result.get("ok") else "rejected"
+                return result
+            finally:
+                observe_gateway_call(operation, outcome, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
 def build_callback_url(payment_id):
     base = settings.PAYMENT_CALLBACK_BASE_URL.rstrip("/")
     query = urlencode({"payment_id": payment_id})
     return f"{base}/api/v1/payments/return/?{query}"
 
 
+@_timed("request")
 def request_payment(*, payment_id, amount, description, callback_url, mobile=None, email=None):
     provider = settings.PAYMENT_GATEWAY_PROVIDER
     if provider == "mock":
@@ -101,6 +125,7 @@ def request_payment(*, payment_id, amount, description, callback_url, mobile=Non
     }
 
 
+@_timed("verify")
 def verify_payment(*, amount, authority):
     provider = settings.PAYMENT_GATEWAY_PROVIDER
     if provider == "mock":
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RbacConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.rbac"
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+
+# Caches private to one process: a role change bumps the version tokens only in the
+# worker that handled it, and every other worker keeps honouring stale role claims.
+PROCESS_LOCAL_CACHES = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+@register()
+def check_role_claims_cache(app_configs, **kwargs):
+    """Refuse embedded role claims unless the role version tokens live in a cache shared by all workers."""
+
+    if not settings.RBAC_JWT_ROLE_CLAIMS:
+        return []
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Error(
+            "RBAC_JWT_ROLE_CLAIMS requires a cache shared by all workers.",
+            hint="Set DJANGO_CACHE_BACKEND to a shared backend such as Redis, or disable RBAC_JWT_ROLE_CLAIMS.",
+            obj=backend,
+            id="rbac.E001",
+        )
+    ]
@@ -0,0 +1,15 @@
+from .utils import begin_request_role_cache, end_request_role_cache
+
+
+class RequestRoleCacheMiddleware:
+    """Resolve each user's role slugs at most once per request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = begin_request_role_cache()
+        try:
+            return self.get_response(request)
+        finally:
+            end_request_role_cache(token)
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Role, UserRole
+from .utils import bump_role_generation, bump_user_role_version
+
+
+# Versions are bumped immediately for the current process and again on commit, so
+# a concurrent reader cannot cache pre-commit roles under the post-commit version.
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_user_role_cache(sender, instance, **kwargs):
+    user_id = instance.user_id
+    bump_user_role_version(user_id)
+    transaction.on_commit(lambda: bump_user_role_version(user_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def reset_user_role_cache(sender, instance, **kwargs):
+    # Also revokes role claims embedded in access tokens, e.g. on deactivation.
+    user_id = instance.pk
+    bump_user_role_version(user_id)
+    transaction.on_commit(lambda: bump_user_role_version(user_id))
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def invalidate_role_cache(sender, instance, **kwargs):
+    bump_role_generation()
+    transaction.on_commit(bump_role_generation)
@@ -0,0 +1,151 @@
+from django.core.cache import cache
+from django.core.checks import run_checks
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import User
+from apps.board.models import DetectiveBoard
+from apps.cases.constants import CaseSourceType, CaseStatus, CrimeLevel
+from apps.cases.models import Case, CaseAssignment
+from apps.evidence.models import Evidence, EvidenceType, VehicleEvidence
+from apps.rbac.constants import ROLE_DETECTIVE, ROLE_POLICE_OFFICER, ROLE_SYSTEM_ADMIN
+from apps.rbac.models import Role, UserRole
+from apps.rbac.utils import get_role_by_slug
+
+
+class RequestRoleCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        for slug in [ROLE_DETECTIVE, ROLE_POLICE_OFFICER, ROLE_SYSTEM_ADMIN]:
+            Role.objects.get_or_create(slug=slug, defaults={"name": slug, "is_system": True})
+        self.officer = self.create_user("cache_officer", ROLE_POLICE_OFFICER)
+        self.detective = self.create_user("cache_detective", ROLE_DETECTIVE)
+        self.case = Case.objects.create(
+            title="Case",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_2,
+            location="Loc",
+            status=CaseStatus.ACTIVE,
+            source_type=CaseSourceType.CRIME_SCENE,
+            created_by=self.officer,
+        )
+        CaseAssignment.objects.create(case=self.case, user=self.detective, role_in_case="detective")
+        self.evidence = Evidence.objects.create(
+            case=self.case,
+            title="Car",
+            description="Getaway car",
+            evidence_type=EvidenceType.VEHICLE,
+            created_by=self.detective,
+        )
+        VehicleEvidence.objects.create(evidence=self.evidence, model="Buick", color="Black", license_plate="LA-1")
+        self.client.force_authenticate(user=self.detective)
+
+    def create_user(self, username, role_slug):
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"{username}123",
+            national_id=f"{username}nid",
+            password="Pass1234!",
+            first_name="Test",
+            last_name="User",
+        )
+        UserRole.objects.get_or_create(user=user, role=Role.objects.get(slug=role_slug))
+        return user
+
+    def _role_queries(self, captured):
+        return [query for query in captured.captured_queries if "rbac_userrole" in query["sql"]]
+
+    def test_evidence_detail_resolves_roles_once(self):
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(f"/api/v1/evidence/{self.evidence.id}/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._role_queries(captured)), 1)
+        self.assertEqual(len(captured), 9)
+
+    def test_evidence_patch_resolves_roles_once(self):
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.patch(f"/api/v1/evidence/{self.evidence.id}/", {"title": "Updated"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._role_queries(captured)), 1)
+        self.assertEqual(len(captured), 12)
+
+    def test_evidence_list_resolves_roles_once(self):
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(f"/api/v1/cases/{self.case.id}/evidence/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._role_queries(captured)), 1)
+        self.assertEqual(len(captured), 6)
+
+    def test_board_endpoints_resolve_roles_once(self):
+        DetectiveBoard.objects.create(case=self.case, created_by=self.detective)
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(f"/api/v1/cases/{self.case.id}/board/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._role_queries(captured)), 1)
+        self.assertEqual(len(captured), 8)
+
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.post(
+                f"/api/v1/cases/{self.case.id}/board/items/",
+                {"item_type": "NOTE", "title": "Lead", "text": "Check the docks"},
+                format="json",
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._role_queries(captured), [])
+        self.assertEqual(len(captured), 4)
+
+    def test_role_assignment_invalidates_request_cache(self):
+        admin = self.create_user("cache_admin", ROLE_SYSTEM_ADMIN)
+        self.client.force_authenticate(user=admin)
+        res = self.client.post(
+            f"/api/v1/rbac/users/{admin.id}/remove-role/",
+            {"role_slug": ROLE_SYSTEM_ADMIN},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        res = self.client.get("/api/v1/auth/me/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["roles"], [])
+
+    def test_roles_are_served_from_shared_cache_on_later_requests(self):
+        self.client.get(f"/api/v1/evidence/{self.evidence.id}/")
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(f"/api/v1/evidence/{self.evidence.id}/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._role_queries(captured), [])
+
+    def test_role_change_bumps_shared_cache_version(self):
+        self.client.get("/api/v1/auth/me/")
+        UserRole.objects.create(user=self.detective, role=Role.objects.get(slug=ROLE_POLICE_OFFICER))
+        res = self.client.get("/api/v1/auth/me/")
+        self.assertEqual(sorted(res.data["roles"]), [ROLE_DETECTIVE, ROLE_POLICE_OFFICER])
+
+    def test_role_by_slug_is_cached_until_a_role_is_saved(self):
+        role = get_role_by_slug(ROLE_DETECTIVE)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_role_by_slug(ROLE_DETECTIVE), role)
+        role.description = "Updated"
+        role.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(get_role_by_slug(ROLE_DETECTIVE).description, "Updated")
+
+
+class RoleClaimsCacheCheckTests(SimpleTestCase):
+    def errors(self):
+        return [message.id for message in run_checks() if message.id.startswith("rbac.")]
+
+    @override_settings(
+        RBAC_JWT_ROLE_CLAIMS=True,
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    )
+    def test_role_claims_require_a_shared_cache(self):
+        self.assertEqual(self.errors(), ["rbac.E001"])
+        with override_settings(RBAC_JWT_ROLE_CLAIMS=False):
+            self.assertEqual(self.errors(), [])
+        shared = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://cache:6379"}}
+        with override_settings(CACHES=shared):
+            self.assertEqual(self.errors(), [])
@@ -1,17 +1,176 @@
+import uuid
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Aggregate, CharField, Q
 from .models import Role
 
 
+ROLE_GENERATION_CACHE_KEY = "rbac:roles:generation"
+
+# Role slugs resolved during the current request, keyed by user id. The scope is
+# opened by RequestRoleCacheMiddleware; outside of it lookups go to the shared cache.
+_request_role_cache = ContextVar("rbac_request_role_cache", default=None)
+
+# Process-local Role rows by slug, valid for a single shared role generation.
+_roles_by_slug = {}
+_roles_by_slug_generation = None
+
+
+class _GroupConcat(Aggregate):
+    function = "GROUP_CONCAT"
+    output_field = CharField()
+
+
+def begin_request_role_cache():
+    return _request_role_cache.set({})
+
+
+def end_request_role_cache(token):
+    _request_role_cache.reset(token)
+
+
+def invalidate_user_roles(user_id=None):
+    """Drop request-scoped role slugs for one user, or for everyone when no user id is given."""
+
+    request_cache = _request_role_cache.get()
+    if request_cache is None:
+        return
+    if user_id is None:
+        request_cache.clear()
+    else:
+        request_cache.pop(user_id, None)
+
+
+def _role_version_cache_key(user_id):
+    return f"rbac:roles:version:{user_id}"
+
+
+def _role_slugs_cache_key(user_id, generation, version):
+    return f"rbac:roles:slugs:{user_id}:{generation}:{version}"
+
+
+def _rotate_token(key):
+    # Versions are random tokens rather than counters so an evicted version key can
+    # never be recreated with a value that matches an older cached entry.
+    token = uuid.uuid4().hex
+    cache.set(key, token, None)
+    return token
+
+
+def _get_or_create_token(key, current):
+    if current:
+        return current
+    token = uuid.uuid4().hex
+    if cache.add(key, token, None):
+        return token
+    return cache.get(key) or token
+
+
+def bump_user_role_version(user_id):
+    invalidate_user_roles(user_id)
+    _rotate_token(_role_version_cache_key(user_id))
+
+
+def bump_role_generation():
+    invalidate_user_roles()
+    _rotate_token(ROLE_GENERATION_CACHE_KEY)
+
+
+def _get_role_generation():
+    return _get_or_create_token(ROLE_GENERATION_CACHE_KEY, cache.get(ROLE_GENERATION_CACHE_KEY))
+
+
+def _get_role_cache_tokens(user_id):
+    version_key = _role_version_cache_key(user_id)
+    tokens = cache.get_many([ROLE_GENERATION_CACHE_KEY, version_key])
+    generation = _get_or_create_token(ROLE_GENERATION_CACHE_KEY, tokens.get(ROLE_GENERATION_CACHE_KEY))
+    version = _get_or_create_token(version_key, tokens.get(version_key))
+    return generation, version
+
+
+def get_user_roles_epoch(user_id):
+    """Return an opaque value that changes whenever the user's resolved roles may have changed."""
+
+    generation, version = _get_role_cache_tokens(user_id)
+    return f"{generation}:{version}"
+
+
+def remember_user_roles(user_id, role_slugs):
+    """Seed the request scope with role slugs that were verified by other means."""
+
+    request_cache = _request_role_cache.get()
+    if request_cache is not None:
+        request_cache[user_id] = tuple(role_slugs)
+
+
+def _get_cached_role_slugs(user_id):
+    generation, version = _get_role_cache_tokens(user_id)
+    slugs_key = _role_slugs_cache_key(user_id, generation, version)
+    return slugs_key, cache.get(slugs_key)
+
+
+def _resolve_role_slugs(user):
+    if not user or not user.is_authenticated:
+        return ()
+    request_cache = _request_role_cache.get()
+    if request_cache is not None and user.pk in request_cache:
+        return request_cache[user.pk]
+    slugs_key, role_slugs = _get_cached_role_slugs(user.pk)
+    if role_slugs is None:
+        role_slugs = tuple(user.user_roles.values_list("role__slug", flat=True))
+        cache.set(slugs_key, role_slugs, settings.RBAC_ROLE_CACHE_TIMEOUT)
+    if request_cache is not None:
+        request_cache[user.pk] = role_slugs
+    return role_slugs
+
+
 def user_has_role(user, role_slugs):
     if not user or not user.is_authenticated:
         return False
-    return user.user_roles.filter(role__slug__in=role_slugs).exists()
+    return not set(role_slugs).isdisjoint(_resolve_role_slugs(user))
 
 
 def get_user_role_slugs(user):
     if not user or not user.is_authenticated:
         return []
-    return list(user.user_roles.select_related("role").values_list("role__slug", flat=True))
+    return list(_resolve_role_slugs(user))
 
 
 def get_role_by_slug(slug):
-    return Role.objects.filter(slug=slug).first()
+    global _roles_by_slug_generation
+    generation = _get_role_generation()
+    if generation != _roles_by_slug_generation:
+        _roles_by_slug.clear()
+        _roles_by_slug_generation = generation
+    if slug not in _roles_by_slug:
+        _roles_by_slug[slug] = Role.objects.filter(slug=slug).first()
+    return _roles_by_slug[slug]
+
+
+def annotate_role_slugs(queryset):
+    """Aggregate every user's role slugs into a ``role_slugs_agg`` column of the same query.
+
+    Postgres collects them with ARRAY_AGG; other backends fall back to GROUP_CONCAT,
+    which is safe because slugs never contain commas. Read values with annotated_role_slugs().
+    """
+
+    slug_path = "user_roles__role__slug"
+    has_role = Q(user_roles__isnull=False)
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.aggregates import ArrayAgg
+
+        aggregate = ArrayAgg(slug_path, filter=has_role, ordering=slug_path, default=[])
+    else:
+        aggregate = _GroupConcat(slug_path, filter=has_role)
+    return queryset.annotate(role_slugs_agg=aggregate)
+
+
+def annotated_role_slugs(user):
+    value = user.role_slugs_agg
+    if not value:
+        return []
+    if isinstance(value, str):
+        return sorted(value.split(","))
+    return list(value)
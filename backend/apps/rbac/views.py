@@ -17,6 +17,8 @@ class RoleListCreateView(generics.ListCreateAPIView):
     serializer_class = RoleSerializer
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_SYSTEM_ADMIN]
+    # The role catalogue is small and has no creation timestamp to key pages on.
+    pagination_class = None
 
 
 class RoleDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rewards', '0003_tip_status_created_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tip',
+            name='rewards_tip_status_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tip',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='rewards_tip_status_created_idx'),
+        ),
+    ]
@@ -20,6 +20,11 @@ class Tip(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     decided_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "-created_at", "-id"], name="rewards_tip_status_created_idx"),
+        ]
+
 
 class TipAttachment(models.Model):
     tip = models.ForeignKey(Tip, on_delete=models.CASCADE, related_name="attachments")
@@ -1,11 +1,13 @@
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema
 from apps.rbac.permissions import RoleRequiredPermission
+from apps.rbac.utils import get_user_role_slugs
 from apps.rbac.constants import (
     ROLE_BASE_USER,
     ROLE_CADET,
@@ -18,9 +20,11 @@ from apps.rbac.constants import (
     ROLE_CORONER,
     ROLE_SYSTEM_ADMIN,
 )
-from apps.notifications.models import Notification
+from apps.notifications.dispatch import notify
 from apps.accounts.models import User
-from apps.suspects.utils import compute_most_wanted
+from apps.suspects.utils import compute_reward_amount
+from apps.cases.models import CaseAssignment
+from police_portal.pagination import PAGINATION_PARAMETERS, paginated_response
 from .models import Tip, TipAttachment, RewardCode
 from .serializers import (
     TipSerializer,
@@ -34,11 +38,7 @@ from .serializers import (
 def _compute_tip_reward_amount(tip):
     if not tip.person_id:
         return 0
-    most_wanted = compute_most_wanted()
-    for entry in most_wanted:
-        if entry["person"].id == tip.person_id:
-            return entry["reward_amount"]
-    return 0
+    return compute_reward_amount(tip.person_id)
 
 
 class TipCreateView(generics.ListCreateAPIView):
@@ -47,11 +47,16 @@ class TipCreateView(generics.ListCreateAPIView):
     serializer_class = TipSerializer
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_BASE_USER]
+    pagination_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Tip.objects.none()
-        return Tip.objects.filter(submitted_by=self.request.user)
+        return (
+            Tip.objects.filter(submitted_by=self.request.user)
+            .prefetch_related("attachments")
+            .order_by(*self.pagination_ordering)
+        )
 
     def perform_create(self, serializer):
         tip = serializer.save(submitted_by=self.request.user)
@@ -63,22 +68,26 @@ class TipCreateView(generics.ListCreateAPIView):
 class TipReviewQueueView(APIView):
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_POLICE_OFFICER, ROLE_DETECTIVE, ROLE_SYSTEM_ADMIN]
+    pagination_ordering = ("-created_at", "-id")
+    query_budget = 5
 
-    @extend_schema(request=None, responses={200: TipSerializer(many=True)})
+    @extend_schema(request=None, parameters=PAGINATION_PARAMETERS, responses={200: TipSerializer(many=True)})
     def get(self, request):
         """Return the appropriate tip review queue for police officers, detectives, or system administrators."""
 
-        role_slugs = set(request.user.user_roles.values_list("role__slug", flat=True))
+        return paginated_response(request, self, self.get_queryset(), lambda rows: TipSerializer(rows, many=True).data)
+
+    def get_queryset(self):
+        user = self.request.user
+        role_slugs = set(get_user_role_slugs(user))
         if ROLE_SYSTEM_ADMIN in role_slugs:
             queryset = Tip.objects.all()
         elif ROLE_POLICE_OFFICER in role_slugs:
             queryset = Tip.objects.filter(status="pending_officer")
         else:
-            queryset = Tip.objects.filter(status="pending_detective").filter(
-                Q(case__isnull=True) | Q(case__assignments__user=request.user, case__assignments__role_in_case="detective")
-            )
-        queryset = queryset.order_by("-created_at").distinct()
-        return Response(TipSerializer(queryset, many=True).data, status=status.HTTP_200_OK)
+            assigned = CaseAssignment.objects.filter(case_id=OuterRef("case_id"), user=user, role_in_case="detective")
+            queryset = Tip.objects.filter(status="pending_detective").filter(Q(case__isnull=True) | Exists(assigned))
+        return queryset.prefetch_related("attachments").order_by(*self.pagination_ordering)
 
 
 class OfficerReviewView(APIView):
@@ -108,12 +117,12 @@ class DetectiveReviewView(APIView):
     required_roles = [ROLE_DETECTIVE]
 
     @extend_schema(request=DetectiveReviewSerializer, responses={200: TipSerializer})
+    @transaction.atomic
     def post(self, request, id):
         """Perform the detective review, issue a reward code on acceptance, and notify the submitting user."""
 
         tip = get_object_or_404(Tip, id=id)
         if tip.case:
-            from apps.cases.models import CaseAssignment
             if not CaseAssignment.objects.filter(case=tip.case, user=request.user, role_in_case="detective").exists():
                 return Response(
                     {"error": {"code": "forbidden", "message": "Detective not assigned to case", "details": {}}},
@@ -132,12 +141,7 @@ class DetectiveReviewView(APIView):
                 user=tip.submitted_by,
                 defaults={"code": RewardCode.generate_code(), "amount": reward_amount},
             )
-            Notification.objects.create(
-                user=tip.submitted_by,
-                case=tip.case,
-                type="reward_issued",
-                payload={"code": reward_code.code},
-            )
+            notify(tip.submitted_by_id, "reward_issued", case=tip.case_id, payload={"code": reward_code.code})
         else:
             tip.status = "rejected"
             tip.decided_at = timezone.now()
@@ -0,0 +1,34 @@
+from apps.cases.constants import CaseStatus
+from apps.rbac.constants import (
+    ROLE_CADET,
+    ROLE_POLICE_OFFICER,
+    ROLE_PATROL_OFFICER,
+    ROLE_DETECTIVE,
+    ROLE_SERGEANT,
+    ROLE_CAPTAIN,
+    ROLE_POLICE_CHIEF,
+    ROLE_CORONER,
+    ROLE_SYSTEM_ADMIN,
+    ROLE_JUDGE,
+)
+
+
+EMPLOYEE_ROLES = {
+    ROLE_CADET,
+    ROLE_POLICE_OFFICER,
+    ROLE_PATROL_OFFICER,
+    ROLE_DETECTIVE,
+    ROLE_SERGEANT,
+    ROLE_CAPTAIN,
+    ROLE_POLICE_CHIEF,
+    ROLE_CORONER,
+    ROLE_SYSTEM_ADMIN,
+    ROLE_JUDGE,
+}
+
+ACTIVE_CASE_STATUSES = (CaseStatus.ACTIVE, CaseStatus.PENDING_SUPERIOR_APPROVAL)
+
+COUNTER_SOLVED_CASES = "total_solved_cases"
+COUNTER_EMPLOYEES = "total_employees"
+COUNTER_ACTIVE_CASES = "active_cases"
+COUNTER_KEYS = (COUNTER_SOLVED_CASES, COUNTER_EMPLOYEES, COUNTER_ACTIVE_CASES)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from apps.stats.utils import rebuild_stats_counters
+
+
+class Command(BaseCommand):
+    help = "Recount the homepage statistics from the source tables, e.g. after bulk imports that bypass signals."
+
+    def handle(self, *args, **options):
+        counters = rebuild_stats_counters()
+        for key, value in counters.items():
+            self.stdout.write(f"{key}: {value}")
@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class StatCounter(models.Model):
+    key = models.CharField(max_length=64, unique=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key}={self.value}"
@@ -0,0 +1,72 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from apps.cases.models import Case
+from apps.rbac.models import Role, UserRole
+from .constants import COUNTER_EMPLOYEES
+from .utils import (
+    adjust_stats_counter,
+    case_status_counters,
+    count_employee_roles,
+    employee_role_ids,
+    reset_stats_counters,
+)
+
+
+# Field values as loaded, read from __dict__ so deferred fields are never fetched.
+
+
+@receiver(post_init, sender=Case)
+def remember_case_status(sender, instance, **kwargs):
+    instance._stats_loaded_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Case)
+def update_case_counters(sender, instance, created, **kwargs):
+    previous = set() if created else case_status_counters(instance._stats_loaded_status)
+    current = case_status_counters(instance.status)
+    for key in previous - current:
+        adjust_stats_counter(key, -1)
+    for key in current - previous:
+        adjust_stats_counter(key, 1)
+    instance._stats_loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Case)
+def release_case_counters(sender, instance, **kwargs):
+    for key in case_status_counters(instance._stats_loaded_status):
+        adjust_stats_counter(key, -1)
+
+
+@receiver(post_init, sender=UserRole)
+def remember_user_role(sender, instance, **kwargs):
+    instance._stats_loaded_role_id = instance.__dict__.get("role_id")
+
+
+@receiver(post_save, sender=UserRole)
+def update_employee_counter(sender, instance, created, **kwargs):
+    role_ids = employee_role_ids()
+    was_employee_role = not created and instance._stats_loaded_role_id in role_ids
+    is_employee_role = instance.role_id in role_ids
+    instance._stats_loaded_role_id = instance.role_id
+    if was_employee_role == is_employee_role:
+        return
+    remaining = count_employee_roles(instance.user_id, role_ids)
+    if is_employee_role and remaining == 1:
+        adjust_stats_counter(COUNTER_EMPLOYEES, 1)
+    elif not is_employee_role and remaining == 0:
+        adjust_stats_counter(COUNTER_EMPLOYEES, -1)
+
+
+@receiver(post_delete, sender=UserRole)
+def release_employee_counter(sender, instance, **kwargs):
+    role_ids = employee_role_ids()
+    if instance.role_id in role_ids and count_employee_roles(instance.user_id, role_ids) == 0:
+        adjust_stats_counter(COUNTER_EMPLOYEES, -1)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def reset_counters_for_role_change(sender, instance, created=False, **kwargs):
+    # A renamed or removed role can change who counts as an employee.
+    if not created:
+        reset_stats_counters()
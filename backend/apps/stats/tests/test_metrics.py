@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import threading
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.payments.gateway import request_payment
+from apps.rbac.constants import ROLE_SYSTEM_ADMIN
+from apps.rbac.models import Role, UserRole
+from police_portal.metrics import MetricsRegistry, registry
+
+
+METRICS_URL = "/api/v1/internal/metrics"
+
+
+@override_settings(METRICS_TOKEN="scrape-token", METRICS_MULTIPROC_DIR="")
+class MetricsEndpointTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+
+    def scrape(self):
+        response = self.client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer scrape-token")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        return response.content.decode()
+
+    def test_requires_scrape_token_or_system_admin(self):
+        self.assertEqual(self.client.get(METRICS_URL).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer wrong-token")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("error", response.json())
+
+        admin = User.objects.create_user(
+            username="metrics_admin",
+            email="metrics_admin@example.com",
+            phone="5552000000",
+            national_id="metrics-admin",
+            password="Pass1234!",
+            first_name="Metrics",
+            last_name="Admin",
+        )
+        role, _ = Role.objects.get_or_create(slug=ROLE_SYSTEM_ADMIN, defaults={"name": "admin", "is_system": True})
+        UserRole.objects.create(user=admin, role=role)
+        self.client.force_authenticate(user=admin)
+        self.assertEqual(self.client.get(METRICS_URL).status_code, status.HTTP_200_OK)
+
+    def test_exposes_route_histograms_status_counts_and_gateway_latency(self):
+        self.client.get("/api/v1/stats/overview/")
+        self.client.get("/api/v1/stats/overview/")
+        self.client.get("/api/v1/notifications/")
+        request_payment(payment_id=7, amount=1000, description="Bail", callback_url="http://localhost/")
+
+        body = self.scrape()
+
+        self.assertIn('police_http_requests_total{route="stats-overview",method="GET",status="200"} 2', body)
+        self.assertIn('police_http_requests_total{route="notifications",method="GET",status="401"} 1', body)
+        self.assertIn(
+            'police_http_request_duration_seconds_bucket{route="stats-overview",method="GET",le="+Inf"} 2', body
+        )
+        self.assertIn('police_http_request_duration_seconds_count{route="stats-overview",method="GET"} 2', body)
+        self.assertIn('police_db_queries_per_request_count{route="stats-overview"} 2', body)
+        self.assertIn("# TYPE police_db_time_seconds histogram", body)
+        # The scrape itself is the only request in flight.
+        self.assertIn("police_http_requests_in_flight 1", body)
+        self.assertIn(
+            'police_payment_gateway_duration_seconds_count{operation="request",outcome="ok"} 1', body
+        )
+
+    def test_merges_worker_files_in_multiprocess_mode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            other_worker = {
+                "pid": 2**22 + 1,
+                "values": [
+                    ["police_http_requests_total", [["route", "stats-overview"], ["method", "GET"], ["status", "200"]], 3],
+                    ["police_http_requests_in_flight", [], 5],
+                ],
+                "histograms": [],
+            }
+            with open(os.path.join(directory, f"{other_worker['pid']}.json"), "w") as handle:
+                json.dump(other_worker, handle)
+            with override_settings(METRICS_MULTIPROC_DIR=directory):
+                self.client.get("/api/v1/stats/overview/")
+                body = self.scrape()
+                self.assertTrue(os.path.exists(os.path.join(directory, f"{os.getpid()}.json")))
+
+        self.assertIn('police_http_requests_total{route="stats-overview",method="GET",status="200"} 4', body)
+        # Gauges of exited workers are dropped.
+        self.assertIn("police_http_requests_in_flight 1", body)
+
+
+@override_settings(METRICS_MULTIPROC_DIR="")
+class MetricsRegistryTests(APITestCase):
+    def test_exited_threads_fold_their_shards_into_the_totals(self):
+        metrics = MetricsRegistry()
+        key = ("police_http_requests_total", (("route", "stats-overview"),))
+
+        def serve():
+            metrics.inc(*key)
+            metrics.observe("police_db_queries_per_request", 3, (("route", "stats-overview"),))
+
+        for _ in range(50):
+            thread = threading.Thread(target=serve)
+            thread.start()
+            thread.join()
+        metrics.inc(*key)
+
+        values, histograms = metrics.collect()
+        self.assertEqual(len(metrics._shards), 1)
+        self.assertEqual(values[key], 51)
+        self.assertEqual(histograms[("police_db_queries_per_request", (("route", "stats-overview"),))][-1], 150)
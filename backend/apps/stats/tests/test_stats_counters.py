@@ -0,0 +1,87 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import User
+from apps.cases.constants import CaseSourceType, CaseStatus, CrimeLevel
+from apps.cases.models import Case
+from apps.rbac.constants import ROLE_BASE_USER, ROLE_CADET, ROLE_DETECTIVE
+from apps.rbac.models import Role, UserRole
+from apps.stats.models import StatCounter
+
+
+class StatsCounterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.detective = self._user("counter_detective")
+        UserRole.objects.create(user=self.detective, role=Role.objects.get(slug=ROLE_DETECTIVE))
+
+    def _user(self, username):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            phone=f"555-{username}",
+            national_id=f"nid-{username}",
+            password="Pass1234!",
+            first_name="Stats",
+            last_name="User",
+        )
+
+    def _case(self, case_status):
+        return Case.objects.create(
+            title="Counter case",
+            description="Counted",
+            crime_level=CrimeLevel.LEVEL_2,
+            location="Downtown",
+            status=case_status,
+            source_type=CaseSourceType.CRIME_SCENE,
+            created_by=self.detective,
+        )
+
+    def _overview(self):
+        response = self.client.get("/api/v1/stats/overview/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_overview_is_cached_and_does_not_scan_users(self):
+        self._overview()
+        for index in range(5):
+            UserRole.objects.create(user=self._user(f"counter_cadet{index}"), role=Role.objects.get(slug=ROLE_CADET))
+        self._case(CaseStatus.ACTIVE)
+
+        with self.assertNumQueries(1):
+            data = self._overview()
+        self.assertEqual(data, {"total_solved_cases": 0, "total_employees": 6, "active_cases": 1})
+        with self.assertNumQueries(0):
+            self._overview()
+
+    def test_counters_follow_case_and_role_changes(self):
+        case = self._case(CaseStatus.PENDING_SUPERIOR_APPROVAL)
+        self._overview()
+        self.assertEqual(StatCounter.objects.get(key="active_cases").value, 1)
+
+        case.status = CaseStatus.CLOSED_SOLVED
+        case.save(update_fields=["status"])
+        self.assertEqual(self._overview(), {"total_solved_cases": 1, "total_employees": 1, "active_cases": 0})
+
+        cadet_role = UserRole.objects.create(user=self.detective, role=Role.objects.get(slug=ROLE_CADET))
+        UserRole.objects.create(user=self._user("counter_citizen"), role=Role.objects.get(slug=ROLE_BASE_USER))
+        self.assertEqual(self._overview()["total_employees"], 1)
+
+        UserRole.objects.filter(user=self.detective, role__slug=ROLE_DETECTIVE).delete()
+        self.assertEqual(self._overview()["total_employees"], 1)
+        cadet_role.delete()
+        Case.objects.get(pk=case.pk).delete()
+        self.assertEqual(self._overview(), {"total_solved_cases": 0, "total_employees": 0, "active_cases": 0})
+
+    def test_rebuild_command_recounts_from_source_tables(self):
+        self._case(CaseStatus.ACTIVE)
+        self._overview()
+        StatCounter.objects.filter(key="active_cases").update(value=42)
+
+        out = StringIO()
+        call_command("rebuild_stats_counters", stdout=out)
+        self.assertIn("active_cases: 1", out.getvalue().splitlines())
+        self.assertEqual(self._overview()["active_cases"], 1)
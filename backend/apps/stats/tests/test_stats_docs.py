@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from drf_spectacular.generators import SchemaGenerator
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -11,6 +12,7 @@ from apps.rbac.models import Role, UserRole
 
 class StatsDocsTests(APITestCase):
     def setUp(self):
+        cache.clear()
         Role.objects.get_or_create(slug=ROLE_DETECTIVE, defaults={"name": "detective", "is_system": True})
 
     def test_stats_overview_is_public_and_returns_counts(self):
@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
+from apps.cases.constants import CaseStatus
+from apps.cases.models import Case
+from apps.rbac.models import UserRole
+from apps.rbac.utils import get_role_by_slug
+from .constants import (
+    ACTIVE_CASE_STATUSES,
+    COUNTER_ACTIVE_CASES,
+    COUNTER_EMPLOYEES,
+    COUNTER_KEYS,
+    COUNTER_SOLVED_CASES,
+    EMPLOYEE_ROLES,
+)
+from .models import StatCounter
+
+
+STATS_CACHE_KEY = "stats:overview"
+# Last computed overview without expiry, served to readers while another one recomputes.
+STATS_STALE_CACHE_KEY = "stats:overview:stale"
+STATS_RECOMPUTE_LOCK_KEY = "stats:overview:recompute"
+STATS_RECOMPUTE_LOCK_TIMEOUT = 30
+
+
+def compute_stats_counters():
+    """Count the overview figures from the source tables with one aggregate per table."""
+
+    case_counts = Case.objects.aggregate(
+        solved=Count("id", filter=Q(status=CaseStatus.CLOSED_SOLVED)),
+        active=Count("id", filter=Q(status__in=ACTIVE_CASE_STATUSES)),
+    )
+    employees = UserRole.objects.filter(role__slug__in=EMPLOYEE_ROLES).aggregate(
+        total=Count("user_id", distinct=True)
+    )["total"]
+    return {
+        COUNTER_SOLVED_CASES: case_counts["solved"],
+        COUNTER_EMPLOYEES: employees,
+        COUNTER_ACTIVE_CASES: case_counts["active"],
+    }
+
+
+def rebuild_stats_counters():
+    counters = compute_stats_counters()
+    with transaction.atomic():
+        for key, value in counters.items():
+            StatCounter.objects.update_or_create(key=key, defaults={"value": value})
+    transaction.on_commit(invalidate_stats_overview)
+    return counters
+
+
+def reset_stats_counters():
+    """Drop the counters so the next read rebuilds them from the source tables."""
+
+    StatCounter.objects.filter(key__in=COUNTER_KEYS).delete()
+    invalidate_stats_overview()
+    transaction.on_commit(invalidate_stats_overview)
+
+
+def adjust_stats_counter(key, delta):
+    # Missing rows are left alone: the next read rebuilds every counter from scratch.
+    if delta:
+        StatCounter.objects.filter(key=key).update(value=F("value") + delta)
+        invalidate_stats_overview()
+        transaction.on_commit(invalidate_stats_overview)
+
+
+def read_stats_counters():
+    counters = dict(StatCounter.objects.filter(key__in=COUNTER_KEYS).values_list("key", "value"))
+    if len(counters) != len(COUNTER_KEYS):
+        return rebuild_stats_counters()
+    return counters
+
+
+def invalidate_stats_overview():
+    cache.delete(STATS_CACHE_KEY)
+
+
+def get_stats_overview():
+    """Return the overview counters from cache, letting a single caller recompute them on a miss."""
+
+    data = cache.get(STATS_CACHE_KEY)
+    if data is not None:
+        return data
+    locked = cache.add(STATS_RECOMPUTE_LOCK_KEY, True, STATS_RECOMPUTE_LOCK_TIMEOUT)
+    if not locked:
+        stale = cache.get(STATS_STALE_CACHE_KEY)
+        if stale is not None:
+            return stale
+    try:
+        data = read_stats_counters()
+        cache.set(STATS_CACHE_KEY, data, settings.STATS_CACHE_TIMEOUT)
+        cache.set(STATS_STALE_CACHE_KEY, data, None)
+    finally:
+        if locked:
+            cache.delete(STATS_RECOMPUTE_LOCK_KEY)
+    return data
+
+
+def case_status_counters(case_status):
+    if case_status == CaseStatus.CLOSED_SOLVED:
+        return {COUNTER_SOLVED_CASES}
+    if case_status in ACTIVE_CASE_STATUSES:
+        return {COUNTER_ACTIVE_CASES}
+    return set()
+
+
+def employee_role_ids():
+    roles = (get_role_by_slug(slug) for slug in EMPLOYEE_ROLES)
+    return {role.pk for role in roles if role is not None}
+
+
+def count_employee_roles(user_id, role_ids=None):
+    if role_ids is None:
+        role_ids = employee_role_ids()
+    return UserRole.objects.filter(user_id=user_id, role_id__in=role_ids).count()
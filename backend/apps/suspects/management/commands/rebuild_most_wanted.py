@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from apps.suspects.utils import REBUILD_BATCH_SIZE, rebuild_most_wanted
+
+
+class Command(BaseCommand):
+    help = "Recompute the MostWantedEntry read model from every person's wanted records."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        changed = rebuild_most_wanted(batch_size=options["batch_size"])
+        self.stdout.write(f"Rebuilt most-wanted entries: {changed} rows changed.")
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suspects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='suspectcandidate',
+            index=models.Index(fields=['case', 'status'], name='suspects_cand_case_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wantedrecord',
+            index=models.Index(fields=['status'], name='suspects_wanted_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wantedrecord',
+            index=models.Index(fields=['person', 'case'], name='suspects_wanted_person_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_most_wanted(apps, schema_editor):
+    from apps.suspects.utils import rebuild_most_wanted
+
+    rebuild_most_wanted(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suspects', '0002_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MostWantedEntry',
+            fields=[
+                ('person', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='most_wanted_entry', serialize=False, to='suspects.person')),
+                ('crime_degree', models.PositiveSmallIntegerField()),
+                ('wanted_since', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['wanted_since'], name='suspects_mw_since_idx')],
+            },
+        ),
+        migrations.RunPython(build_most_wanted, migrations.RunPython.noop),
+    ]
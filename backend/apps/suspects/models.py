@@ -26,6 +26,12 @@ class SuspectCandidate(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     sergeant_message = models.TextField(blank=True)
     decided_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["case", "status"], name="suspects_cand_case_status_idx"),
+        ]
 
 
 class WantedRecord(models.Model):
@@ -40,3 +46,23 @@ class WantedRecord(models.Model):
     ended_at = models.DateTimeField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="wanted")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status"], name="suspects_wanted_status_idx"),
+            models.Index(fields=["person", "case"], name="suspects_wanted_person_idx"),
+        ]
+
+
+class MostWantedEntry(models.Model):
+    """Most-wanted read model, one row per person with an open wanted record, maintained by apps.suspects.utils.
+
+    ``days_wanted`` and the ranking grow every day, so they are derived from
+    ``wanted_since`` when the list is read.
+    """
+
+    person = models.OneToOneField(Person, on_delete=models.CASCADE, primary_key=True, related_name="most_wanted_entry")
+    crime_degree = models.PositiveSmallIntegerField()
+    wanted_since = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=["wanted_since"], name="suspects_mw_since_idx")]
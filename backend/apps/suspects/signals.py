@@ -0,0 +1,48 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from apps.cases.models import Case
+from .models import WantedRecord
+from .utils import sync_most_wanted
+
+
+# Fields the most-wanted entries depend on, read from __dict__ so deferred fields are
+# never fetched just to fill the snapshots.
+WANTED_RECORD_FIELDS = ("person_id", "case_id", "status", "started_at")
+CASE_RANKING_FIELDS = ("status", "crime_level")
+
+
+def _snapshot(instance, fields):
+    return tuple(instance.__dict__.get(field) for field in fields)
+
+
+@receiver(post_init, sender=WantedRecord)
+def remember_wanted_record_fields(sender, instance, **kwargs):
+    instance._most_wanted_snapshot = _snapshot(instance, WANTED_RECORD_FIELDS)
+
+
+@receiver(post_save, sender=WantedRecord)
+def update_most_wanted_for_record(sender, instance, created, **kwargs):
+    snapshot = _snapshot(instance, WANTED_RECORD_FIELDS)
+    if created or snapshot != instance._most_wanted_snapshot:
+        previous_person_id = instance._most_wanted_snapshot[0]
+        sync_most_wanted({instance.person_id, previous_person_id} - {None})
+    instance._most_wanted_snapshot = snapshot
+
+
+@receiver(post_delete, sender=WantedRecord)
+def remove_most_wanted_record(sender, instance, **kwargs):
+    sync_most_wanted([instance.person_id])
+
+
+@receiver(post_init, sender=Case)
+def remember_case_ranking_fields(sender, instance, **kwargs):
+    instance._most_wanted_snapshot = _snapshot(instance, CASE_RANKING_FIELDS)
+
+
+@receiver(post_save, sender=Case)
+def update_most_wanted_for_case(sender, instance, created, **kwargs):
+    snapshot = _snapshot(instance, CASE_RANKING_FIELDS)
+    # A new case has no wanted records yet.
+    if not created and snapshot != instance._most_wanted_snapshot:
+        sync_most_wanted(WantedRecord.objects.filter(case_id=instance.pk).values_list("person_id", flat=True).distinct())
+    instance._most_wanted_snapshot = snapshot
@@ -0,0 +1,109 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from apps.cases.constants import CaseSourceType, CaseStatus, CrimeLevel
+from apps.cases.models import Case
+from apps.suspects.models import MostWantedEntry, Person, WantedRecord
+from apps.suspects.utils import (
+    compute_reward_amount,
+    find_most_wanted_drift,
+    get_most_wanted_entry,
+    most_wanted_queryset,
+    rebuild_most_wanted,
+)
+
+
+class MostWantedEntryTests(TestCase):
+    def setUp(self):
+        self.person = Person.objects.create(full_name="Roy Earle")
+        self.case = self.create_case(CrimeLevel.LEVEL_2)
+
+    def create_case(self, crime_level, case_status=CaseStatus.ACTIVE):
+        return Case.objects.create(
+            title="Case",
+            description="Desc",
+            crime_level=crime_level,
+            location="Loc",
+            status=case_status,
+            source_type=CaseSourceType.COMPLAINT,
+        )
+
+    def create_record(self, case, days, status="wanted"):
+        record = WantedRecord.objects.create(person=self.person, case=case, status=status)
+        record.started_at = timezone.now() - timedelta(days=days)
+        record.save()
+        return record
+
+    def entry(self):
+        return MostWantedEntry.objects.filter(person=self.person).first()
+
+    def test_entry_follows_wanted_record_status(self):
+        record = self.create_record(self.case, 40)
+        self.assertEqual(self.entry().crime_degree, 2)
+        self.assertEqual(self.entry().wanted_since, record.started_at)
+
+        record.status = "arrested"
+        record.save()
+        self.assertIsNone(self.entry())
+
+        record.status = "wanted"
+        record.save()
+        self.assertEqual(self.entry().wanted_since, record.started_at)
+
+        record.delete()
+        self.assertIsNone(self.entry())
+
+    def test_entry_follows_case_status_and_crime_level(self):
+        record = self.create_record(self.case, 40)
+        older_case = self.create_case(CrimeLevel.LEVEL_3, CaseStatus.CLOSED_SOLVED)
+        self.create_record(older_case, 90)
+        # The closed case raises no wanted time but still counts for the degree.
+        self.assertEqual(self.entry().wanted_since, record.started_at)
+
+        self.case.crime_level = CrimeLevel.CRITICAL
+        self.case.save()
+        self.assertEqual(self.entry().crime_degree, 4)
+
+        self.case.status = CaseStatus.CLOSED_UNSOLVED
+        self.case.save()
+        self.assertIsNone(self.entry())
+
+    def test_ranking_is_derived_from_wanted_since_at_read_time(self):
+        self.create_record(self.case, 40)
+        other = Person.objects.create(full_name="Recent")
+        WantedRecord.objects.create(person=other, case=self.create_case(CrimeLevel.CRITICAL))
+
+        with self.assertNumQueries(1):
+            entries = list(most_wanted_queryset())
+        self.assertEqual([(entry.person.full_name, entry.days_wanted, entry.ranking_score) for entry in entries], [("Roy Earle", 40, 80)])
+
+        later = [entry.person_id for entry in most_wanted_queryset(now=timezone.now() + timedelta(days=60))]
+        self.assertEqual(later, [other.id, self.person.id])
+
+    def test_per_person_reward_is_a_single_lookup(self):
+        self.create_record(self.case, 40)
+        recent = Person.objects.create(full_name="Recent")
+        WantedRecord.objects.create(person=recent, case=self.case)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(compute_reward_amount(self.person.id), 40 * 2 * 20000000)
+        with self.assertNumQueries(1):
+            self.assertEqual(compute_reward_amount(recent.id), 0)
+        self.assertEqual(compute_reward_amount(Person.objects.create(full_name="Nobody").id), 0)
+
+        entry = get_most_wanted_entry(self.person.id)
+        self.assertEqual((entry["person"], entry["days_wanted"], entry["ranking_score"]), (self.person, 40, 80))
+        self.assertIsNone(get_most_wanted_entry(recent.id))
+
+    def test_rebuild_repairs_drift_from_bulk_updates(self):
+        record = self.create_record(self.case, 40)
+        WantedRecord.objects.filter(pk=record.pk).update(status="cleared")
+        self.assertEqual(find_most_wanted_drift(), [self.person.id])
+
+        out = StringIO()
+        call_command("rebuild_most_wanted", stdout=out)
+        self.assertIn("1 rows changed", out.getvalue())
+        self.assertEqual(find_most_wanted_drift(), [])
+        self.assertEqual(rebuild_most_wanted(), 0)
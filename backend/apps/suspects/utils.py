@@ -1,40 +1,211 @@
+from datetime import timedelta
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Case, Count, DateTimeField, F, Func, IntegerField, Max, Min, Q, Sum, Value, When
 from django.utils import timezone
 from apps.cases.constants import CRIME_LEVEL_TO_DEGREE, CaseStatus
-from .models import WantedRecord
-
-
-def compute_most_wanted():
-    now = timezone.now()
-    persons = {}
-    records = WantedRecord.objects.select_related("case", "person").all()
-    for record in records:
-        person = record.person
-        if person.id not in persons:
-            persons[person.id] = {
-                "person": person,
-                "days_wanted": 0,
-                "crime_degree": 0,
-            }
-        info = persons[person.id]
-        degree = CRIME_LEVEL_TO_DEGREE.get(record.case.crime_level, 0)
-        if degree > info["crime_degree"]:
-            info["crime_degree"] = degree
-        if record.status == "wanted" and record.case.status in [CaseStatus.ACTIVE, CaseStatus.PENDING_SUPERIOR_APPROVAL]:
-            delta_days = (now - record.started_at).days
-            if delta_days > info["days_wanted"]:
-                info["days_wanted"] = delta_days
-    results = []
-    for info in persons.values():
-        if info["days_wanted"] < 30:
-            continue
-        ranking_score = info["days_wanted"] * info["crime_degree"]
-        reward_amount = ranking_score * 20000000
-        results.append({
-            "person": info["person"],
-            "days_wanted": info["days_wanted"],
-            "crime_degree": info["crime_degree"],
-            "ranking_score": ranking_score,
-            "reward_amount": reward_amount,
-        })
-    results.sort(key=lambda x: x["ranking_score"], reverse=True)
-    return results
+
+
+MOST_WANTED_MIN_DAYS = 30
+REWARD_PER_RANKING_POINT = 20000000
+WANTED_CASE_STATUSES = [CaseStatus.ACTIVE, CaseStatus.PENDING_SUPERIOR_APPROVAL]
+MOST_WANTED_ORDERING = ("-ranking_score", "person_id")
+REBUILD_BATCH_SIZE = 1000
+
+
+class _DaysSince(Func):
+    """Whole days elapsed from ``expression`` until ``moment``, like ``timedelta.days``."""
+
+    output_field = IntegerField()
+
+    def __init__(self, moment, expression):
+        super().__init__(Value(moment, output_field=DateTimeField()), expression)
+
+    def _compile_pair(self, compiler):
+        moment_sql, moment_params = compiler.compile(self.source_expressions[0])
+        since_sql, since_params = compiler.compile(self.source_expressions[1])
+        return moment_sql, since_sql, [*moment_params, *since_params]
+
+    def as_sql(self, compiler, connection, **extra_context):
+        moment_sql, since_sql, params = self._compile_pair(compiler)
+        return f"CAST(FLOOR(EXTRACT(EPOCH FROM ({moment_sql} - {since_sql})) / 86400) AS INTEGER)", params
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        moment_sql, since_sql, params = self._compile_pair(compiler)
+        # Truncating the cast floors the non-negative spans that can pass the 30-day filter.
+        return f"CAST(julianday({moment_sql}) - julianday({since_sql}) AS INTEGER)", params
+
+
+def _models(apps=None):
+    # Data migrations pass their historical app registry.
+    apps = apps or global_apps
+    return (
+        apps.get_model("suspects", "Person"),
+        apps.get_model("suspects", "WantedRecord"),
+        apps.get_model("suspects", "MostWantedEntry"),
+    )
+
+
+def _ranked(entries, now=None):
+    """Keep entries wanted for at least MOST_WANTED_MIN_DAYS days and annotate their ranking.
+
+    ``days_wanted``, ``ranking_score`` and ``reward_amount`` are computed from
+    ``wanted_since`` at read time.
+    """
+
+    now = now or timezone.now()
+    return (
+        entries.filter(wanted_since__lte=now - timedelta(days=MOST_WANTED_MIN_DAYS))
+        .annotate(days_wanted=_DaysSince(now, F("wanted_since")))
+        .annotate(ranking_score=F("days_wanted") * F("crime_degree"))
+        .annotate(reward_amount=F("ranking_score") * Value(REWARD_PER_RANKING_POINT))
+    )
+
+
+def most_wanted_queryset(now=None):
+    """MostWantedEntry rows ranked for the most-wanted list, read with one indexed query."""
+
+    _, _, MostWantedEntry = _models()
+    return _ranked(MostWantedEntry.objects.select_related("person"), now).order_by(*MOST_WANTED_ORDERING)
+
+
+def most_wanted_fingerprint(now=None):
+    """Summarize the ranking in one aggregate query; any change to a rank, degree or day count changes it."""
+
+    _, _, MostWantedEntry = _models()
+    result = _ranked(MostWantedEntry.objects.all(), now).aggregate(
+        count=Count("pk"),
+        last_id=Max("pk"),
+        score=Sum("ranking_score"),
+        degree=Sum("crime_degree"),
+        first_since=Min("wanted_since"),
+        last_since=Max("wanted_since"),
+    )
+    return tuple(sorted(result.items()))
+
+
+def get_most_wanted_entry(person_id, now=None):
+    """Return the most-wanted entry of one person, or None when they are not on the list."""
+
+    entry = most_wanted_queryset(now).filter(person_id=person_id).first()
+    return most_wanted_entry(entry) if entry else None
+
+
+def compute_reward_amount(person_id, now=None):
+    """Reward for information on one person, read by primary key; zero when they are not on the list."""
+
+    _, _, MostWantedEntry = _models()
+    amounts = _ranked(MostWantedEntry.objects.filter(pk=person_id), now).values_list("reward_amount", flat=True)
+    return next(iter(amounts), 0)
+
+
+def most_wanted_entry(entry):
+    return {
+        "person": entry.person,
+        "days_wanted": entry.days_wanted,
+        "crime_degree": entry.crime_degree,
+        "ranking_score": entry.ranking_score,
+        "reward_amount": entry.reward_amount,
+    }
+
+
+def most_wanted_entries(entries):
+    return [most_wanted_entry(entry) for entry in entries]
+
+
+def compute_most_wanted(limit=None):
+    queryset = most_wanted_queryset()
+    if limit is not None:
+        queryset = queryset[:limit]
+    return most_wanted_entries(queryset)
+
+
+def _expected_entries(person_ids, apps=None):
+    """Aggregate ``{person_id: (crime_degree, wanted_since)}`` from the wanted records.
+
+    ``crime_degree`` is the highest degree across all of a person's cases and
+    ``wanted_since`` the start of their oldest open record on an active or pending case;
+    persons without such a record get no entry.
+    """
+
+    _, WantedRecord, _ = _models(apps)
+    degree = Case(
+        *[When(case__crime_level=level, then=Value(value)) for level, value in CRIME_LEVEL_TO_DEGREE.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    rows = (
+        WantedRecord.objects.filter(person_id__in=person_ids)
+        .values("person_id")
+        .annotate(
+            crime_degree=Max(degree),
+            wanted_since=Min("started_at", filter=Q(status="wanted", case__status__in=WANTED_CASE_STATUSES)),
+        )
+        .order_by()
+    )
+    return {row["person_id"]: (row["crime_degree"], row["wanted_since"]) for row in rows if row["wanted_since"]}
+
+
+def diff_most_wanted(person_ids, apps=None):
+    """Compare stored entries with the wanted records and return ``(changed, stale_ids)``."""
+
+    _, _, MostWantedEntry = _models(apps)
+    expected = _expected_entries(person_ids, apps)
+    stored = {
+        person_id: (crime_degree, wanted_since)
+        for person_id, crime_degree, wanted_since in MostWantedEntry.objects.filter(person_id__in=person_ids).values_list(
+            "person_id", "crime_degree", "wanted_since"
+        )
+    }
+    changed = {person_id: values for person_id, values in expected.items() if stored.get(person_id) != values}
+    stale_ids = [person_id for person_id in stored if person_id not in expected]
+    return changed, stale_ids
+
+
+def sync_most_wanted(person_ids, apps=None):
+    """Bring the MostWantedEntry rows of the given persons in line with their wanted records; returns the rows changed."""
+
+    _, _, MostWantedEntry = _models(apps)
+    person_ids = list(person_ids)
+    if not person_ids:
+        return 0
+    changed, stale_ids = diff_most_wanted(person_ids, apps)
+    with transaction.atomic():
+        if stale_ids:
+            MostWantedEntry.objects.filter(person_id__in=stale_ids).delete()
+        if changed:
+            MostWantedEntry.objects.bulk_create(
+                [
+                    MostWantedEntry(person_id=person_id, crime_degree=crime_degree, wanted_since=wanted_since)
+                    for person_id, (crime_degree, wanted_since) in changed.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["person"],
+                update_fields=["crime_degree", "wanted_since"],
+            )
+    return len(changed) + len(stale_ids)
+
+
+def _person_id_batches(batch_size, apps=None):
+    Person, _, _ = _models(apps)
+    last_id = 0
+    while True:
+        batch = list(Person.objects.filter(pk__gt=last_id).order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def rebuild_most_wanted(batch_size=REBUILD_BATCH_SIZE, apps=None):
+    return sum(sync_most_wanted(batch, apps) for batch in _person_id_batches(batch_size, apps))
+
+
+def find_most_wanted_drift(batch_size=REBUILD_BATCH_SIZE):
+    """Return ids of persons whose stored MostWantedEntry disagrees with their wanted records."""
+
+    drifted = []
+    for batch in _person_id_batches(batch_size):
+        changed, stale_ids = diff_most_wanted(batch)
+        drifted.extend(sorted([*changed, *stale_ids]))
+    return drifted
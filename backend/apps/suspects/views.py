@@ -1,4 +1,5 @@
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
@@ -8,8 +9,10 @@ from drf_spectacular.utils import extend_schema
 from apps.rbac.permissions import RoleRequiredPermission
 from apps.rbac.constants import ROLE_DETECTIVE, ROLE_SERGEANT, ROLE_SYSTEM_ADMIN, ROLE_POLICE_CHIEF, ROLE_CAPTAIN, ROLE_POLICE_OFFICER
 from .models import Person, SuspectCandidate, WantedRecord
-from apps.notifications.models import Notification
+from apps.notifications.dispatch import notify
 from apps.cases.policies import can_user_access_case
+from police_portal.conditional import conditional_response, make_etag
+from police_portal.pagination import PAGINATION_PARAMETERS, paginated_response
 from .serializers import (
     SuspectProposalSerializer,
     SuspectCandidateSerializer,
@@ -18,7 +21,7 @@ from .serializers import (
     PersonSerializer,
     SuspectStatusUpdateSerializer,
 )
-from .utils import compute_most_wanted
+from .utils import MOST_WANTED_ORDERING, most_wanted_entries, most_wanted_fingerprint, most_wanted_queryset
 from apps.cases.models import Case
 
 
@@ -61,10 +64,11 @@ class SergeantDecisionView(APIView):
     required_roles = [ROLE_SERGEANT]
 
     @extend_schema(request=SergeantDecisionSerializer, responses={200: SuspectCandidateSerializer})
+    @transaction.atomic
     def post(self, request, case_id, suspect_id):
         """Approve or reject a suspect candidate and notify the proposing detective."""
 
-        candidate = get_object_or_404(SuspectCandidate, id=suspect_id, case_id=case_id)
+        candidate = get_object_or_404(SuspectCandidate.objects.select_related("case"), id=suspect_id, case_id=case_id)
         if not can_user_access_case(request.user, candidate.case):
             return Response(
                 {"error": {"code": "forbidden", "message": "Not authorized for this case", "details": {}}},
@@ -83,10 +87,10 @@ class SergeantDecisionView(APIView):
         candidate.decided_at = timezone.now()
         candidate.save()
         if candidate.proposed_by_detective_id:
-            Notification.objects.create(
-                user=candidate.proposed_by_detective,
-                case=candidate.case,
-                type="suspect_decision",
+            notify(
+                candidate.proposed_by_detective_id,
+                "suspect_decision",
+                case=candidate.case_id,
                 payload={
                     "candidate_id": candidate.id,
                     "status": candidate.status,
@@ -96,29 +100,43 @@ class SergeantDecisionView(APIView):
         return Response(SuspectCandidateSerializer(candidate).data, status=status.HTTP_200_OK)
 
 
+def _serialize_most_wanted(entries):
+    return MostWantedSerializer(most_wanted_entries(entries), many=True).data
+
+
+def _most_wanted_response(request, view, private):
+    now = timezone.now()
+    return conditional_response(
+        request,
+        lambda: paginated_response(request, view, most_wanted_queryset(now), _serialize_most_wanted),
+        make_etag("most-wanted", most_wanted_fingerprint(now)),
+        private=private,
+    )
+
+
 class MostWantedPublicView(APIView):
     permission_classes = [AllowAny]
+    query_budget = 2
+    pagination_ordering = MOST_WANTED_ORDERING
 
-    @extend_schema(request=None, responses={200: MostWantedSerializer(many=True)})
+    @extend_schema(request=None, parameters=PAGINATION_PARAMETERS, responses={200: MostWantedSerializer(many=True)})
     def get(self, request):
         """Return the public most-wanted ranking visible to all users."""
 
-        results = compute_most_wanted()
-        serializer = MostWantedSerializer(results, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return _most_wanted_response(request, self, private=False)
 
 
 class MostWantedPoliceView(APIView):
     permission_classes = [RoleRequiredPermission]
     required_roles = [ROLE_POLICE_OFFICER, ROLE_SERGEANT, ROLE_CAPTAIN, ROLE_POLICE_CHIEF, ROLE_SYSTEM_ADMIN]
+    query_budget = 4
+    pagination_ordering = MOST_WANTED_ORDERING
 
-    @extend_schema(request=None, responses={200: MostWantedSerializer(many=True)})
+    @extend_schema(request=None, parameters=PAGINATION_PARAMETERS, responses={200: MostWantedSerializer(many=True)})
     def get(self, request):
         """Return the police-facing most-wanted ranking for authorized staff."""
 
-        results = compute_most_wanted()
-        serializer = MostWantedSerializer(results, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return _most_wanted_response(request, self, private=True)
 
 
 class SuspectStatusUpdateView(APIView):
@@ -0,0 +1,150 @@
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch, prefetch_related_objects
+from apps.accounts.models import User
+from apps.cases.models import CaseAssignment, CaseComplainant, CaseReview, CrimeSceneWitness
+from apps.cases.serializers import CaseSerializer
+from apps.evidence.models import Evidence
+from apps.evidence.serializers import EvidenceSerializer, with_evidence_details
+from apps.interrogations.models import Interrogation
+from apps.interrogations.serializers import InterrogationSerializer
+from apps.rbac.utils import annotate_role_slugs, annotated_role_slugs
+from apps.suspects.models import SuspectCandidate
+from apps.suspects.serializers import SuspectCandidateSerializer
+
+
+# Relations of a case loaded with select_related("complaint", "crime_scene_report") that
+# the report reads. Each lookup costs one query however large the case is.
+REPORT_PREFETCHES = (
+    Prefetch("complainants", queryset=CaseComplainant.objects.order_by("pk")),
+    Prefetch("complaint__reviews", queryset=CaseReview.objects.order_by("pk")),
+    Prefetch("crime_scene_report__witnesses", queryset=CrimeSceneWitness.objects.order_by("pk")),
+    Prefetch("evidence", queryset=with_evidence_details(Evidence.objects.order_by("pk"))),
+    Prefetch("suspect_candidates", queryset=SuspectCandidate.objects.select_related("person").order_by("pk")),
+    Prefetch("interrogations", queryset=Interrogation.objects.order_by("pk")),
+    Prefetch("assignments", queryset=CaseAssignment.objects.order_by("pk")),
+    Prefetch("assignments__user", queryset=annotate_role_slugs(User.objects.all())),
+)
+
+
+def _crime_scene_report(case):
+    # Reverse one-to-one access raises when the case has no report.
+    return getattr(case, "crime_scene_report", None)
+
+
+def build_case_report(case):
+    """Assemble the judge-facing report of a case loaded with select_related("complaint", "crime_scene_report").
+
+    Every section is read from prefetched relations, so the report takes a fixed number of
+    queries independent of how much evidence, suspects and staff the case has.
+    """
+
+    prefetch_related_objects([case], *REPORT_PREFETCHES)
+    complaint = case.complaint
+    crime_scene = _crime_scene_report(case)
+    return {
+        "case": CaseSerializer(case).data,
+        "complaint": {
+            "id": complaint.id,
+            "status": complaint.status,
+            "strike_count": complaint.strike_count,
+            "last_message": complaint.last_message,
+        } if complaint else None,
+        "crime_scene_report": {
+            "id": crime_scene.id,
+            "status": crime_scene.status,
+            "scene_datetime": crime_scene.scene_datetime,
+            "reported_by": crime_scene.reported_by_id,
+            "approved_by": crime_scene.approved_by_id,
+            "approved_at": crime_scene.approved_at,
+            "witnesses": [
+                {
+                    "full_name": w.full_name,
+                    "phone": w.phone,
+                    "national_id": w.national_id,
+                }
+                for w in crime_scene.witnesses.all()
+            ],
+        } if crime_scene else None,
+        "reviews": [
+            {"decision": r.decision, "message": r.message, "reviewer": r.reviewer_id, "created_at": r.created_at}
+            for r in (complaint.reviews.all() if complaint else [])
+        ],
+        "evidence": EvidenceSerializer(case.evidence.all(), many=True).data,
+        "suspects": SuspectCandidateSerializer(case.suspect_candidates.all(), many=True).data,
+        "interrogations": InterrogationSerializer(case.interrogations.all(), many=True).data,
+        "assignments": [
+            {
+                "user": {
+                    "id": a.user_id,
+                    "username": a.user.username,
+                    "first_name": a.user.first_name,
+                    "last_name": a.user.last_name,
+                    "national_id": a.user.national_id,
+                    "roles": annotated_role_slugs(a.user),
+                },
+                "role_in_case": a.role_in_case,
+                "assigned_at": a.assigned_at,
+            }
+            for a in case.assignments.all()
+        ],
+    }
+
+
+def _version_cache_key(case_id):
+    return f"trials:case-report:version:{case_id}"
+
+
+def _snapshot_cache_key(case_id):
+    return f"trials:case-report:snapshot:{case_id}"
+
+
+def _new_version(case_ids):
+    # Random tokens rather than counters, so an evicted version key can never come back
+    # with a value matching an older snapshot. Versions expire with the snapshots, so a
+    # worker that missed a bump stops serving, and validating ETags against, an old version.
+    versions = {case_id: uuid.uuid4().hex for case_id in case_ids}
+    cache.set_many(
+        {_version_cache_key(case_id): version for case_id, version in versions.items()},
+        settings.CASE_REPORT_CACHE_TIMEOUT,
+    )
+    return versions
+
+
+def bump_case_report_versions(case_ids):
+    """Outdate the cached report snapshots of the given cases."""
+
+    _new_version(case_ids)
+
+
+def load_case_report_snapshot(case_id):
+    """Return ``(version, report)`` with one cache read; ``report`` is None unless a snapshot of that version exists.
+
+    Without a matching snapshot a new version is started, so every rebuilt report gets
+    an ETag of its own.
+    """
+
+    version_key = _version_cache_key(case_id)
+    cached = cache.get_many([version_key, _snapshot_cache_key(case_id)])
+    version = cached.get(version_key)
+    snapshot = cached.get(_snapshot_cache_key(case_id))
+    if version is not None and snapshot is not None and snapshot["version"] == version:
+        return version, snapshot["report"]
+    return _new_version([case_id])[case_id], None
+
+
+def store_case_report_snapshot(case, version):
+    """Build the case's report and cache it as the snapshot of ``version``, read before building.
+
+    A change committed while the report is built bumps the version, so the stored
+    snapshot is outdated on the next read instead of being served stale.
+    """
+
+    report = build_case_report(case)
+    cache.set(
+        _snapshot_cache_key(case.pk),
+        {"version": version, "report": report},
+        settings.CASE_REPORT_CACHE_TIMEOUT,
+    )
+    return report
@@ -0,0 +1,88 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from apps.cases.models import (
+    Case,
+    CaseAssignment,
+    CaseComplainant,
+    CaseReview,
+    Complaint,
+    CrimeSceneReport,
+    CrimeSceneWitness,
+)
+from apps.evidence.models import (
+    EvidenceMedia,
+    Evidence,
+    IdentityDocumentEvidence,
+    MedicalEvidence,
+    MedicalEvidenceImage,
+    VehicleEvidence,
+    WitnessStatementEvidence,
+)
+from apps.interrogations.models import Interrogation
+from apps.rbac.models import Role, UserRole
+from apps.suspects.models import SuspectCandidate
+from .reports import bump_case_report_versions
+
+
+# Versions are bumped immediately for the current process and again on commit, so a
+# concurrent reader cannot cache a pre-commit report under the post-commit version.
+# Persons and user profiles are not editable through the API and are not tracked.
+
+
+def _evidence_case_ids(**lookup):
+    return Evidence.objects.filter(**lookup).values_list("case_id", flat=True)
+
+
+def _complaint_case_ids(complaint_id):
+    return Case.objects.filter(complaint_id=complaint_id).values_list("pk", flat=True)
+
+
+def _assigned_case_ids(**lookup):
+    return CaseAssignment.objects.filter(**lookup).values_list("case_id", flat=True).distinct()
+
+
+# Sender -> the ids of the cases whose report shows the saved or deleted instance.
+REPORT_CASE_IDS = {
+    Case: lambda instance: [instance.pk],
+    Complaint: lambda instance: _complaint_case_ids(instance.pk),
+    CaseComplainant: lambda instance: [instance.case_id],
+    CaseReview: lambda instance: _complaint_case_ids(instance.complaint_id),
+    CrimeSceneReport: lambda instance: [instance.case_id],
+    CrimeSceneWitness: lambda instance: CrimeSceneReport.objects.filter(pk=instance.report_id).values_list(
+        "case_id", flat=True
+    ),
+    CaseAssignment: lambda instance: [instance.case_id],
+    Evidence: lambda instance: [instance.case_id],
+    WitnessStatementEvidence: lambda instance: _evidence_case_ids(pk=instance.evidence_id),
+    EvidenceMedia: lambda instance: _evidence_case_ids(witness_statement=instance.witness_statement_id),
+    MedicalEvidence: lambda instance: _evidence_case_ids(pk=instance.evidence_id),
+    MedicalEvidenceImage: lambda instance: _evidence_case_ids(medical=instance.medical_evidence_id),
+    VehicleEvidence: lambda instance: _evidence_case_ids(pk=instance.evidence_id),
+    IdentityDocumentEvidence: lambda instance: _evidence_case_ids(pk=instance.evidence_id),
+    SuspectCandidate: lambda instance: [instance.case_id],
+    Interrogation: lambda instance: [instance.case_id],
+    # Reports list the roles of assigned users. Deleting a role deletes its UserRole rows,
+    # which bump on their own.
+    UserRole: lambda instance: _assigned_case_ids(user_id=instance.user_id),
+}
+
+
+def _bump_case_reports(case_ids):
+    case_ids = {case_id for case_id in case_ids if case_id is not None}
+    if case_ids:
+        bump_case_report_versions(case_ids)
+        transaction.on_commit(lambda: bump_case_report_versions(case_ids))
+
+
+def bump_reports_of_instance(sender, instance, **kwargs):
+    _bump_case_reports(REPORT_CASE_IDS[sender](instance))
+
+
+def bump_reports_of_role(sender, instance, **kwargs):
+    _bump_case_reports(_assigned_case_ids(user__user_roles__role_id=instance.pk))
+
+
+for model in REPORT_CASE_IDS:
+    post_save.connect(bump_reports_of_instance, sender=model, dispatch_uid=f"case-report-save-{model._meta.label}")
+    post_delete.connect(bump_reports_of_instance, sender=model, dispatch_uid=f"case-report-delete-{model._meta.label}")
+post_save.connect(bump_reports_of_role, sender=Role, dispatch_uid="case-report-save-rbac.Role")
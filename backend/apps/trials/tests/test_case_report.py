@@ -0,0 +1,196 @@
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.accounts.models import User
+from apps.cases.constants import CaseSourceType, CaseStatus, CrimeLevel
+from apps.cases.models import Case, CaseAssignment, CaseReview, Complaint, CrimeSceneReport, CrimeSceneWitness
+from apps.evidence.models import (
+    Evidence,
+    EvidenceMedia,
+    IdentityDocumentEvidence,
+    MedicalEvidence,
+    MedicalEvidenceImage,
+    VehicleEvidence,
+    WitnessStatementEvidence,
+)
+from apps.interrogations.models import Interrogation
+from apps.rbac.constants import ROLE_DETECTIVE, ROLE_POLICE_CHIEF, ROLE_SERGEANT
+from apps.rbac.models import Role, UserRole
+from apps.suspects.models import Person, SuspectCandidate
+from apps.trials import reports
+from apps.trials.reports import bump_case_report_versions
+from apps.trials.views import CaseReportView
+from police_portal.testing import assert_max_queries
+
+
+def create_user(username, *role_slugs):
+    user = User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        phone=f"{username}123",
+        national_id=f"{username}nid",
+        password="Pass1234!",
+        first_name="Report",
+        last_name="User",
+    )
+    for role_slug in role_slugs:
+        role, _ = Role.objects.get_or_create(slug=role_slug, defaults={"name": role_slug, "is_system": True})
+        UserRole.objects.create(user=user, role=role)
+    return user
+
+
+class CaseReportTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.chief = create_user("report_chief", ROLE_POLICE_CHIEF)
+        self.client.force_authenticate(self.chief)
+
+    def seed_case(self, name, size):
+        """A case with ``size`` rows in every report section."""
+
+        complaint = Complaint.objects.create(
+            title=name, description="Desc", crime_level=CrimeLevel.LEVEL_1, location="Loc", created_by=self.chief
+        )
+        case = Case.objects.create(
+            title=name,
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_1,
+            location="Loc",
+            status=CaseStatus.ACTIVE,
+            source_type=CaseSourceType.COMPLAINT,
+            created_by=self.chief,
+            complaint=complaint,
+        )
+        report = CrimeSceneReport.objects.create(case=case, reported_by=self.chief, scene_datetime=timezone.now())
+        for index in range(size):
+            CaseReview.objects.create(complaint=complaint, reviewer=self.chief, decision="approve")
+            CrimeSceneWitness.objects.create(report=report, full_name=f"Witness {index}", phone=f"{index}", national_id=f"w{index}")
+
+            statement = WitnessStatementEvidence.objects.create(
+                evidence=Evidence.objects.create(case=case, title="Statement", evidence_type="witness_statement"),
+                transcription="Saw it",
+            )
+            EvidenceMedia.objects.create(witness_statement=statement, file="evidence_media/statement.mp3", media_type="audio")
+            medical = MedicalEvidence.objects.create(
+                evidence=Evidence.objects.create(case=case, title="Autopsy", evidence_type="medical")
+            )
+            MedicalEvidenceImage.objects.create(medical_evidence=medical, image="medical_evidence/scan.png")
+            VehicleEvidence.objects.create(
+                evidence=Evidence.objects.create(case=case, title="Car", evidence_type="vehicle"),
+                model="Sedan",
+                color="Black",
+                license_plate=f"PLATE{index}",
+            )
+            IdentityDocumentEvidence.objects.create(
+                evidence=Evidence.objects.create(case=case, title="ID", evidence_type="identity_document"),
+                owner_full_name="Owner",
+            )
+
+            person = Person.objects.create(full_name=f"{name} suspect {index}")
+            SuspectCandidate.objects.create(case=case, person=person, rationale="Motive")
+            Interrogation.objects.create(case=case, suspect=person, detective_score=5)
+            detective = create_user(f"{name}_detective_{index}", ROLE_DETECTIVE, ROLE_SERGEANT)
+            CaseAssignment.objects.create(case=case, user=detective, role_in_case="detective")
+        return case
+
+    def get_report(self, case, rebuild=True):
+        if rebuild:
+            bump_case_report_versions([case.pk])
+        with CaptureQueriesContext(connection) as captured:
+            with assert_max_queries(CaseReportView):
+                res = self.client.get(f"/api/v1/cases/{case.id}/report/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.data, len(captured.captured_queries)
+
+    def test_report_query_count_does_not_grow_with_the_case(self):
+        small = self.seed_case("small", 1)
+        large = self.seed_case("large", 25)
+        self.get_report(small)
+
+        _, small_queries = self.get_report(small)
+        data, large_queries = self.get_report(large)
+        self.assertEqual(large_queries, small_queries)
+
+        self.assertEqual(len(data["evidence"]), 100)
+        by_type = {item["evidence_type"]: item for item in data["evidence"]}
+        self.assertEqual(len(by_type["witness_statement"]["witness_statement"]["media"]), 1)
+        self.assertEqual(len(by_type["medical"]["medical"]["images"]), 1)
+        self.assertEqual(by_type["vehicle"]["vehicle"]["model"], "Sedan")
+        self.assertEqual(by_type["identity_document"]["identity_document"]["owner_full_name"], "Owner")
+        self.assertEqual(data["suspects"][0]["person"]["full_name"], "large suspect 0")
+        self.assertEqual(len(data["interrogations"]), 25)
+        self.assertEqual(len(data["reviews"]), 25)
+        self.assertEqual(len(data["crime_scene_report"]["witnesses"]), 25)
+        self.assertEqual(data["assignments"][0]["user"]["username"], "large_detective_0")
+        self.assertEqual(data["assignments"][0]["user"]["roles"], [ROLE_DETECTIVE, ROLE_SERGEANT])
+
+    def test_report_without_complaint_or_crime_scene(self):
+        case = Case.objects.create(
+            title="Bare",
+            description="Desc",
+            crime_level=CrimeLevel.LEVEL_1,
+            location="Loc",
+            status=CaseStatus.ACTIVE,
+            source_type=CaseSourceType.CRIME_SCENE,
+            created_by=self.chief,
+        )
+        data, _ = self.get_report(case)
+        self.assertIsNone(data["complaint"])
+        self.assertIsNone(data["crime_scene_report"])
+        self.assertEqual((data["reviews"], data["evidence"], data["assignments"]), ([], [], []))
+
+    def test_repeat_views_are_served_from_the_snapshot(self):
+        case = self.seed_case("cached", 2)
+        first, _ = self.get_report(case)
+        with mock.patch.object(reports, "build_case_report") as build:
+            with mock.patch.object(reports.cache, "get_many", wraps=reports.cache.get_many) as get_many:
+                with assert_max_queries(CaseReportView, 1):
+                    res = self.client.get(f"/api/v1/cases/{case.id}/report/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, first)
+        build.assert_not_called()
+        report_reads = [call for call in get_many.call_args_list if call.args[0][0].startswith("trials:")]
+        self.assertEqual(len(report_reads), 1)
+
+    def test_expired_snapshot_is_rebuilt_under_a_new_etag(self):
+        case = self.seed_case("expired", 1)
+        url = f"/api/v1/cases/{case.id}/report/"
+        first = self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # A worker whose snapshot expired, without ever seeing a bump.
+        cache.delete(reports._snapshot_cache_key(case.pk))
+        rebuilt = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(rebuilt.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(rebuilt["ETag"], first["ETag"])
+
+        cache.delete(reports._version_cache_key(case.pk))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=rebuilt["ETag"]).status_code, status.HTTP_200_OK)
+
+    def test_edits_outdate_the_snapshot(self):
+        case = self.seed_case("edited", 1)
+        outsider = create_user("report_outsider", ROLE_POLICE_CHIEF)
+        self.get_report(case)
+
+        vehicle = VehicleEvidence.objects.get(evidence__case=case)
+        vehicle.color = "Red"
+        vehicle.save()
+        Interrogation.objects.filter(case=case).get().delete()
+        CrimeSceneWitness.objects.filter(report__case=case).get().delete()
+        detective = CaseAssignment.objects.get(case=case).user
+        UserRole.objects.filter(user=detective, role__slug=ROLE_SERGEANT).delete()
+
+        data, _ = self.get_report(case, rebuild=False)
+        vehicle_data = next(item for item in data["evidence"] if item["evidence_type"] == "vehicle")
+        self.assertEqual(vehicle_data["vehicle"]["color"], "Red")
+        self.assertEqual(data["interrogations"], [])
+        self.assertEqual(data["crime_scene_report"]["witnesses"], [])
+        self.assertEqual(data["assignments"][0]["user"]["roles"], [ROLE_DETECTIVE])
+
+        self.client.force_authenticate(outsider)
+        res = self.client.get(f"/api/v1/cases/{case.id}/report/")
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,49 @@
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """Quote a strong ETag digested from validator parts such as timestamps, counts and ids."""
+
+    return '"%s"' % hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def collection_fingerprint(queryset, modified_field=None, **extra_aggregates):
+    """Summarize a collection in one aggregate query: row count, highest id and, optionally, latest modification.
+
+    Ids only grow, so the count and highest id change whenever rows are added or removed;
+    ``modified_field`` covers in-place edits.
+    """
+
+    aggregates = {"count": Count("pk"), "last_id": Max("pk"), **extra_aggregates}
+    if modified_field:
+        aggregates["modified"] = Max(modified_field)
+    result = queryset.order_by().aggregate(**aggregates)
+    return tuple(sorted(result.items()))
+
+
+def conditional_response(request, build, etag, last_modified=None, private=True):
+    """Answer 304 when the client's ``If-None-Match``/``If-Modified-Since`` still match, otherwise call ``build``.
+
+    Call it after the view's own authorization checks so a 304 never reveals a resource
+    the caller cannot read. Validators are attached to successful responses; private
+    responses also vary on Authorization, and ``no-cache`` makes clients revalidate.
+    """
+
+    last_modified_timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_timestamp)
+    if response is None:
+        response = build()
+        if response.status_code != 200:
+            return response
+    response["ETag"] = etag
+    if last_modified_timestamp is not None:
+        response["Last-Modified"] = http_date(last_modified_timestamp)
+    if private:
+        patch_vary_headers(response, ["Authorization"])
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
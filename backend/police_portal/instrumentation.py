@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import connections
+from rest_framework import serializers
+from . import metrics as prometheus
+
+
+logger = logging.getLogger("police_portal.queries")
+
+# Metrics of the request being handled. The scope is opened by QueryInstrumentationMiddleware;
+# queries and serializer work outside of it are not recorded.
+_current_metrics = ContextVar("police_portal_request_metrics", default=None)
+
+# Callbacks receiving ``(view_class, metrics)`` after every instrumented request.
+_observers = []
+
+_base_serializer_data = serializers.BaseSerializer.data
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class RequestMetrics:
+    def __init__(self, method=None, capture_sql=False):
+        self.method = method
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.response_size = 0
+        self.capture_sql = capture_sql
+        self.queries = []
+        self.serializer_depth = 0
+
+    def record_query(self, sql, duration):
+        self.query_count += 1
+        self.db_time += duration
+        if self.capture_sql:
+            self.queries.append(sql)
+
+
+class ViewMetricsRegistry:
+    """Process-local totals per view class, read by the metrics endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view_name, metrics, over_budget=False):
+        with self._lock:
+            entry = self._views.setdefault(
+                view_name,
+                {
+                    "requests": 0,
+                    "queries": 0,
+                    "max_queries": 0,
+                    "db_time": 0.0,
+                    "serializer_time": 0.0,
+                    "response_bytes": 0,
+                    "over_budget": 0,
+                },
+            )
+            entry["requests"] += 1
+            entry["queries"] += metrics.query_count
+            entry["max_queries"] = max(entry["max_queries"], metrics.query_count)
+            entry["db_time"] += metrics.db_time
+            entry["serializer_time"] += metrics.serializer_time
+            entry["response_bytes"] += metrics.response_size
+            entry["over_budget"] += int(over_budget)
+
+    def snapshot(self):
+        with self._lock:
+            return {view_name: dict(entry) for view_name, entry in self._views.items()}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+view_metrics = ViewMetricsRegistry()
+
+
+def current_metrics():
+    return _current_metrics.get()
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, time.perf_counter() - start)
+
+
+def _timed_serializer_data(self):
+    metrics = _current_metrics.get()
+    # Only the outermost serializer is timed so nested `.data` reads are not counted twice.
+    if metrics is None or metrics.serializer_depth:
+        return _base_serializer_data.fget(self)
+    metrics.serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        return _base_serializer_data.fget(self)
+    finally:
+        metrics.serializer_depth -= 1
+        metrics.serializer_time += time.perf_counter() - start
+
+
+def install_serializer_timing():
+    if serializers.BaseSerializer.data is _base_serializer_data:
+        serializers.BaseSerializer.data = property(_timed_serializer_data)
+
+
+def resolve_view_class(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    return getattr(match.func, "view_class", None) or getattr(match.func, "cls", None)
+
+
+def get_query_budget(view_class, method=None):
+    """Return the view's ``query_budget``: an int for every method, or a dict keyed by HTTP method."""
+
+    budget = getattr(view_class, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(method)
+    return budget
+
+
+@contextmanager
+def observe_requests(callback):
+    """Call ``callback(view_class, metrics)`` for each request handled inside the block, with SQL captured."""
+
+    _observers.append(callback)
+    try:
+        yield
+    finally:
+        _observers.remove(callback)
+
+
+class QueryInstrumentationMiddleware:
+    """Count queries, DB time, serializer time and response size for each request.
+
+    Totals are aggregated per view class in ``view_metrics`` and per route in the
+    Prometheus registry; with QUERY_METRICS_HEADERS enabled they are also returned as
+    ``X-*`` response headers. Views declare the
+    queries they may run with a ``query_budget`` attribute: going over it logs a
+    warning, and raises QueryBudgetExceeded when QUERY_BUDGET_STRICT is enabled.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install_serializer_timing()
+
+    def __call__(self, request):
+        metrics = RequestMetrics(method=request.method, capture_sql=bool(_observers))
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                stack.enter_context(prometheus.track_in_flight())
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_record_query))
+                response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        prometheus.observe_request(request, response.status_code, time.perf_counter() - start, metrics)
+        if not response.streaming:
+            metrics.response_size = len(response.content)
+        view_class = resolve_view_class(request)
+        view_name = view_class.__name__ if view_class else "unresolved"
+        budget = get_query_budget(view_class, request.method)
+        over_budget = budget is not None and metrics.query_count > budget
+        view_metrics.record(view_name, metrics, over_budget=over_budget)
+        for callback in list(_observers):
+            callback(view_class, metrics)
+        if settings.QUERY_METRICS_HEADERS:
+            response["X-Query-Count"] = str(metrics.query_count)
+            response["X-DB-Time-Ms"] = f"{metrics.db_time * 1000:.2f}"
+            response["X-Serializer-Time-Ms"] = f"{metrics.serializer_time * 1000:.2f}"
+            response["X-Response-Size"] = str(metrics.response_size)
+        if over_budget:
+            message = f"{view_name} ran {metrics.query_count} queries, over its budget of {budget}"
+            logger.warning("%s (%s %s)", message, request.method, request.path)
+            if settings.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceeded(message)
+        return response
@@ -0,0 +1,287 @@
+import atexit
+import glob
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+from django.conf import settings
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+GATEWAY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0)
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# name -> (type, help, histogram buckets). Exposition follows this order.
+METRICS = {
+    "police_http_requests_total": (COUNTER, "HTTP responses by route, method and status code.", None),
+    "police_http_request_duration_seconds": (HISTOGRAM, "HTTP request latency by route and method.", LATENCY_BUCKETS),
+    "police_http_requests_in_flight": (GAUGE, "HTTP requests currently being handled.", None),
+    "police_db_queries_per_request": (HISTOGRAM, "Database queries run by one request, by route.", QUERY_COUNT_BUCKETS),
+    "police_db_time_seconds": (HISTOGRAM, "Time spent in database queries by one request, by route.", LATENCY_BUCKETS),
+    "police_payment_gateway_duration_seconds": (
+        HISTOGRAM,
+        "Payment gateway call latency by operation and outcome.",
+        GATEWAY_BUCKETS,
+    ),
+}
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class _Shard:
+    """Samples written by one thread. Only that thread mutates it, so writes take no lock."""
+
+    def __init__(self):
+        self.values = {}
+        self.histograms = {}
+
+    def merge(self, values, histograms):
+        for key, value in list(values.items()):
+            self.values[key] = self.values.get(key, 0) + value
+        for key, slots in list(histograms.items()):
+            _add_slots(self.histograms, key, list(slots))
+
+
+class _ThreadMarker:
+    """Held only by a thread's local storage, so it is collected when the thread exits."""
+
+
+class MetricsRegistry:
+    """Per-process accumulators, sharded per thread and merged when scraped.
+
+    Servers that start a thread per connection would leave one shard per request
+    behind, so a thread's shard is folded into a shared retired shard when it exits.
+
+    With METRICS_MULTIPROC_DIR set, every process also writes its totals to
+    ``<dir>/<pid>.json`` every METRICS_FLUSH_INTERVAL seconds, and a scrape merges the
+    files of all workers. Gauges are only merged from processes that are still alive.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard()
+        self._flusher = None
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            self._local.marker = _ThreadMarker()
+            weakref.finalize(self._local.marker, self._retire, shard)
+            self._start_flusher()
+        return shard
+
+    def _retire(self, shard):
+        with self._lock:
+            self._shards.remove(shard)
+            self._retired.merge(shard.values, shard.histograms)
+
+    def inc(self, name, labels=(), amount=1):
+        values = self._shard().values
+        key = (name, labels)
+        values[key] = values.get(key, 0) + amount
+
+    def observe(self, name, value, labels=()):
+        histograms = self._shard().histograms
+        key = (name, labels)
+        buckets = METRICS[name][2]
+        # One slot per bucket plus +Inf, then the sum; cumulated at exposition time.
+        slots = histograms.get(key)
+        if slots is None:
+            slots = histograms[key] = [0] * (len(buckets) + 2)
+        slots[bisect_left(buckets, value)] += 1
+        slots[-1] += value
+
+    def collect(self):
+        """Return this process's ``(values, histograms)`` summed over all threads."""
+
+        total = _Shard()
+        with self._lock:
+            # Copied together, so a shard retiring during the merge is counted once.
+            shards = list(self._shards)
+            total.merge(self._retired.values, self._retired.histograms)
+        for shard in shards:
+            total.merge(shard.values, shard.histograms)
+        return total.values, total.histograms
+
+    def reset(self):
+        with self._lock:
+            for shard in [self._retired, *self._shards]:
+                shard.values.clear()
+                shard.histograms.clear()
+
+    def _start_flusher(self):
+        if not settings.METRICS_MULTIPROC_DIR or self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            # Started lazily so pre-forking servers start one flusher per worker.
+            self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flusher", daemon=True)
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(settings.METRICS_FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        directory = settings.METRICS_MULTIPROC_DIR
+        if not directory:
+            return
+        values, histograms = self.collect()
+        pid = os.getpid()
+        payload = {
+            "pid": pid,
+            "values": [[name, list(labels), value] for (name, labels), value in values.items()],
+            "histograms": [[name, list(labels), slots] for (name, labels), slots in histograms.items()],
+        }
+        path = os.path.join(directory, f"{pid}.json")
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as handle:
+            json.dump(payload, handle)
+        os.replace(temporary, path)
+
+    def aggregate(self):
+        """Return ``(values, histograms)`` for this process, or for all workers in multiprocess mode."""
+
+        directory = settings.METRICS_MULTIPROC_DIR
+        if not directory:
+            return self.collect()
+        self.flush()
+        values = {}
+        histograms = {}
+        for path in glob.glob(os.path.join(directory, "*.json")):
+            try:
+                with open(path) as handle:
+                    payload = json.load(handle)
+            except (OSError, ValueError):
+                continue
+            alive = _process_alive(payload["pid"])
+            for name, labels, value in payload["values"]:
+                if METRICS.get(name, (None,))[0] == GAUGE and not alive:
+                    continue
+                key = (name, _label_tuple(labels))
+                values[key] = values.get(key, 0) + value
+            for name, labels, slots in payload["histograms"]:
+                _add_slots(histograms, (name, _label_tuple(labels)), slots)
+        return values, histograms
+
+
+def _label_tuple(labels):
+    return tuple(tuple(pair) for pair in labels)
+
+
+def _add_slots(histograms, key, slots):
+    current = histograms.get(key)
+    if current is None:
+        histograms[key] = slots
+    else:
+        for index, value in enumerate(slots):
+            current[index] += value
+
+
+def _process_alive(pid):
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+registry = MetricsRegistry()
+
+
+def route_name(request):
+    match = getattr(request, "resolver_match", None)
+    return (match.url_name if match else None) or UNMATCHED_ROUTE
+
+
+@contextmanager
+def track_in_flight():
+    registry.inc("police_http_requests_in_flight")
+    try:
+        yield
+    finally:
+        registry.inc("police_http_requests_in_flight", amount=-1)
+
+
+def observe_request(request, status_code, duration, request_metrics):
+    route = route_name(request)
+    method = request.method
+    registry.inc("police_http_requests_total", (("route", route), ("method", method), ("status", str(status_code))))
+    registry.observe("police_http_request_duration_seconds", duration, (("route", route), ("method", method)))
+    registry.observe("police_db_queries_per_request", request_metrics.query_count, (("route", route),))
+    registry.observe("police_db_time_seconds", request_metrics.db_time, (("route", route),))
+
+
+def observe_gateway_call(operation, outcome, duration):
+    registry.observe(
+        "police_payment_gateway_duration_seconds",
+        duration,
+        (("operation", operation), ("outcome", outcome)),
+    )
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def render_exposition(values, histograms):
+    """Render merged samples in the Prometheus text exposition format (version 0.0.4)."""
+
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == HISTOGRAM:
+            samples = sorted((labels, slots) for (sample_name, labels), slots in histograms.items() if sample_name == name)
+            for labels, slots in samples:
+                cumulative = 0
+                for bound, count in zip(list(buckets) + [math.inf], slots[:-1]):
+                    cumulative += count
+                    bucket_labels = labels + (("le", _format_value(bound)),)
+                    lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(slots[-1])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+            continue
+        samples = sorted((labels, value) for (sample_name, labels), value in values.items() if sample_name == name)
+        if not samples and kind == GAUGE:
+            samples = [((), 0)]
+        for labels, value in samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,77 @@
+from django.conf import settings
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+PAGINATION_PARAMETERS = [
+    OpenApiParameter(
+        name="cursor",
+        type=str,
+        required=False,
+        location=OpenApiParameter.QUERY,
+        description="Opaque cursor taken from the `next` or `previous` link of a previous page.",
+    ),
+    OpenApiParameter(
+        name="page_size",
+        type=int,
+        required=False,
+        location=OpenApiParameter.QUERY,
+        description="Number of results per page, capped by the server maximum.",
+    ),
+]
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor pagination with opaque cursors over an indexed ordering.
+
+    Views pick the ordering through a ``pagination_ordering`` attribute or a
+    ``get_pagination_ordering()`` method. While API_LEGACY_LIST_RESPONSES is enabled,
+    requests without ``cursor`` or ``page_size`` still receive the full unpaginated list
+    so existing clients keep working.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    legacy_responses = True
+
+    def __init__(self):
+        self.page_size = settings.API_PAGE_SIZE
+        self.max_page_size = settings.API_MAX_PAGE_SIZE
+
+    @classmethod
+    def is_requested(cls, request):
+        return cls.cursor_query_param in request.query_params or cls.page_size_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.legacy_responses and settings.API_LEGACY_LIST_RESPONSES and not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        if hasattr(view, "get_pagination_ordering"):
+            ordering = view.get_pagination_ordering()
+        else:
+            ordering = getattr(view, "pagination_ordering", self.ordering)
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+
+class StrictKeysetPagination(KeysetPagination):
+    """Keyset pagination that always pages, for endpoints added after the switch that have no legacy clients."""
+
+    legacy_responses = False
+
+
+def paginated_response(request, view, queryset, serialize):
+    """Build the list response for an APIView, paginated when the client asked for pages.
+
+    ``serialize`` turns a list of rows into response data.
+    """
+
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(queryset, request, view=view)
+    if page is None:
+        return Response(serialize(queryset))
+    return paginator.get_paginated_response(serialize(page))
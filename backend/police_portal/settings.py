@@ -37,11 +37,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "police_portal.instrumentation.QueryInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.rbac.middleware.RequestRoleCacheMiddleware",
+    "apps.notifications.middleware.NotificationDispatchMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -77,6 +80,13 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", "police-portal"),
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -101,7 +111,7 @@ AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.RoleClaimsJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -111,6 +121,7 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ),
     "EXCEPTION_HANDLER": "police_portal.api_exceptions.custom_exception_handler",
+    "DEFAULT_PAGINATION_CLASS": "police_portal.pagination.KeysetPagination",
 }
 
 SIMPLE_JWT = {
@@ -128,6 +139,43 @@ SPECTACULAR_SETTINGS = {
 
 CORS_ALLOW_ALL_ORIGINS = True
 
+RBAC_ROLE_CACHE_TIMEOUT = int(os.environ.get("RBAC_ROLE_CACHE_TIMEOUT", "300"))
+# Embed role claims in access tokens; the rbac.E001 check requires a cache backend shared by all workers.
+RBAC_JWT_ROLE_CLAIMS = os.environ.get("RBAC_JWT_ROLE_CLAIMS", "0") == "1"
+
+STATS_CACHE_TIMEOUT = int(os.environ.get("STATS_CACHE_TIMEOUT", "60"))
+# Cached judge-facing case report snapshots and their versions, which are also the report
+# ETags. Edits invalidate them through the cache, so with a per-process cache other
+# workers may serve or revalidate a report up to this many seconds old.
+CASE_REPORT_CACHE_TIMEOUT = int(os.environ.get("CASE_REPORT_CACHE_TIMEOUT", "300"))
+
+API_PAGE_SIZE = int(os.environ.get("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.environ.get("API_MAX_PAGE_SIZE", "200"))
+# Serve unpaginated lists to clients that send neither `cursor` nor `page_size`.
+API_LEGACY_LIST_RESPONSES = os.environ.get("API_LEGACY_LIST_RESPONSES", "1") == "1"
+
+# Per-request query instrumentation: expose counts as X-* headers, and fail requests
+# that exceed their view's query_budget instead of only logging them.
+QUERY_METRICS_HEADERS = os.environ.get("QUERY_METRICS_HEADERS", "1" if DEBUG else "0") == "1"
+QUERY_BUDGET_STRICT = os.environ.get("QUERY_BUDGET_STRICT", "0") == "1"
+
+# Prometheus endpoint at /api/v1/internal/metrics. Scrapers authenticate with
+# `Authorization: Bearer <METRICS_TOKEN>`; system admins can also read it with a JWT.
+# Multi-worker servers set METRICS_MULTIPROC_DIR to a directory shared by the workers.
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_MULTIPROC_DIR = os.environ.get("METRICS_MULTIPROC_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", "5"))
+
+# Hand committed notifications to a background thread instead of writing them before
+# the response is returned.
+NOTIFICATIONS_BACKGROUND_FLUSH = os.environ.get("NOTIFICATIONS_BACKGROUND_FLUSH", "0") == "1"
+# Server-sent notification streams: seconds of silence before a keepalive comment, and
+# how often an idle stream checks the database for notifications written by other processes.
+NOTIFICATION_STREAM_HEARTBEAT = float(os.environ.get("NOTIFICATION_STREAM_HEARTBEAT", "15"))
+NOTIFICATION_STREAM_POLL_INTERVAL = float(os.environ.get("NOTIFICATION_STREAM_POLL_INTERVAL", "30"))
+# Days a read notification stays in the inbox before `purge_notifications` archives it.
+NOTIFICATION_RETENTION_DAYS = int(os.environ.get("NOTIFICATION_RETENTION_DAYS", "90"))
+
 PAYMENT_GATEWAY_PROVIDER = os.environ.get("PAYMENT_GATEWAY_PROVIDER", "zarinpal")
 ZARINPAL_SANDBOX = os.environ.get("ZARINPAL_SANDBOX", "1") == "1"
 ZARINPAL_MERCHANT_ID = os.environ.get("ZARINPAL_MERCHANT_ID", "00000000-0000-0000-0000-000000000000")
@@ -6,4 +6,5 @@ DATABASES["default"]["HOST"] = os.environ.get("POSTGRES_HOST", "localhost")
 DATABASES["default"]["PORT"] = os.environ.get("POSTGRES_PORT", "5433")
 
 PAYMENT_GATEWAY_PROVIDER = "mock"
+QUERY_BUDGET_STRICT = True
 PAYMENT_CALLBACK_BASE_URL = os.environ.get("PAYMENT_CALLBACK_BASE_URL", "http://localhost:8000")
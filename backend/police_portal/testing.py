@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from .instrumentation import get_query_budget, observe_requests
+
+
+@contextmanager
+def assert_max_queries(view, n=None):
+    """Fail unless every request handled by ``view`` inside the block ran at most ``n`` queries.
+
+    ``n`` defaults to the view's declared ``query_budget`` for the request method. The
+    block must send at least one request to the view, so a renamed route cannot make
+    the check pass silently.
+    """
+
+    seen = []
+
+    def observe(view_class, metrics):
+        if view_class is view:
+            seen.append(metrics)
+
+    with observe_requests(observe):
+        yield seen
+    if not seen:
+        raise AssertionError(f"No request reached {view.__name__}")
+    for metrics in seen:
+        limit = get_query_budget(view, metrics.method) if n is None else n
+        if limit is None:
+            raise ValueError(f"{view.__name__} declares no query_budget for {metrics.method}; pass n explicitly")
+        if metrics.query_count > limit:
+            queries = "\n".join(f"{index}. {sql}" for index, sql in enumerate(metrics.queries, start=1))
+            raise AssertionError(
+                f"{view.__name__} ran {metrics.query_count} queries for {metrics.method}, expected at most {limit}:\n{queries}"
+            )
@@ -0,0 +1,71 @@
+from django.db.models import Subquery, prefetch_related_objects
+
+
+class UnionQuery:
+    """A listing read as a UNION ALL of branches that each follow one index in order.
+
+    A single OR over rows from different index ranges cannot follow any index, so every
+    page would sort all matching rows. Here each range is a separate branch. Filters and
+    the stop of a slice are applied to every branch before the merge, so each branch reads
+    at most that many rows in index order and only those few rows are sorted together.
+
+    It supports the part of the QuerySet API that cursor pagination and the views use:
+    ``filter()``, ``order_by()``, ``prefetch_related()``, slicing and iteration. Slicing
+    and iteration return lists; ``as_queryset()`` gives the SQL that runs.
+    """
+
+    def __init__(self, model, branches, ordering=(), prefetch=()):
+        # Pairs of (filtered queryset, annotations added to its rows).
+        self.model = model
+        self._branches = branches
+        self._ordering = ordering
+        self._prefetch = prefetch
+
+    def _clone(self, **changes):
+        state = {
+            "model": self.model,
+            "branches": self._branches,
+            "ordering": self._ordering,
+            "prefetch": self._prefetch,
+        }
+        return UnionQuery(**{**state, **changes})
+
+    def filter(self, *args, **kwargs):
+        branches = [(queryset.filter(*args, **kwargs), annotations) for queryset, annotations in self._branches]
+        return self._clone(branches=branches)
+
+    def order_by(self, *fields):
+        return self._clone(ordering=fields)
+
+    def prefetch_related(self, *lookups):
+        return self._clone(prefetch=self._prefetch + lookups)
+
+    def branch_ids(self, limit):
+        """The ids each branch contributes to a slice ending at ``limit``, one ordered query per branch."""
+
+        return [queryset.order_by(*self._ordering).values("pk")[:limit] for queryset, _ in self._branches]
+
+    def as_queryset(self, limit=None):
+        """The combined query, each branch reading at most ``limit`` rows."""
+
+        if limit is None:
+            branches = [queryset.annotate(**annotations) for queryset, annotations in self._branches]
+        else:
+            # Limited through id subqueries because not every backend accepts LIMIT on the
+            # operands of a compound statement.
+            branches = [
+                self.model.objects.filter(pk__in=Subquery(ids)).annotate(**annotations)
+                for ids, (_, annotations) in zip(self.branch_ids(limit), self._branches)
+            ]
+        combined = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+        return combined.order_by(*self._ordering)
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+        rows = list(self.as_queryset(item.stop)[item])
+        prefetch_related_objects(rows, *self._prefetch)
+        return rows
+
+    def __iter__(self):
+        return iter(self[:])
@@ -3,6 +3,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from .views import MetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -20,6 +21,7 @@ urlpatterns = [
     path("api/v1/", include("apps.rewards.urls")),
     path("api/v1/", include("apps.payments.urls")),
     path("api/v1/", include("apps.stats.urls")),
+    path("api/v1/internal/metrics", MetricsView.as_view(), name="internal-metrics"),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.views import APIView
+from apps.rbac.constants import ROLE_SYSTEM_ADMIN
+from apps.rbac.permissions import RoleRequiredPermission
+from .metrics import CONTENT_TYPE, registry, render_exposition
+
+
+def has_scrape_token(request):
+    token = settings.METRICS_TOKEN
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    return bool(token) and constant_time_compare(header, f"Bearer {token}")
+
+
+class MetricsPermission(RoleRequiredPermission):
+    def has_permission(self, request, view):
+        return has_scrape_token(request) or super().has_permission(request, view)
+
+
+class MetricsView(APIView):
+    permission_classes = [MetricsPermission]
+    required_roles = [ROLE_SYSTEM_ADMIN]
+
+    def perform_authentication(self, request):
+        # The scrape token is not a JWT, so it must not reach the JWT authenticator.
+        if not has_scrape_token(request):
+            super().perform_authentication(request)
+
+    @extend_schema(request=None, responses={200: OpenApiTypes.STR})
+    def get(self, request):
+        """Expose request latency, status, in-flight, database and payment gateway metrics in Prometheus text format.
+
+        Scrapers send `Authorization: Bearer <METRICS_TOKEN>`. With METRICS_MULTIPROC_DIR set the
+        totals of every worker process are merged.
+        """
+
+        values, histograms = registry.aggregate()
+        return HttpResponse(render_exposition(values, histograms), content_type=CONTENT_TYPE)
@@ -35,6 +35,12 @@ export type User = {
   roles?: RoleSlug[];
 };
 
+export type CursorPage<T> = {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+};
+
 export type AuthTokens = {
   access: string;
   refresh: string;
@@ -1,5 +1,5 @@
 import { useState } from "react";
-import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
+import { useInfiniteQuery, useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import { Button } from "../components/ui/Button";
 import { Card } from "../components/ui/Card";
 import { EmptyState } from "../components/ui/EmptyState";
@@ -22,10 +22,13 @@ export function AdminPanelPage() {
     queryFn: listRoles,
   });
 
-  const usersQuery = useQuery({
+  const usersQuery = useInfiniteQuery({
     queryKey: ["users", appliedFilters],
-    queryFn: () => listUsers(appliedFilters),
+    queryFn: ({ pageParam }) => listUsers(appliedFilters, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next,
   });
+  const users = usersQuery.data?.pages.flatMap((page) => page.results);
 
   const createRoleMutation = useMutation({
     mutationFn: createRole,
@@ -205,9 +208,9 @@ export function AdminPanelPage() {
           <div className="divider" />
           <h3>User Directory</h3>
           {usersQuery.isLoading && <Skeleton style={{ height: "4rem" }} />}
-          {usersQuery.data?.length === 0 && <EmptyState title="No Users" description="No users matched current filters." />}
+          {users?.length === 0 && <EmptyState title="No Users" description="No users matched current filters." />}
           <div className="stack-list">
-            {usersQuery.data?.map((user) => (
+            {users?.map((user) => (
               <div key={user.id} className="queue-item">
                 <div>
                   <strong>
@@ -228,6 +231,11 @@ export function AdminPanelPage() {
               </div>
             ))}
           </div>
+          {usersQuery.hasNextPage && (
+            <Button variant="secondary" onClick={() => usersQuery.fetchNextPage()} disabled={usersQuery.isFetchingNextPage}>
+              {usersQuery.isFetchingNextPage ? "Loading..." : "Load More"}
+            </Button>
+          )}
         </Card>
       </div>
     </section>
@@ -1,5 +1,7 @@
 import { apiClient } from "../api/client";
-import type { Role, User } from "../api/types";
+import type { CursorPage, Role, User } from "../api/types";
+
+const USER_PAGE_SIZE = 100;
 
 export async function listRoles() {
   const { data } = await apiClient.get<Role[]>("/rbac/roles/");
@@ -20,7 +22,12 @@ export async function deleteRole(roleId: number) {
   await apiClient.delete(`/rbac/roles/${roleId}/`);
 }
 
-export async function listUsers(query: { username?: string; national_id?: string; role?: string }) {
+export async function listUsers(query: { username?: string; national_id?: string; role?: string }, cursorUrl?: string | null) {
+  // Filters are applied by the server; later pages come from the `next` link of the previous one.
+  if (cursorUrl) {
+    const { data } = await apiClient.get<CursorPage<User>>(cursorUrl);
+    return data;
+  }
   const params = new URLSearchParams();
   if (query.username) {
     params.set("username", query.username);
@@ -31,8 +38,8 @@ export async function listUsers(query: { username?: string; national_id?: string
   if (query.role) {
     params.set("role", query.role);
   }
-  const queryString = params.toString();
-  const { data } = await apiClient.get<User[]>(`/users/${queryString ? `?${queryString}` : ""}`);
+  params.set("page_size", String(USER_PAGE_SIZE));
+  const { data } = await apiClient.get<CursorPage<User>>(`/users/?${params.toString()}`);
   return data;
 }
 
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Drive the main API flows against a running backend with concurrent workers and report
+latency percentiles and throughput per endpoint.
+
+Seed the database first so every role has users to log in as:
+
+    python manage.py seed_load --users 50000 --cases 200000 --prefix load
+    python tools/load_test.py --base-url http://localhost:8000 --prefix load --workers 16 --duration 60
+
+Workers are spread over the citizen, cadet, officer, detective, sergeant and captain flows
+(mirroring apps/cases/tests/test_flows.py). SQLite serializes writers, so pass
+--read-only there to measure the read paths without lock contention.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+PASSWORD = "Pass1234!"
+PAGE = {"page_size": 20}
+
+
+class Client:
+    def __init__(self, base_url: str, timeout: float, samples: list):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.samples = samples
+        self.session = requests.Session()
+
+    def call(self, method: str, template: str, params=None, json=None, **path):
+        url = f"{self.base_url}/api/v1{template.format(**path)}"
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, params=params, json=json, timeout=self.timeout)
+            status = response.status_code
+        except requests.RequestException:
+            response, status = None, 0
+        self.samples.append((f"{method} {template}", time.perf_counter() - started, status))
+        if response is None or status >= 400:
+            return None
+        return response.json() if response.content else {}
+
+    def login(self, username: str, password: str) -> dict | None:
+        data = self.call("POST", "/auth/login/", json={"identifier": username, "password": password})
+        if data:
+            self.session.headers["Authorization"] = f"Bearer {data['tokens']['access']}"
+            return data["user"]
+        return None
+
+
+def _results(data):
+    if data is None:
+        return []
+    return data["results"] if isinstance(data, dict) else data
+
+
+def _notified_case_ids(client: Client) -> list:
+    # seed_load notifies assigned detectives and case creators, who can open those cases.
+    notifications = _results(client.call("GET", "/notifications/", params=PAGE))
+    return [notification["case"] for notification in notifications if notification["case"]]
+
+
+def citizen_flow(client: Client, rng: random.Random, context: dict, read_only: bool):
+    client.call("GET", "/notifications/", params=PAGE)
+    client.call("GET", "/public/most-wanted/", params=PAGE)
+    client.call("GET", "/stats/overview/")
+    if not read_only:
+        client.call(
+            "POST",
+            "/cases/complaints/",
+            json={"title": "Load complaint", "description": "Generated", "crime_level": rng.randint(1, 4), "location": "Loc"},
+        )
+        client.call("POST", "/tips/", json={"content": "Generated tip"})
+
+
+def cadet_flow(client: Client, rng: random.Random, context: dict, read_only: bool):
+    queue = _results(client.call("GET", "/cases/complaints/queue/", params=PAGE))
+    pending = [complaint for complaint in queue if complaint["status"] == "pending_cadet"]
+    if pending and context["officer_ids"] and not read_only:
+        client.call(
+            "POST",
+            "/cases/complaints/{id}/cadet-review/",
+            json={"action": "approve", "officer_id": rng.choice(context["officer_ids"])},
+            id=rng.choice(pending)["id"],
+        )
+
+
+def officer_flow(client: Client, rng: random.Random, context: dict, read_only: bool):
+    client.call("GET", "/cases/complaints/queue/", params=PAGE)
+    client.call("GET", "/cases/", params=PAGE)
+    tips = _results(client.call("GET", "/tips/review-queue/", params=PAGE))
+    if tips and not read_only:
+        client.call("POST", "/tips/{id}/officer-review/", json={"approve": True}, id=rng.choice(tips)["id"])
+
+
+def detective_flow(client: Client, rng: random.Random, context: dict, read_only: bool):
+    client.call("GET", "/cases/", params=PAGE)
+    case_ids = _notified_case_ids(client)
+    if case_ids:
+        case_id = rng.choice(case_ids)
+        client.call("GET", "/cases/{case_id}/", case_id=case_id)
+        client.call("GET", "/cases/{case_id}/evidence/", params=PAGE, case_id=case_id)
+        client.call("GET", "/cases/{case_id}/board/", case_id=case_id)
+        if not read_only:
+            client.call(
+                "POST",
+                "/cases/{case_id}/evidence/",
+                json={"evidence_type": "other", "title": "Load evidence", "description": "Generated"},
+                case_id=case_id,
+            )
+
+
+def sergeant_flow(client: Client, rng: random.Random, context: dict, read_only: bool):
+    cases = _results(client.call("GET", "/cases/", params=PAGE))
+    client.call("GET", "/suspects/most-wanted/", params=PAGE)
+    if cases:
+        client.call("GET", "/cases/{case_id}/assignments/", params=PAGE, case_id=rng.choice(cases)["id"])
+
+
+def captain_flow(client: Client, rng: random.Random, context: dict, read_only: bool):
+    client.call("GET", "/cases/", params=PAGE)
+    case_ids = _notified_case_ids(client)
+    if case_ids:
+        client.call("GET", "/cases/{case_id}/report/", case_id=rng.choice(case_ids))
+
+
+PERSONAS = [
+    ("base-user", citizen_flow),
+    ("cadet", cadet_flow),
+    ("police-officer", officer_flow),
+    ("detective", detective_flow),
+    ("sergeant", sergeant_flow),
+    ("captain", captain_flow),
+]
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def run_worker(index: int, args, context: dict, deadline: float, samples: list):
+    role, flow = PERSONAS[index % len(PERSONAS)]
+    rng = random.Random(args.seed + index)
+    client = Client(args.base_url, args.timeout, samples)
+    # Spread workers over the seeded users of each role, falling back to the first one.
+    number = index // len(PERSONAS)
+    if client.login(f"{args.prefix}_{role}_{number}", args.password) is None:
+        if client.login(f"{args.prefix}_{role}_0", args.password) is None:
+            return
+    iterations = 0
+    while time.perf_counter() < deadline and (not args.iterations or iterations < args.iterations):
+        flow(client, rng, context, args.read_only)
+        iterations += 1
+
+
+def discover_officers(args) -> list:
+    client = Client(args.base_url, args.timeout, [])
+    officers = []
+    for number in range(5):
+        user = client.login(f"{args.prefix}_police-officer_{number}", args.password)
+        if user:
+            officers.append(user["id"])
+    return officers
+
+
+def report(samples: list, elapsed: float):
+    by_endpoint = defaultdict(list)
+    errors = defaultdict(int)
+    for endpoint, latency, status in samples:
+        by_endpoint[endpoint].append(latency * 1000)
+        if status == 0 or status >= 400:
+            errors[endpoint] += 1
+    header = f"{'endpoint':<48} {'count':>7} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    print(header)
+    print("-" * len(header))
+    for endpoint in sorted(by_endpoint):
+        latencies = sorted(by_endpoint[endpoint])
+        print(
+            f"{endpoint:<48} {len(latencies):>7} {errors[endpoint]:>7} {len(latencies) / elapsed:>8.1f} "
+            f"{percentile(latencies, 50):>8.1f} {percentile(latencies, 95):>8.1f} "
+            f"{percentile(latencies, 99):>8.1f} {latencies[-1]:>8.1f}"
+        )
+    total = sorted(latency * 1000 for _, latency, _ in samples)
+    if total:
+        print("-" * len(header))
+        print(
+            f"{'all':<48} {len(total):>7} {sum(errors.values()):>7} {len(total) / elapsed:>8.1f} "
+            f"{percentile(total, 50):>8.1f} {percentile(total, 95):>8.1f} {percentile(total, 99):>8.1f} {total[-1]:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--prefix", default="load", help="Username prefix passed to seed_load")
+    parser.add_argument("--password", default=PASSWORD)
+    parser.add_argument("--workers", type=int, default=12)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    parser.add_argument("--iterations", type=int, default=0, help="Stop each worker after this many flows (0: no limit)")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--read-only", action="store_true", help="Skip the flows' write requests")
+    args = parser.parse_args()
+
+    context = {"officer_ids": discover_officers(args)}
+    worker_samples = [[] for _ in range(args.workers)]
+    started = time.perf_counter()
+    deadline = started + args.duration
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(run_worker, index, args, context, deadline, worker_samples[index])
+            for index in range(args.workers)
+        ]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - started
+    report([sample for samples in worker_samples for sample in samples], elapsed)
+
+
+if __name__ == "__main__":
+    main()